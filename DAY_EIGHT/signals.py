@@ -0,0 +1,28 @@
+
+
+def parse_line(signal_pattern: str) -> (str, str):
+    (unique_signal_patterns, four_digit_output_value) = signal_pattern.split(" | ")
+    return unique_signal_patterns, four_digit_output_value
+
+
+def as_lengths(entry: tuple[str, str]) -> tuple[list[int], list[int]]:
+    return (
+        [len(s) for s in entry[0].split(" ")],
+        [len(s) for s in entry[1].split(" ")],
+    )
+
+
+def count_ones(signal_pattern_lengths: tuple[list[int], list[int]]) -> int:
+    return sum(1 for length in signal_pattern_lengths[1] if length == 2)
+
+
+def count_fours(signal_pattern_lengths: tuple[list[int], list[int]]) -> int:
+    return sum(1 for length in signal_pattern_lengths[1] if length == 4)
+
+
+def count_sevens(signal_pattern_lengths: tuple[list[int], list[int]]) -> int:
+    return sum(1 for length in signal_pattern_lengths[1] if length == 3)
+
+
+def count_eights(signal_pattern_lengths: tuple[list[int], list[int]]) -> int:
+    return sum(1 for length in signal_pattern_lengths[1] if length == 7)
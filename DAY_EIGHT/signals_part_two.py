@@ -0,0 +1,49 @@
+
+
+def gather(signal_values: str):
+    (unique_signal_patterns, four_digit_output_value) = signal_values.split(" | ")
+    segments: list[str] = [
+        "".join(sorted(s.strip())) for s in signal_values.split(" ") if s != "|"
+    ]
+    gathered = {
+        "unique_signal_patterns": unique_signal_patterns,
+        "four_digit_output_value": four_digit_output_value,
+        "segments": {},
+    }
+    for segment in segments:
+        if segment not in gathered["segments"]:
+            match len(segment):
+                case 2:
+                    value = "1"
+                case 4:
+                    value = "4"
+                case 3:
+                    value = "7"
+                case 7:
+                    value = "8"
+                case _:
+                    value = "??"
+
+            gathered["segments"][segment] = value
+
+    return gathered
+
+
+def draw(signal_wires: str):
+    a = "a" if "a" in signal_wires else "."
+    b = "b" if "b" in signal_wires else "."
+    c = "c" if "c" in signal_wires else "."
+    d = "d" if "d" in signal_wires else "."
+    e = "e" if "e" in signal_wires else "."
+    f = "f" if "f" in signal_wires else "."
+    g = "g" if "g" in signal_wires else "."
+
+    return f"""
+    {a}{a}{a}{a}
+   {b}    {c}
+   {b}    {c}
+    {d}{d}{d}{d}
+   {e}    {f}
+   {e}    {f}
+    {g}{g}{g}{g}
+"""
@@ -1,6 +1,16 @@
 from pathlib import Path
 from unittest import TestCase
 
+from DAY_EIGHT.signals import (
+    as_lengths,
+    count_eights,
+    count_fours,
+    count_ones,
+    count_sevens,
+    parse_line,
+)
+from lib.puzzle_input import read_lines
+
 example_input = """be cfbegad cbdgef fgaecd cgeb fdcge agebfd fecdb fabcd edb | fdgacbe cefdb cefbgd gcbe
 edbfga begcd cbg gc gcadebf fbgde acbgfd abcde gfcbed gfec | fcgedb cgb dgebacf gc
 fgaebd cg bdaec gdafb agbcfd gdcbef bgcad gfac gcb cdgabef | cg cg fdcagb cbg
@@ -13,34 +23,6 @@ egadfb cdbfeg cegd fecab cgb gbdefca cg fgcdab egfdb bfceg | gbdfcae bgc cg cgb
 gcafb gcf dcaebfg ecagb gf abcdeg gaef cafbge fdbac fegbdc | fgae cfgab fg bagce"""
 
 
-def parse_line(signal_pattern: str) -> (str, str):
-    (unique_signal_patterns, four_digit_output_value) = signal_pattern.split(" | ")
-    return unique_signal_patterns, four_digit_output_value
-
-
-def as_lengths(entry: tuple[str, str]) -> tuple[list[int], list[int]]:
-    return (
-        [len(s) for s in entry[0].split(" ")],
-        [len(s) for s in entry[1].split(" ")],
-    )
-
-
-def count_ones(signal_pattern_lengths: tuple[list[int], list[int]]) -> int:
-    return sum(1 for length in signal_pattern_lengths[1] if length == 2)
-
-
-def count_fours(signal_pattern_lengths: tuple[list[int], list[int]]) -> int:
-    return sum(1 for length in signal_pattern_lengths[1] if length == 4)
-
-
-def count_sevens(signal_pattern_lengths: tuple[list[int], list[int]]) -> int:
-    return sum(1 for length in signal_pattern_lengths[1] if length == 3)
-
-
-def count_eights(signal_pattern_lengths: tuple[list[int], list[int]]) -> int:
-    return sum(1 for length in signal_pattern_lengths[1] if length == 7)
-
-
 class TestSignals(TestCase):
     def test_letters_to_lengths(self):
         assert as_lengths(
@@ -90,14 +72,16 @@ class TestSignals(TestCase):
 
     def test_can_find_numbers_with_unique_signals_in_puzzle_input(self):
         puzzle_input_path = Path(__file__).parent / "./puzzle.input"
-        with open(puzzle_input_path, "r", newline="\n") as f:
-            lines = [as_lengths(parse_line(line.strip())) for line in f.readlines()]
-            total = 0
+        lines = [
+            as_lengths(parse_line(line.strip()))
+            for line in read_lines(puzzle_input_path)
+        ]
+        total = 0
 
-            for line in lines:
-                total += count_ones(line)
-                total += count_fours(line)
-                total += count_sevens(line)
-                total += count_eights(line)
+        for line in lines:
+            total += count_ones(line)
+            total += count_fours(line)
+            total += count_sevens(line)
+            total += count_eights(line)
 
-            assert total == 476
+        assert total == 476
@@ -0,0 +1,108 @@
+import random
+
+from lib import automaton, backends
+from lib.coordinates import Point
+from lib.grid import neighbour_table
+
+Coordinate = Point
+
+
+class Cavern:
+    """
+    the energy of every octopus held in one flat list indexed by the packed
+    cell `y * width + x`, so the flash cascade moves between ints rather than
+    hashing coordinate objects
+    """
+
+    def __init__(self, grid: str):
+        self.current_step = 0
+        self.synchronised_at = -1
+        self.grid = grid
+        self.flashes = 0
+        rows = grid.splitlines()
+        self.width = len(rows[0])
+        self.height = len(rows)
+        self.energy = [int(r) for row in rows for r in row]
+        self.neighbours = neighbour_table(self.width, self.height, diagonals=True)
+
+    def __getitem__(self, coord: Coordinate) -> int:
+        return self.energy[coord.y * self.width + coord.x]
+
+    def __setitem__(self, coord: Coordinate, value: int) -> None:
+        self.energy[coord.y * self.width + coord.x] = value
+
+    def step(self):
+        self.current_step += 1
+        energy = self.energy
+        offsets = self.neighbours.offsets
+        indices = self.neighbours.indices
+
+        for cell in range(len(energy)):
+            energy[cell] += 1
+
+        has_flashed = [cell for cell, level in enumerate(energy) if level > 9]
+        flashed = set(has_flashed)
+        while has_flashed:
+            flasher = has_flashed.pop()
+            for n in indices[offsets[flasher] : offsets[flasher + 1]]:
+                energy[n] += 1
+                if energy[n] > 9 and n not in flashed:
+                    flashed.add(n)
+                    has_flashed.append(n)
+
+        self.flashes += len(flashed)
+
+        if len(flashed) == len(energy):
+            self.synchronised_at = self.current_step
+
+        for cell in flashed:
+            energy[cell] = 0
+
+    @property
+    def positions(self) -> list[list[int]]:
+        return [
+            self.energy[y * self.width : (y + 1) * self.width]
+            for y in range(self.height)
+        ]
+
+    def __str__(self) -> str:
+        grid = ""
+        for row in self.positions:
+            grid += "".join([str(r) for r in row]) + "\n"
+        return grid
+
+
+def step_energy(energy: "automaton.np.ndarray") -> int:
+    """
+    one step for a whole grid of octopus energy levels, of any size, updating it
+    in place and returning how many flashed
+    """
+    automaton.increment(energy)
+    flashed = automaton.cascade(energy, threshold=9, diagonals=True)
+    energy[flashed] = 0
+    return int(flashed.sum())
+
+
+def flashes_after(rows: list[str], steps: int) -> tuple[int, list[str]]:
+    """how many flashes steps steps make, and the energy levels they leave"""
+    cavern = Cavern("\n".join(rows))
+    for _ in range(steps):
+        cavern.step()
+    return cavern.flashes, str(cavern).splitlines()
+
+
+def _random_cavern(rng: random.Random, size: int) -> tuple[list[str], int]:
+    from lib import generators
+
+    width, height = rng.randint(1, size + 1), rng.randint(1, size + 1)
+    return list(generators.digit_grid(width, height, rng)), rng.randint(0, 20)
+
+
+flashes = backends.operation("DAY_ELEVEN.flashes_after", flashes_after, _random_cavern)
+
+
+@flashes.implementation("numpy", min_size=10_000, requires="numpy")
+def _flashes_after_numpy(rows: list[str], steps: int) -> tuple[int, list[str]]:
+    energy = automaton.as_array("\n".join(rows))
+    total = sum(step_energy(energy) for _ in range(steps))
+    return total, ["".join(str(level) for level in row) for row in energy.tolist()]
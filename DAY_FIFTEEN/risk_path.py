@@ -0,0 +1,175 @@
+import random
+from array import array
+
+from lib import backends, budget
+from lib.grid import Grid, neighbour_table
+
+
+class Graph:
+    """from https://www.pythonpool.com/a-star-algorithm-python/"""
+
+    def __init__(self, adjac_lis, heuristic):
+        self.heuristic = heuristic
+        self.adjac_lis = adjac_lis
+
+    def get_neighbors(self, v):
+        return self.adjac_lis[v]
+
+    # This is heuristic function which is having equal values for all nodes
+    def h(self, n: tuple[int, int]):
+        return self.heuristic[n]
+
+    def a_star_algorithm(
+        self, start: tuple[int, int], stop: tuple[int, int]
+    ) -> list[tuple[int, int]]:
+        # In this open_lst is a lisy of nodes which have been visited, but who's
+        # neighbours haven't all been always inspected, It starts off with the start
+        # node
+        # And closed_lst is a list of nodes which have been visited
+        # and who's neighbors have been always inspected
+        open_lst = {start}
+        closed_lst = set([])
+
+        # poo has present distances from start to all other nodes
+        # the default value is +infinity
+        poo = {start: 0}
+
+        # par contains an adjac mapping of all nodes
+        par = {}
+        par[start] = start
+
+        while len(open_lst) > 0:
+            # each pass scans the whole open list, so that is the work counted
+            budget.checkpoint("open nodes scanned", len(open_lst))
+            n = None
+
+            # it will find a node with the lowest value of f() -
+            for v in open_lst:
+                if n is None or poo[v] + self.h(v) < poo[n] + self.h(n):
+                    n = v
+
+            if n is None:
+                print("Path does not exist!")
+                return None
+
+            # if the current node is the stop
+            # then we start again from start
+            if n == stop:
+                reconst_path = []
+
+                while par[n] != n:
+                    reconst_path.append(n)
+                    n = par[n]
+
+                reconst_path.append(start)
+
+                reconst_path.reverse()
+
+                print("Path found: {}".format(reconst_path))
+                return reconst_path
+
+            # for all the neighbors of the current node do
+            for m, weight in self.get_neighbors(n):
+                # if the current node is not presentin both open_lst and closed_lst
+                # add it to open_lst and note n as it's par
+                if m not in open_lst and m not in closed_lst:
+                    open_lst.add(m)
+                    par[m] = n
+                    poo[m] = poo[n] + weight
+
+                # otherwise, check if it's quicker to first visit n, then m
+                # and if it is, update par data and poo data
+                # and if the node was in the closed_lst, move it to open_lst
+                else:
+                    if poo[m] > poo[n] + weight:
+                        poo[m] = poo[n] + weight
+                        par[m] = n
+
+                        if m in closed_lst:
+                            closed_lst.remove(m)
+                            open_lst.add(m)
+
+            # remove n from the open_lst, and add it to closed_lst
+            # because all of his neighbors were inspected
+            open_lst.remove(n)
+            closed_lst.add(n)
+
+        print("Path does not exist!")
+        return None
+
+
+def as_adjacency_list(
+    grid: Grid, max_y, max_x
+) -> dict[tuple[int, int], list[tuple[tuple[int], int]]]:
+    al = {}
+    cells = grid.cells
+    table = neighbour_table(max_x + 1, max_y + 1)
+    offsets, indices = table.offsets, table.indices
+    coordinates = [grid.coordinate(i) for i in range(len(cells))]
+    width = grid.width
+    # a row at a time, so a budget can stop the build of a big grid part way
+    for start in range(0, len(cells), width):
+        budget.checkpoint("cells linked", width)
+        for index in range(start, start + width):
+            al[coordinates[index]] = [
+                (coordinates[indices[k]], cells[indices[k]])
+                for k in range(offsets[index], offsets[index + 1])
+            ]
+    return al
+
+
+# wrapping_increments[i] adds i to every risk level, wrapping 9 back round to 1
+wrapping_increments = [
+    bytes.maketrans(
+        bytes(range(1, 10)), bytes((risk + i - 1) % 9 + 1 for risk in range(1, 10))
+    )
+    for i in range(5)
+]
+
+
+def make_five_wide(grid: Grid) -> Grid:
+    cells = array("B")
+    for row in grid:
+        budget.checkpoint("rows expanded")
+        row_bytes = row.tobytes()
+        for i in range(5):
+            cells.frombytes(row_bytes.translate(wrapping_increments[i]))
+
+    return Grid(grid.width * 5, grid.height, cells)
+
+
+def make_five_tall(grid: Grid) -> Grid:
+    cells = array("B")
+    grid_bytes = grid.cells.tobytes()
+    for i in range(5):
+        budget.checkpoint("rows expanded", grid.height)
+        cells.frombytes(grid_bytes.translate(wrapping_increments[i]))
+
+    return Grid(grid.width, grid.height * 5, cells)
+
+
+def lowest_total_risk(grid: Grid) -> int:
+    """the total risk of the least risky path from the top left to bottom right"""
+    max_x, max_y = (grid.width - 1, grid.height - 1)
+    adjacency_list = as_adjacency_list(grid, max_y, max_x)
+    heuristic = {k: grid.cells[grid.index(*k)] for k in adjacency_list.keys()}
+    graph = Graph(adjacency_list, heuristic)
+    path = graph.a_star_algorithm((0, 0), (max_x, max_y))
+    return sum(grid.cells[grid.index(*c)] for c in path[1:])
+
+
+def _lowest_total_risk_of_rows(rows: list[str]) -> int:
+    return lowest_total_risk(Grid.parse("\n".join(rows)))
+
+
+def _random_risk_levels(rng: random.Random, size: int) -> tuple[list[str]]:
+    from lib import generators
+
+    width, height = rng.randint(1, size + 1), rng.randint(1, size + 1)
+    return (list(generators.digit_grid(width, height, rng)),)
+
+
+# only the reference so far, registered so a faster search is checked against it
+path_risk = backends.operation(
+    "DAY_FIFTEEN.lowest_total_risk", _lowest_total_risk_of_rows, _random_risk_levels
+)
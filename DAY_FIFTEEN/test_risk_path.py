@@ -1,7 +1,14 @@
 from pathlib import Path
 from unittest import TestCase
 
-from lib.grid import as_grid, find_neighbours
+from DAY_FIFTEEN.risk_path import (
+    Graph,
+    as_adjacency_list,
+    make_five_tall,
+    make_five_wide,
+)
+from lib.grid import Grid, as_grid
+from lib.puzzle_input import PuzzleInput
 
 example_input = """1163751742
 1381373672
@@ -15,139 +22,6 @@ example_input = """1163751742
 2311944581"""
 
 
-class Graph:
-    """from https://www.pythonpool.com/a-star-algorithm-python/"""
-
-    def __init__(self, adjac_lis, heuristic):
-        self.heuristic = heuristic
-        self.adjac_lis = adjac_lis
-
-    def get_neighbors(self, v):
-        return self.adjac_lis[v]
-
-    # This is heuristic function which is having equal values for all nodes
-    def h(self, n: tuple[int, int]):
-        return self.heuristic[n]
-
-    def a_star_algorithm(
-        self, start: tuple[int, int], stop: tuple[int, int]
-    ) -> list[tuple[int, int]]:
-        # In this open_lst is a lisy of nodes which have been visited, but who's
-        # neighbours haven't all been always inspected, It starts off with the start
-        # node
-        # And closed_lst is a list of nodes which have been visited
-        # and who's neighbors have been always inspected
-        open_lst = {start}
-        closed_lst = set([])
-
-        # poo has present distances from start to all other nodes
-        # the default value is +infinity
-        poo = {start: 0}
-
-        # par contains an adjac mapping of all nodes
-        par = {}
-        par[start] = start
-
-        while len(open_lst) > 0:
-            n = None
-
-            # it will find a node with the lowest value of f() -
-            for v in open_lst:
-                if n is None or poo[v] + self.h(v) < poo[n] + self.h(n):
-                    n = v
-
-            if n is None:
-                print("Path does not exist!")
-                return None
-
-            # if the current node is the stop
-            # then we start again from start
-            if n == stop:
-                reconst_path = []
-
-                while par[n] != n:
-                    reconst_path.append(n)
-                    n = par[n]
-
-                reconst_path.append(start)
-
-                reconst_path.reverse()
-
-                print("Path found: {}".format(reconst_path))
-                return reconst_path
-
-            # for all the neighbors of the current node do
-            for (m, weight) in self.get_neighbors(n):
-                # if the current node is not presentin both open_lst and closed_lst
-                # add it to open_lst and note n as it's par
-                if m not in open_lst and m not in closed_lst:
-                    open_lst.add(m)
-                    par[m] = n
-                    poo[m] = poo[n] + weight
-
-                # otherwise, check if it's quicker to first visit n, then m
-                # and if it is, update par data and poo data
-                # and if the node was in the closed_lst, move it to open_lst
-                else:
-                    if poo[m] > poo[n] + weight:
-                        poo[m] = poo[n] + weight
-                        par[m] = n
-
-                        if m in closed_lst:
-                            closed_lst.remove(m)
-                            open_lst.add(m)
-
-            # remove n from the open_lst, and add it to closed_lst
-            # because all of his neighbors were inspected
-            open_lst.remove(n)
-            closed_lst.add(n)
-
-        print("Path does not exist!")
-        return None
-
-
-def as_adjacency_list(
-    grid: list[list[int]], max_y, max_x
-) -> dict[tuple[int, int], list[tuple[tuple[int], int]]]:
-    al = {}
-    for y, row in enumerate(grid):
-        for x, cell in enumerate(row):
-            if (x, y) not in al:
-                al[(x, y)] = []
-            for n in find_neighbours((x, y), max_y, max_x):
-                al[(x, y)].append((n, grid[n[1]][n[0]]))
-    return al
-
-
-def make_five_wide(grid: list[list[int]]) -> list[list[int]]:
-    new_grid = []
-    for row in grid:
-        new_grid.append([])
-        for i in range(5):
-            for cell in row:
-                new_value = cell + i
-                if new_value > 9:
-                    new_value -= 9
-                new_grid[-1].append(new_value)
-
-    return new_grid
-
-
-def make_five_tall(grid: list[list[int]]) -> list[list[int]]:
-    new_grid = []
-    for i in range(5):
-        for row in grid:
-            new_grid.append([])
-            for cell in row:
-                new_value = cell + i
-                if new_value > 9:
-                    new_value -= 9
-
-                new_grid[-1].append(new_value)
-
-    return new_grid
-
-
 class TestRiskPath(TestCase):
     def test_something(self):
         grid = as_grid(example_input)
@@ -186,22 +60,22 @@ class TestRiskPath(TestCase):
 
     def test_puzzle_input_part_1(self):
         puzzle_input_path = Path(__file__).parent / "./puzzle.input"
-        with open(puzzle_input_path, "r", newline="\n") as f:
-            grid = as_grid(f.read())
-            max_x = len(grid[0]) - 1
-            max_y = len(grid) - 1
-            adjacency_list = as_adjacency_list(grid, max_y, max_x)
-            heuristic = {k: grid[k[1]][k[0]] for k in adjacency_list.keys()}
-            g = Graph(adjacency_list, heuristic)
-            path = g.a_star_algorithm((0, 0), (max_x, max_y))
-            scores = [grid[c[1]][c[0]] for c in path]
+        with PuzzleInput(puzzle_input_path) as puzzle_input:
+            grid = Grid.from_rows(puzzle_input.lines())
+        max_x = len(grid[0]) - 1
+        max_y = len(grid) - 1
+        adjacency_list = as_adjacency_list(grid, max_y, max_x)
+        heuristic = {k: grid[k[1]][k[0]] for k in adjacency_list.keys()}
+        g = Graph(adjacency_list, heuristic)
+        path = g.a_star_algorithm((0, 0), (max_x, max_y))
+        scores = [grid[c[1]][c[0]] for c in path]
 
-            assert sum(scores) - grid[0][0] == 673
+        assert sum(scores) - grid[0][0] == 673
 
     def test_part_two_grid(self):
         grid = as_grid(example_input)
         grid = make_five_wide(grid)
-        assert grid[0] == [
+        assert grid[0].tolist() == [
             1,
             1,
             6,
@@ -284,16 +158,16 @@ class TestRiskPath(TestCase):
 
     def test_puzzle_input_part_two_grid(self):
         puzzle_input_path = Path(__file__).parent / "./puzzle.input"
-        with open(puzzle_input_path, "r", newline="\n") as f:
-            grid = as_grid(f.read())
-            grid = make_five_wide(grid)
-            grid = make_five_tall(grid)
-            max_x = len(grid[0]) - 1
-            max_y = len(grid) - 1
-            adjacency_list = as_adjacency_list(grid, max_y, max_x)
-            heuristic = {k: grid[k[1]][k[0]] for k in adjacency_list.keys()}
-            g = Graph(adjacency_list, heuristic)
-            path = g.a_star_algorithm((0, 0), (max_x, max_y))
-            scores = [grid[c[1]][c[0]] for c in path]
+        with PuzzleInput(puzzle_input_path) as puzzle_input:
+            grid = Grid.from_rows(puzzle_input.lines())
+        grid = make_five_wide(grid)
+        grid = make_five_tall(grid)
+        max_x = len(grid[0]) - 1
+        max_y = len(grid) - 1
+        adjacency_list = as_adjacency_list(grid, max_y, max_x)
+        heuristic = {k: grid[k[1]][k[0]] for k in adjacency_list.keys()}
+        g = Graph(adjacency_list, heuristic)
+        path = g.a_star_algorithm((0, 0), (max_x, max_y))
+        scores = [grid[c[1]][c[0]] for c in path]
 
-            assert sum(scores) - grid[0][0] == 2893
+        assert sum(scores) - grid[0][0] == 2893
@@ -0,0 +1,253 @@
+import random
+from enum import Enum, auto
+from typing import Hashable, Iterable, Optional, Sequence
+
+from lib import backends, coordinates
+from lib.coordinates import Point
+
+
+class Ordinal(Enum):
+    NORTH = auto()
+    NORTH_EAST = auto()
+    EAST = auto()
+    SOUTH_EAST = auto()
+    SOUTH = auto()
+    SOUTH_WEST = auto()
+    WEST = auto()
+    NORTH_WEST = auto()
+
+    def is_diagonal(self):
+        return (
+            self == Ordinal.NORTH_EAST
+            or self == Ordinal.SOUTH_EAST
+            or self == Ordinal.SOUTH_WEST
+            or self == Ordinal.NORTH_WEST
+        )
+
+
+class Coordinate(Point):
+    __slots__ = ()
+
+    def move(self, direction: Ordinal, allow_diagonals: bool = False) -> "Coordinate":
+        match direction:
+            case Ordinal.NORTH:
+                return Coordinate(self.x, self.y - 1)
+            case Ordinal.NORTH_EAST:
+                return Coordinate(self.x + 1, self.y - 1) if allow_diagonals else None
+            case Ordinal.EAST:
+                return Coordinate(self.x + 1, self.y)
+            case Ordinal.SOUTH_EAST:
+                return Coordinate(self.x + 1, self.y + 1) if allow_diagonals else None
+            case Ordinal.SOUTH:
+                return Coordinate(self.x, self.y + 1)
+            case Ordinal.SOUTH_WEST:
+                return Coordinate(self.x - 1, self.y + 1) if allow_diagonals else None
+            case Ordinal.WEST:
+                return Coordinate(self.x - 1, self.y)
+            case Ordinal.NORTH_WEST:
+                return Coordinate(self.x - 1, self.y - 1) if allow_diagonals else None
+
+    @staticmethod
+    def direction_between(start: "Coordinate", end: "Coordinate") -> Ordinal:
+        if start.x < end.x and start.y == end.y:
+            return Ordinal.EAST
+        if start.x < end.x and start.y < end.y:
+            return Ordinal.SOUTH_EAST
+        if start.x == end.x and start.y < end.y:
+            return Ordinal.SOUTH
+        if start.x > end.x and start.y < end.y:
+            return Ordinal.SOUTH_WEST
+        if start.x > end.x and start.y == end.y:
+            return Ordinal.WEST
+        if start.x > end.x and start.y > end.y:
+            return Ordinal.NORTH_WEST
+        if start.x == end.x and start.y > end.y:
+            return Ordinal.NORTH
+        if start.x < end.x and start.y > end.y:
+            return Ordinal.NORTH_EAST
+
+    @staticmethod
+    def parse(coordinate_description: str) -> "Coordinate":
+        parts = coordinate_description.split(",")
+        return Coordinate(int(parts[0]), int(parts[1]))
+
+
+def as_line(
+    nearby_vent_description: str, allow_diagonals: bool = False
+) -> Optional[list[Coordinate]]:
+    [left, right] = nearby_vent_description.split(" -> ")
+    start = Coordinate.parse(left)
+    end = Coordinate.parse(right)
+    return make_line(start, end, allow_diagonals)
+
+
+def make_line(
+    start: Coordinate, end: Coordinate, allow_diagonals: bool = False
+) -> Optional[list[Coordinate]]:
+    direction = Coordinate.direction_between(start, end)
+    if not allow_diagonals and direction.is_diagonal():
+        return None
+
+    line = [start]
+    previous = start
+    while previous != end:
+        current = previous.move(direction, allow_diagonals)
+        line.append(current)
+        previous = current
+
+    return line
+
+
+def as_packed_line(
+    nearby_vent_description: str, allow_diagonals: bool = False
+) -> Optional[range]:
+    """
+    as_line, but the points packed into ints by lib.coordinates, which makes
+    the whole line one range object rather than a list of Coordinates
+    """
+    [left, right] = nearby_vent_description.split(" -> ")
+    return packed_segment(
+        *Coordinate.parse(left), *Coordinate.parse(right), allow_diagonals
+    )
+
+
+def packed_segment(
+    x1: int, y1: int, x2: int, y2: int, allow_diagonals: bool = False
+) -> Optional[range]:
+    """the packed points from (x1, y1) to (x2, y2), None for a skipped diagonal"""
+    if not allow_diagonals and x1 != x2 and y1 != y2:
+        return None
+    return coordinates.line(coordinates.pack(x1, y1), coordinates.pack(x2, y2))
+
+
+def find_overlaps(
+    lines: list[Iterable[Hashable] | None],
+) -> dict[Hashable, int]:
+    """how many lines cover each point, for lines of Coordinates or packed ints"""
+    overlaps: dict[Hashable, int] = {}
+    get = overlaps.get
+    for line in lines:
+        if not line:
+            continue
+        for point in line:
+            overlaps[point] = get(point, 0) + 1
+
+    return overlaps
+
+
+def count_overlaps(
+    x1s: Sequence[int],
+    y1s: Sequence[int],
+    x2s: Sequence[int],
+    y2s: Sequence[int],
+    allow_diagonals: bool = False,
+) -> int:
+    """how many points at least two of the vents, given as columns, cover"""
+    overlaps = find_overlaps(
+        [packed_segment(*vent, allow_diagonals) for vent in zip(x1s, y1s, x2s, y2s)]
+    )
+    return sum(1 for v in overlaps.values() if v >= 2)
+
+
+def _random_vents(rng: random.Random, size: int) -> tuple:
+    span = 10 + size
+    vents = []
+    for _ in range(size + 1):
+        x1, y1 = rng.randrange(span), rng.randrange(span)
+        length = rng.randrange(span)
+        dx, dy = rng.choice([(1, 0), (0, 1), (1, 1), (1, -1)])
+        if rng.random() < 0.5:
+            dx, dy = -dx, -dy
+        vents.append((x1, y1, x1 + dx * length, y1 + dy * length))
+    x1s, y1s, x2s, y2s = (list(column) for column in zip(*vents))
+    return x1s, y1s, x2s, y2s, rng.choice([True, False])
+
+
+overlap_count = backends.operation(
+    "DAY_FIVE.count_overlaps", count_overlaps, _random_vents
+)
+
+
+@overlap_count.implementation("numpy", min_size=50, requires="numpy")
+def _count_overlaps_numpy(
+    x1s: Sequence[int],
+    y1s: Sequence[int],
+    x2s: Sequence[int],
+    y2s: Sequence[int],
+    allow_diagonals: bool = False,
+) -> int:
+    import numpy as np
+
+    x1, y1, x2, y2 = (np.asarray(c, dtype=np.int64) for c in (x1s, y1s, x2s, y2s))
+    if not allow_diagonals:
+        straight = (x1 == x2) | (y1 == y2)
+        x1, y1, x2, y2 = x1[straight], y1[straight], x2[straight], y2[straight]
+    if not len(x1):
+        return 0
+    lengths = np.maximum(np.abs(x2 - x1), np.abs(y2 - y1)) + 1
+    # how far along its own vent each point is
+    steps = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    xs = np.repeat(x1, lengths) + steps * np.repeat(np.sign(x2 - x1), lengths)
+    ys = np.repeat(y1, lengths) + steps * np.repeat(np.sign(y2 - y1), lengths)
+    xs -= xs.min()
+    ys -= ys.min()
+    points = ys * (int(xs.max()) + 1) + xs
+    if points.max() < 64 * len(points):
+        counts = np.bincount(points)
+    else:
+        _, counts = np.unique(points, return_counts=True)
+    return int((counts >= 2).sum())
+
+
+def _points_within(segment: range, low: int, high: int) -> range:
+    """the part of a packed segment from low up to but not including high"""
+    if segment.step < 0:
+        segment = segment[::-1]
+    first = max(0, -(-(low - segment.start) // segment.step))
+    stop = max(0, -(-(high - segment.start) // segment.step))
+    return segment[first:stop]
+
+
+def _count_overlaps_between(
+    vents: list[tuple[int, int, int, int]], allow_diagonals: bool, low: int, high: int
+) -> int:
+    overlaps = find_overlaps(
+        [
+            _points_within(segment, low, high)
+            for vent in vents
+            if (segment := packed_segment(*vent, allow_diagonals))
+        ]
+    )
+    return sum(1 for v in overlaps.values() if v >= 2)
+
+
+@overlap_count.implementation(backends.parallel, min_size=2000)
+def _count_overlaps_parallel(
+    x1s: Sequence[int],
+    y1s: Sequence[int],
+    x2s: Sequence[int],
+    y2s: Sequence[int],
+    allow_diagonals: bool = False,
+) -> int:
+    vents = list(zip(x1s, y1s, x2s, y2s))
+    if not vents:
+        return 0
+    # packed points sort by row, so each worker counts a band of rows
+    left = min(min(x1s), min(x2s))
+    top = min(min(y1s), min(y2s))
+    rows = max(max(y1s), max(y2s)) - top + 1
+    band = -(-rows // backends.worker_count())
+    return sum(
+        backends.parallel_map(
+            _count_overlaps_between,
+            [
+                (
+                    vents,
+                    allow_diagonals,
+                    coordinates.pack(left, y),
+                    coordinates.pack(left, y + band),
+                )
+                for y in range(top, top + rows, band)
+            ],
+        )
+    )
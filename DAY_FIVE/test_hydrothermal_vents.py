@@ -1,9 +1,14 @@
-from dataclasses import dataclass
-from enum import Enum, auto
 from pathlib import Path
-from typing import Optional
 from unittest import TestCase
 
+from DAY_FIVE.hydrothermal_vents import (
+    Coordinate,
+    as_line,
+    as_packed_line,
+    find_overlaps,
+)
+from lib.puzzle_input import read_lines
+
 example_input = """0,9 -> 5,9
 8,0 -> 0,8
 9,4 -> 3,4
@@ -16,113 +21,6 @@ example_input = """0,9 -> 5,9
 5,5 -> 8,2"""
 
 
-class Ordinal(Enum):
-    NORTH = auto()
-    NORTH_EAST = auto()
-    EAST = auto()
-    SOUTH_EAST = auto()
-    SOUTH = auto()
-    SOUTH_WEST = auto()
-    WEST = auto()
-    NORTH_WEST = auto()
-
-    def is_diagonal(self):
-        return (
-            self == Ordinal.NORTH_EAST
-            or self == Ordinal.SOUTH_EAST
-            or self == Ordinal.SOUTH_WEST
-            or self == Ordinal.NORTH_WEST
-        )
-
-
-@dataclass(frozen=True)
-class Coordinate:
-    x: int
-    y: int
-
-    def move(self, direction: Ordinal, allow_diagonals: bool = False) -> "Coordinate":
-        match direction:
-            case Ordinal.NORTH:
-                return Coordinate(self.x, self.y - 1)
-            case Ordinal.NORTH_EAST:
-                return Coordinate(self.x + 1, self.y - 1) if allow_diagonals else None
-            case Ordinal.EAST:
-                return Coordinate(self.x + 1, self.y)
-            case Ordinal.SOUTH_EAST:
-                return Coordinate(self.x + 1, self.y + 1) if allow_diagonals else None
-            case Ordinal.SOUTH:
-                return Coordinate(self.x, self.y + 1)
-            case Ordinal.SOUTH_WEST:
-                return Coordinate(self.x - 1, self.y + 1) if allow_diagonals else None
-            case Ordinal.WEST:
-                return Coordinate(self.x - 1, self.y)
-            case Ordinal.NORTH_WEST:
-                return Coordinate(self.x - 1, self.y - 1) if allow_diagonals else None
-
-    @staticmethod
-    def direction_between(start: "Coordinate", end: "Coordinate") -> Ordinal:
-        if start.x < end.x and start.y == end.y:
-            return Ordinal.EAST
-        if start.x < end.x and start.y < end.y:
-            return Ordinal.SOUTH_EAST
-        if start.x == end.x and start.y < end.y:
-            return Ordinal.SOUTH
-        if start.x > end.x and start.y < end.y:
-            return Ordinal.SOUTH_WEST
-        if start.x > end.x and start.y == end.y:
-            return Ordinal.WEST
-        if start.x > end.x and start.y > end.y:
-            return Ordinal.NORTH_WEST
-        if start.x == end.x and start.y > end.y:
-            return Ordinal.NORTH
-        if start.x < end.x and start.y > end.y:
-            return Ordinal.NORTH_EAST
-
-    @staticmethod
-    def parse(coordinate_description: str) -> "Coordinate":
-        parts = coordinate_description.split(",")
-        return Coordinate(int(parts[0]), int(parts[1]))
-
-
-def as_line(
-    nearby_vent_description: str, allow_diagonals: bool = False
-) -> Optional[list[Coordinate]]:
-    [left, right] = nearby_vent_description.split(" -> ")
-    start = Coordinate.parse(left)
-    end = Coordinate.parse(right)
-    return make_line(start, end, allow_diagonals)
-
-
-def make_line(
-    start: Coordinate, end: Coordinate, allow_diagonals: bool = False
-) -> Optional[list[Coordinate]]:
-    direction = Coordinate.direction_between(start, end)
-    if not allow_diagonals and direction.is_diagonal():
-        return None
-
-    line = [start]
-    previous = start
-    while previous != end:
-        current = previous.move(direction, allow_diagonals)
-        line.append(current)
-        previous = current
-
-    return line
-
-
-def find_overlaps(lines: list[list[Coordinate] | None]) -> dict[Coordinate, int]:
-    overlaps: dict[Coordinate, int] = {}
-    present_lines = [line for line in lines if line]
-    for line in present_lines:
-        for coord in line:
-            if coord not in overlaps:
-                overlaps[coord] = 0
-
-            overlaps[coord] = overlaps[coord] + 1
-
-    return overlaps
-
-
 class TestHydrothermalVents(TestCase):
     def test_can_parse_one_horizontal_line(self):
         line = as_line("""0,4 -> 5,4""")
@@ -178,11 +76,10 @@ class TestHydrothermalVents(TestCase):
 
     def test_puzzle_input(self):
         puzzle_input_path = Path(__file__).parent / "./puzzle.input"
-        with open(puzzle_input_path, "r", newline="\n") as f:
-            lines = [as_line(line) for line in f.read().splitlines() if line]
-            overlaps = find_overlaps(lines)
-            two_or_more = sum([1 for v in overlaps.values() if v >= 2])
-            assert two_or_more == 7142
+        lines = [as_line(line) for line in read_lines(puzzle_input_path) if line]
+        overlaps = find_overlaps(lines)
+        two_or_more = sum([1 for v in overlaps.values() if v >= 2])
+        assert two_or_more == 7142
 
     def test_can_parse_diagonal_line(self):
         line = as_line("""1,1 -> 3,3""", allow_diagonals=True)
@@ -204,12 +101,23 @@ class TestHydrothermalVents(TestCase):
 
     def test_puzzle_input_with_diagonals(self):
         puzzle_input_path = Path(__file__).parent / "./puzzle.input"
-        with open(puzzle_input_path, "r", newline="\n") as f:
-            lines = [
-                as_line(line, allow_diagonals=True)
-                for line in f.read().splitlines()
-                if line
-            ]
-            overlaps = find_overlaps(lines)
-            two_or_more = sum([1 for v in overlaps.values() if v >= 2])
-            assert two_or_more == 20012
+        lines = [
+            as_line(line, allow_diagonals=True)
+            for line in read_lines(puzzle_input_path)
+            if line
+        ]
+        overlaps = find_overlaps(lines)
+        two_or_more = sum([1 for v in overlaps.values() if v >= 2])
+        assert two_or_more == 20012
+
+    def test_packed_lines_overlap_the_same_as_coordinate_lines(self):
+        puzzle_input_path = Path(__file__).parent / "./puzzle.input"
+        for allow_diagonals in [False, True]:
+            lines = [line for line in read_lines(puzzle_input_path) if line]
+            overlaps = find_overlaps(
+                [as_line(line, allow_diagonals) for line in lines]
+            )
+            packed_overlaps = find_overlaps(
+                [as_packed_line(line, allow_diagonals) for line in lines]
+            )
+            assert sorted(overlaps.values()) == sorted(packed_overlaps.values())
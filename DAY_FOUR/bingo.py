@@ -0,0 +1,116 @@
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Optional
+
+
+class Board:
+    def __init__(self, board: str, win_listener: Callable[["Board", int], None]):
+        self.win_listener = win_listener
+        self.board: str = board
+        self.numbers: Dict[str, tuple[int, int]] = {}
+        self.marked_rows = {}
+        self.marked_columns = {}
+        self.won_on_board = False
+
+        rows = board.splitlines()
+        self.column_win_length = len(rows)
+        for y, row in enumerate(rows):
+            x = -1  # cos not every enumerable column is a number
+            for column in list(row.split(" ")):
+                number = column.strip()
+                if number:
+                    x += 1
+                    if number in self.numbers:
+                        raise Exception(
+                            f"number {number} is already on this board... \n\n{self.board} \n\n{self.numbers}"
+                        )
+                    self.numbers[number] = (x, y)
+
+            self.row_win_length = x + 1
+
+    def drawn(self, number: str) -> None:
+        if self.won_on_board:
+            return
+
+        marked_positions = self.numbers.pop(number, None)
+        if marked_positions is not None:
+            (x, y) = marked_positions
+
+            if y not in self.marked_rows:
+                self.marked_rows[y] = []
+            self.marked_rows[y].append(x)
+
+            if x not in self.marked_columns:
+                self.marked_columns[x] = []
+            self.marked_columns[x].append(y)
+
+        for marked_row in self.marked_rows.values():
+            if len(marked_row) == self.row_win_length:
+                self.won_on_board = True
+                self.win_listener(self, int(number))
+
+        for marked_column in self.marked_columns.values():
+            if len(marked_column) == self.column_win_length:
+                self.won_on_board = True
+                self.win_listener(self, int(number))
+
+    def unmarked_numbers(self):
+        return list(self.numbers.keys())
+
+
+@dataclass
+class WinningGame:
+    board: Board
+    winning_number: int
+
+    def final_score(self) -> int:
+        unmarked_numbers = self.board.unmarked_numbers()
+        sum_of_unmarked = sum([int(n) for n in unmarked_numbers])
+        return sum_of_unmarked * self.winning_number
+
+
+class Bingo:
+    def __init__(self, drawn_numbers, boards: list[str], play_until_last_winner=False):
+        self.play_until_last_winner = play_until_last_winner
+        self.boards = [Board(b, self.win) for b in boards]
+        self.drawn_numbers = drawn_numbers
+        self.winning_game: Optional[WinningGame] = None
+
+    def win(self, board: Board, winning_number: int):
+        if self.play_until_last_winner:
+            self.winning_game = WinningGame(board, winning_number)
+        elif self.winning_game is None:
+            self.winning_game = WinningGame(board, winning_number)
+
+    @classmethod
+    def parse(cls, subsystem_output: str, play_until_last_winner=False) -> "Bingo":
+        return cls.from_blocks(
+            [block.splitlines() for block in subsystem_output.split("\n\n")],
+            play_until_last_winner=play_until_last_winner,
+        )
+
+    @classmethod
+    def from_blocks(
+        cls, blocks: Iterable[list[str]], play_until_last_winner=False
+    ) -> "Bingo":
+        blocks = iter(blocks)
+        number_row = "".join(next(blocks))
+        drawn_numbers = [n.strip() for n in number_row.split(",")]
+        return Bingo(
+            drawn_numbers=drawn_numbers,
+            boards=["\n".join(board) for board in blocks],
+            play_until_last_winner=play_until_last_winner,
+        )
+
+    def play(self):
+        for number in self.drawn_numbers:
+            for board in self.boards:
+                if self.play_until_last_winner:
+                    board.drawn(number)
+                else:
+                    if self.winning_game is None:
+                        board.drawn(number)
+                    else:
+                        break
+
+        assert self.winning_game is not None
+        return self.winning_game
@@ -1,9 +1,10 @@
-from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Callable, Dict
 from unittest import TestCase
 from unittest.mock import Mock
 
+from DAY_FOUR.bingo import Bingo, Board
+from lib.puzzle_input import read_blocks
+
 example_input = """7,4,9,5,11,17,23,2,0,14,21,24,10,16,13,6,15,25,12,22,18,20,8,19,3,26,1
 
 22 13 17 11  0
@@ -25,110 +26,6 @@ example_input = """7,4,9,5,11,17,23,2,0,14,21,24,10,16,13,6,15,25,12,22,18,20,8,
  2  0 12  3  7"""
 
 
-class Board:
-    def __init__(self, board: str, win_listener: Callable[["Board", int], None]):
-        self.win_listener = win_listener
-        self.board: str = board
-        self.numbers: Dict[str, tuple[int, int]] = {}
-        self.marked_rows = {}
-        self.marked_columns = {}
-        self.won_on_board = False
-
-        rows = board.splitlines()
-        self.column_win_length = len(rows)
-        for y, row in enumerate(rows):
-            x = -1  # cos not every enumerable column is a number
-            for column in list(row.split(" ")):
-                number = column.strip()
-                if number:
-                    x += 1
-                    if number in self.numbers:
-                        raise Exception(
-                            f"number {number} is already on this board... \n\n{self.board} \n\n{self.numbers}"
-                        )
-                    self.numbers[number] = (x, y)
-
-            self.row_win_length = x + 1
-
-    def drawn(self, number: str) -> None:
-        if self.won_on_board:
-            return
-
-        marked_positions = self.numbers.pop(number, None)
-        if marked_positions is not None:
-            (x, y) = marked_positions
-
-            if y not in self.marked_rows:
-                self.marked_rows[y] = []
-            self.marked_rows[y].append(x)
-
-            if x not in self.marked_columns:
-                self.marked_columns[x] = []
-            self.marked_columns[x].append(y)
-
-        for marked_row in self.marked_rows.values():
-            if len(marked_row) == self.row_win_length:
-                self.won_on_board = True
-                self.win_listener(self, int(number))
-
-        for marked_column in self.marked_columns.values():
-            if len(marked_column) == self.column_win_length:
-                self.won_on_board = True
-                self.win_listener(self, int(number))
-
-    def unmarked_numbers(self):
-        return list(self.numbers.keys())
-
-
-@dataclass
-class WinningGame:
-    board: Board
-    winning_number: int
-
-    def final_score(self) -> int:
-        unmarked_numbers = self.board.unmarked_numbers()
-        sum_of_unmarked = sum([int(n) for n in unmarked_numbers])
-        return sum_of_unmarked * self.winning_number
-
-
-class Bingo:
-    def __init__(self, drawn_numbers, boards: list[str], play_until_last_winner=False):
-        self.play_until_last_winner = play_until_last_winner
-        self.boards = [Board(b, self.win) for b in boards]
-        self.drawn_numbers = drawn_numbers
-        self.winning_game: Optional[WinningGame] = None
-
-    def win(self, board: Board, winning_number: int):
-        if self.play_until_last_winner:
-            self.winning_game = WinningGame(board, winning_number)
-        elif self.winning_game is None:
-            self.winning_game = WinningGame(board, winning_number)
-
-    @classmethod
-    def parse(cls, subsystem_output: str, play_until_last_winner=False) -> "Bingo":
-        number_row, *boards = subsystem_output.split("\n\n")
-        drawn_numbers = [n.strip() for n in number_row.split(",")]
-        return Bingo(
-            drawn_numbers=drawn_numbers,
-            boards=boards,
-            play_until_last_winner=play_until_last_winner,
-        )
-
-    def play(self):
-        for number in self.drawn_numbers:
-            for board in self.boards:
-                if self.play_until_last_winner:
-                    board.drawn(number)
-                else:
-                    if self.winning_game is None:
-                        board.drawn(number)
-                    else:
-                        break
-
-        assert self.winning_game is not None
-        return self.winning_game
-
-
 class TestBingo(TestCase):
     def test_parse_bingo_game(self):
         game = Bingo.parse(example_input)
@@ -232,16 +129,16 @@ class TestBingo(TestCase):
 
     def test_find_winner_in_puzzle_input(self):
         puzzle_input_path = Path(__file__).parent / "./puzzle.input"
-        with open(puzzle_input_path, "r", newline="\n") as f:
-            game = Bingo.parse(f.read())
-            winning_game = game.play()
+        game = Bingo.from_blocks(read_blocks(puzzle_input_path))
+        winning_game = game.play()
 
-            assert winning_game.final_score() == 60368
+        assert winning_game.final_score() == 60368
 
     def test_find_last_winner_in_puzzle_input(self):
         puzzle_input_path = Path(__file__).parent / "./puzzle.input"
-        with open(puzzle_input_path, "r", newline="\n") as f:
-            game = Bingo.parse(f.read(), play_until_last_winner=True)
-            winning_game = game.play()
+        game = Bingo.from_blocks(
+            read_blocks(puzzle_input_path), play_until_last_winner=True
+        )
+        winning_game = game.play()
 
-            assert winning_game.final_score() == 17435
+        assert winning_game.final_score() == 17435
@@ -0,0 +1,64 @@
+from lib import budget, trace
+from lib.profiling import hot_path
+
+
+def parse(instructions: str):
+    parts = instructions.split("\n\n")
+    return parts[0], {
+        instruction[0]: f"{instruction[0][0]}{instruction[1]}"
+        for instruction in [line.split(" -> ") for line in parts[1].splitlines()]
+    }
+
+
+cache: dict[str, str] = {}
+
+
+@hot_path
+def take_step(pair_insertions: dict[str, str], polymer_template: str):
+    # counted by length, so a template that keeps doubling is checked more often
+    budget.checkpoint("polymer elements", len(polymer_template))
+    found: list[tuple[int, str]] = []
+    for key in sorted(cache.keys(), key=len, reverse=True):
+        index = polymer_template.find(key)
+        if index > -1:
+            found.append((index, key))
+
+    # from start to end if none found
+    if len(found) == 0:
+        next_template = process_replacements(pair_insertions, polymer_template)
+    else:
+        # so go from start of string to first index in found doing replacements
+        cached_sections = sorted(found, key=lambda x: x[0])
+        trace.debug("found cached sections: %s", cached_sections)
+        next_template = ""
+        next_start = 0
+        for section in cached_sections:
+            found_index = section[0]
+            cache_key = section[1]
+            part = polymer_template[next_start : found_index + 1]
+            replaced_part = process_replacements(pair_insertions, part)
+            if next_start is not 0:
+                replaced_part = replaced_part[1:]
+            then = cache[cache_key]
+            next_start = found_index + len(cache_key) - 1
+            next_template += replaced_part + then
+
+        if next_start != len(polymer_template):
+            still_to_process = polymer_template[next_start:]
+            final_piece = process_replacements(pair_insertions, still_to_process)
+            next_template += final_piece[1:]
+
+    new_template = next_template + polymer_template[-1]
+
+    cache[polymer_template] = new_template
+    return new_template
+
+
+def process_replacements(pair_insertions: dict[str, str], haystack: str) -> str:
+    replaced = ""
+    for index in range(len(haystack)):
+        if index + 1 < len(haystack):
+            pair = haystack[index] + haystack[index + 1]
+            to_insert = pair_insertions.get(pair, pair[0])
+            replaced += to_insert
+    return replaced
@@ -1,108 +1,9 @@
-import logging
+from pathlib import Path
 from unittest import TestCase
 
-puzzle_input = """VOKKVSKKPSBVOOKVCFOV
+from DAY_FOURTEEN.polymers import cache, parse, take_step
 
-PK -> P
-BB -> V
-SO -> O
-OO -> V
-PV -> O
-CB -> H
-FH -> F
-SC -> F
-KF -> C
-VS -> O
-VP -> V
-FS -> K
-SP -> C
-FC -> N
-CF -> C
-BF -> V
-FN -> K
-NH -> F
-OB -> F
-SV -> H
-BN -> N
-OK -> K
-NF -> S
-OH -> S
-FV -> B
-OC -> F
-VF -> V
-HO -> H
-PS -> N
-NB -> N
-NS -> B
-OS -> P
-CS -> S
-CH -> N
-PC -> N
-BH -> F
-HP -> P
-HH -> V
-BK -> H
-HC -> B
-NK -> S
-SB -> C
-NO -> K
-SN -> H
-VV -> N
-ON -> P
-VN -> H
-VB -> P
-BV -> O
-CV -> N
-HV -> C
-SH -> C
-KV -> F
-BC -> O
-OF -> P
-NN -> C
-KN -> F
-CO -> C
-HN -> P
-PP -> V
-FP -> O
-CP -> S
-FB -> F
-CN -> S
-VC -> C
-PF -> F
-PO -> B
-KB -> H
-HF -> P
-SK -> P
-SF -> H
-VO -> N
-HK -> C
-HB -> C
-OP -> B
-SS -> V
-NV -> O
-KS -> N
-PH -> H
-KK -> B
-HS -> S
-PN -> F
-OV -> S
-PB -> S
-NC -> B
-BS -> N
-KP -> C
-FO -> B
-FK -> N
-BP -> C
-NP -> C
-KO -> C
-VK -> K
-FF -> C
-VH -> H
-CC -> F
-BO -> S
-KH -> B
-CK -> K
-KC -> C"""
+puzzle_input = (Path(__file__).parent / "puzzle.input").read_text()
 
 example_input = """NNCB
 
@@ -124,65 +25,6 @@ CC -> N
 CN -> C"""
 
 
-def parse(instructions: str):
-    parts = instructions.split("\n\n")
-    return parts[0], {
-        instruction[0]: f"{instruction[0][0]}{instruction[1]}"
-        for instruction in [line.split(" -> ") for line in parts[1].splitlines()]
-    }
-
-
-cache: dict[str, str] = {}
-
-
-def take_step(pair_insertions: dict[str, str], polymer_template: str):
-    found: list[tuple[int, str]] = []
-    for key in sorted(cache.keys(), key=len, reverse=True):
-        index = polymer_template.find(key)
-        if index > -1:
-            found.append((index, key))
-
-    # from start to end if none found
-    if len(found) == 0:
-        next_template = process_replacements(pair_insertions, polymer_template)
-    else:
-        # so go from start of string to first index in found doing replacements
-        cached_sections = sorted(found, key=lambda x: x[0])
-        logging.info(f"found cached sections: {cached_sections}")
-        next_template = ""
-        next_start = 0
-        for section in cached_sections:
-            found_index = section[0]
-            cache_key = section[1]
-            part = polymer_template[next_start : found_index + 1]
-            replaced_part = process_replacements(pair_insertions, part)
-            if next_start is not 0:
-                replaced_part = replaced_part[1:]
-            then = cache[cache_key]
-            next_start = found_index + len(cache_key) - 1
-            next_template += replaced_part + then
-
-        if next_start != len(polymer_template):
-            still_to_process = polymer_template[next_start:]
-            final_piece = process_replacements(pair_insertions, still_to_process)
-            next_template += final_piece[1:]
-
-    new_template = next_template + polymer_template[-1]
-
-    cache[polymer_template] = new_template
-    return new_template
-
-
-def process_replacements(pair_insertions: dict[str, str], haystack: str) -> str:
-    replaced = ""
-    for index in range(len(haystack)):
-        if index + 1 < len(haystack):
-            pair = haystack[index] + haystack[index + 1]
-            to_insert = pair_insertions.get(pair, pair[0])
-            replaced += to_insert
-    return replaced
-
-
 class TestPolymers(TestCase):
     def setup_method(self, method):
         cache.clear()
@@ -0,0 +1,54 @@
+from collections import deque
+
+from lib import automaton
+from lib.grid import Coordinate, Grid, neighbour_table
+
+LowPoints = list[tuple[int, Coordinate]]
+
+
+def get_risk_levels_of_lowest_points(lower: LowPoints) -> list[int]:
+    risk_levels = [1 + h for (h, coord) in lower]
+    return risk_levels
+
+
+def get_lowest_points(grid: Grid) -> LowPoints:
+    lower = []
+    cells = grid.cells
+    table = neighbour_table(grid.width, grid.height)
+    offsets, indices = table.offsets, table.indices
+    for index, height in enumerate(cells):
+        for k in range(offsets[index], offsets[index + 1]):
+            if cells[indices[k]] <= height:
+                break
+        else:
+            lower.append((height, grid.coordinate(index)))
+    return lower
+
+
+def get_basins(grid: Grid, lowest_points: list[Coordinate]) -> list[list[Coordinate]]:
+    basins = []
+    cells = grid.cells
+    table = neighbour_table(grid.width, grid.height)
+    offsets, indices = table.offsets, table.indices
+    points_to_check = deque()
+    for point in lowest_points:
+        basins.append([])
+        basin = basins[-1]
+
+        points_to_check.append(grid.index(*point))
+        checked = set()
+        while points_to_check:
+            next_point = points_to_check.popleft()
+            if next_point not in checked:
+                checked.add(next_point)
+                if cells[next_point] < 9:
+                    basin.append(grid.coordinate(next_point))
+                    for k in range(offsets[next_point], offsets[next_point + 1]):
+                        points_to_check.append(indices[k])
+    return basins
+
+
+def get_basin_sizes(grid: Grid) -> list[int]:
+    """the size of every basin, labelling the whole grid at once"""
+    (labels, count) = automaton.label(automaton.as_array(grid, copy=False) < 9)
+    return automaton.component_sizes(labels, count).tolist()
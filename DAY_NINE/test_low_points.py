@@ -1,9 +1,16 @@
 import math
 from pathlib import Path
-from queue import SimpleQueue
-from unittest import TestCase
-
-from lib.grid import Coordinate, Grid, as_grid, find_neighbours
+from unittest import TestCase, skipUnless
+
+from DAY_NINE.low_points import (
+    get_basin_sizes,
+    get_basins,
+    get_lowest_points,
+    get_risk_levels_of_lowest_points,
+)
+from lib import automaton
+from lib.grid import Grid, as_grid, find_neighbours
+from lib.puzzle_input import PuzzleInput
 
 example = """2199943210
 3987894921
@@ -11,51 +18,6 @@ example = """2199943210
 8767896789
 9899965678"""
 
-LowPoints = list[tuple[int, Coordinate]]
-
-
-def get_risk_levels_of_lowest_points(lower: LowPoints) -> list[int]:
-    risk_levels = [1 + h for (h, coord) in lower]
-    return risk_levels
-
-
-def get_lowest_points(grid: Grid) -> LowPoints:
-    lower = []
-    for row_index, row in enumerate(grid):
-        for col_index, height in enumerate(row):
-            neighbours = find_neighbours(
-                (col_index, row_index), max_row=len(grid) - 1, max_col=len(row) - 1
-            )
-            neighbour_heights = []
-            for n in neighbours:
-                neighbour_heights.append(grid[n[1]][n[0]])
-            if all(height < nh for nh in neighbour_heights):
-                lower.append((height, (col_index, row_index)))
-    return lower
-
-
-def get_basins(grid: Grid, lowest_points: list[Coordinate]) -> list[list[Coordinate]]:
-    basins = []
-    points_to_check = SimpleQueue()
-    for point in lowest_points:
-        basins.append([])
-        basin = basins[-1]
-
-        points_to_check.put(point)
-        checked = []
-        while not points_to_check.empty():
-            next_point = points_to_check.get()
-            if next_point not in checked:
-                checked.append(next_point)
-                if grid[next_point[1]][next_point[0]] < 9:
-                    basin.append(next_point)
-                    neighbours = find_neighbours(
-                        next_point, max_row=len(grid) - 1, max_col=len(grid[0]) - 1
-                    )
-                    for neighbour in neighbours:
-                        points_to_check.put(neighbour)
-    return basins
-
 
 class TestLowPoints(TestCase):
     def test_parse_to_grid(self):
@@ -87,11 +49,11 @@ class TestLowPoints(TestCase):
 
     def test_check_puzzle_input(self):
         puzzle_input_path = Path(__file__).parent / "./puzzle.input"
-        with open(puzzle_input_path, "r", newline="\n") as f:
-            grid = as_grid(f.read())
-            lower = get_lowest_points(grid)
-            risk_levels = get_risk_levels_of_lowest_points(lower)
-            assert sum(risk_levels) == 480
+        with PuzzleInput(puzzle_input_path) as puzzle_input:
+            grid = Grid.from_rows(puzzle_input.lines())
+        lower = get_lowest_points(grid)
+        risk_levels = get_risk_levels_of_lowest_points(lower)
+        assert sum(risk_levels) == 480
 
     def test_find_basins_in_example(self):
         grid = as_grid(example)
@@ -105,10 +67,22 @@ class TestLowPoints(TestCase):
 
     def test_find_basins_in_puzzle_input(self):
         puzzle_input_path = Path(__file__).parent / "./puzzle.input"
-        with open(puzzle_input_path, "r", newline="\n") as f:
-            grid = as_grid(f.read())
-            lowest_points = [coord for (h, coord) in get_lowest_points(grid)]
-            basins = get_basins(grid, lowest_points)
-            basins.sort(key=len, reverse=True)
-            top_three = [len(basin) for basin in basins[0:3]]
-            assert math.prod(top_three) == 1045660
+        with PuzzleInput(puzzle_input_path) as puzzle_input:
+            grid = Grid.from_rows(puzzle_input.lines())
+        lowest_points = [coord for (h, coord) in get_lowest_points(grid)]
+        basins = get_basins(grid, lowest_points)
+        basins.sort(key=len, reverse=True)
+        top_three = [len(basin) for basin in basins[0:3]]
+        assert math.prod(top_three) == 1045660
+
+    @skipUnless(automaton.available, "numpy is not installed")
+    def test_basin_sizes_in_example(self):
+        assert sorted(get_basin_sizes(as_grid(example)), reverse=True) == [14, 9, 9, 3]
+
+    @skipUnless(automaton.available, "numpy is not installed")
+    def test_basin_sizes_in_puzzle_input(self):
+        puzzle_input_path = Path(__file__).parent / "./puzzle.input"
+        with PuzzleInput(puzzle_input_path) as puzzle_input:
+            grid = Grid.from_rows(puzzle_input.lines())
+        sizes = sorted(get_basin_sizes(grid), reverse=True)
+        assert math.prod(sizes[0:3]) == 1045660
@@ -0,0 +1,464 @@
+import json
+import os
+import random
+import warnings
+from dataclasses import dataclass
+from functools import reduce
+from itertools import islice, tee
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional, Sequence
+
+from lib import backends
+from lib.puzzle_input import read_ints
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# files at least this big are read in numpy chunks when numpy is installed
+numpy_min_bytes = 1 << 20
+# and split between processes when they are this big and there are cpus to share
+parallel_min_bytes = 1 << 26
+chunk_bytes = 1 << 24
+
+
+def sliding_windows(sequence: Iterator, window_size: int = 3) -> list:
+    iterables = tee(iter(sequence), window_size)
+    window = zip(*(islice(t, n, None) for n, t in enumerate(iterables)))
+    yield from window
+
+
+def as_integers(ss: Iterator[str]) -> Iterator[int]:
+    for s in ss:
+        yield int(s)
+
+
+def check_sonar_readings_for_increases(sonar_readings: Iterator[str]) -> int:
+    previous: Optional[int] = None
+    increases = 0
+    for reading in map(int, sonar_readings):
+        # a reading of 0 is a reading, not the lack of one
+        if previous is not None:
+            if reading - previous > 0:
+                increases += 1
+
+        previous = reading
+    return increases
+
+
+class SonarTracker:
+    """
+    live increase counts for any number of window sizes at once. the sum of
+    one window is bigger than the sum of the window before it exactly when
+    the reading entering it is bigger than the one leaving, so each window
+    compares readings `window` apart and no sums are needed. a ring buffer
+    holds the last max(windows) readings, so a push costs the same however
+    many readings came before it
+
+        tracker = SonarTracker(windows=(1, 3, 60))
+        tracker.push(reading)
+        tracker.increases[3]
+
+    `readings`, `increases` and `recent` carry on from a count made earlier,
+    recent being the last of those readings that the ring holds
+    """
+
+    __slots__ = ("windows", "readings", "_counts", "_ring", "_slot")
+
+    def __init__(
+        self,
+        windows: Iterable[int] = (1, 3),
+        readings: int = 0,
+        increases: Optional[dict[int, int]] = None,
+        recent: Iterable[int] = (),
+    ):
+        self.windows = tuple(sorted(set(windows)))
+        if not self.windows or self.windows[0] < 1:
+            raise ValueError(f"windows hold at least one reading, not {windows}")
+        size = self.windows[-1]
+        recent = list(recent)[-size:]
+        if len(recent) != min(readings, size):
+            raise ValueError(
+                f"{len(recent)} recent readings for the last {min(readings, size)}"
+            )
+        increases = increases or {}
+        self.readings = readings
+        self._counts = [increases.get(window, 0) for window in self.windows]
+        self._ring = recent + [0] * (size - len(recent))
+        # where the next reading goes in the ring
+        self._slot = len(recent) % size
+
+    @property
+    def increases(self) -> dict[int, int]:
+        """increases so far for each window size"""
+        return dict(zip(self.windows, self._counts))
+
+    def push(self, reading: int) -> None:
+        self.push_many((reading,))
+
+    def push_many(self, readings: Iterable[int]) -> "SonarTracker":
+        """
+        push for each of readings, with the ring kept in locals meanwhile. a
+        numpy array is compared a whole chunk at a time
+        """
+        if hasattr(readings, "dtype"):
+            return self._push_array(readings)
+        readings = iter(readings)
+        windows = list(enumerate(self.windows))
+        counts = self._counts
+        ring = self._ring
+        size = len(ring)
+        slot = self._slot
+        seen = self.readings
+        try:
+            # until the ring is full some windows have nothing to compare with
+            while seen < size:
+                reading = next(readings, None)
+                if reading is None:
+                    return self
+                for i, window in windows:
+                    if window <= seen and reading > ring[slot - window]:
+                        counts[i] += 1
+                ring[slot] = reading
+                slot = (slot + 1) % size
+                seen += 1
+            for seen, reading in enumerate(readings, seen + 1):
+                for i, window in windows:
+                    # slot - window is never below -size, so it wraps round the ring
+                    if reading > ring[slot - window]:
+                        counts[i] += 1
+                ring[slot] = reading
+                slot += 1
+                if slot == size:
+                    slot = 0
+        finally:
+            self._slot = slot
+            self.readings = seen
+        return self
+
+    def recent(self) -> list[int]:
+        """the readings still in the ring, oldest first"""
+        kept = min(self.readings, len(self._ring))
+        return [self._ring[self._slot - kept + i] for i in range(kept)]
+
+    def _push_array(self, chunk: "np.ndarray") -> "SonarTracker":
+        import numpy as np
+
+        if not len(chunk):
+            return self
+        # the readings carried over from the last chunk are compared with this one's
+        recent = self.recent()
+        series = np.concatenate(
+            [np.array(recent, dtype=np.int64), chunk.astype(np.int64)]
+        )
+        for i, window in enumerate(self.windows):
+            start = max(len(recent), window)
+            later, earlier = series[start:], series[start - window : -window]
+            self._counts[i] += int(np.count_nonzero(later > earlier))
+        self.readings += len(chunk)
+        size = len(self._ring)
+        for reading in chunk[-size:].tolist():
+            self._ring[self._slot] = reading
+            self._slot = (self._slot + 1) % size
+        return self
+
+
+class SonarAnalyser:
+    """
+    counts raw and windowed increases in a stream of depth readings in one
+    pass, a SonarTracker over the windows 1 and `window` whose state can be
+    saved and carried on from
+    """
+
+    def __init__(
+        self,
+        window: int = 3,
+        readings: int = 0,
+        increases: int = 0,
+        window_increases: int = 0,
+        recent: Iterable[int] = (),
+    ):
+        if window < 1:
+            raise ValueError(f"a window holds at least one reading, not {window}")
+        self.window = window
+        self.tracker = SonarTracker(
+            (1, window),
+            readings,
+            {1: increases, window: window_increases},
+            recent,
+        )
+
+    @property
+    def readings(self) -> int:
+        return self.tracker.readings
+
+    @property
+    def increases(self) -> int:
+        return self.tracker.increases[1]
+
+    @property
+    def window_increases(self) -> int:
+        return self.tracker.increases[self.window]
+
+    @property
+    def recent(self) -> list[int]:
+        """the last `window` readings, oldest first"""
+        return self.tracker.recent()
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, SonarAnalyser) and other.state() == self.state()
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{k}={v!r}" for k, v in self.state().items())
+        return f"SonarAnalyser({fields})"
+
+    def push(self, reading: int) -> None:
+        self.tracker.push(reading)
+
+    def push_many(self, readings: Iterable[int]) -> "SonarAnalyser":
+        """push for each of readings, or a whole numpy array at a time"""
+        self.tracker.push_many(readings)
+        return self
+
+    def push_array(self, chunk: "np.ndarray") -> "SonarAnalyser":
+        """push_many for a numpy array of readings, compared a whole chunk at a time"""
+        return self.push_many(chunk)
+
+    def push_file(self, path: Path) -> "SonarAnalyser":
+        """push_many for a file of readings, in numpy chunks if it is big enough"""
+        if os.path.getsize(path) >= numpy_min_bytes and backends.installed("numpy"):
+            for chunk in depth_chunks(path):
+                self.push_array(chunk)
+            return self
+        return self.push_many(read_ints(path))
+
+    def running(
+        self, readings: Iterable[int], every: int = 1
+    ) -> Iterator[tuple[int, int]]:
+        """(increases, window increases) after every `every` readings and the last"""
+        readings = iter(readings)
+        while True:
+            counted = self.readings
+            self.push_many(islice(readings, every - counted % every))
+            if self.readings == counted:
+                return
+            yield self.increases, self.window_increases
+
+    def state(self) -> dict:
+        return {
+            "window": self.window,
+            "readings": self.readings,
+            "increases": self.increases,
+            "window_increases": self.window_increases,
+            "recent": self.recent,
+        }
+
+    @classmethod
+    def from_state(cls, state: dict) -> "SonarAnalyser":
+        return cls(**state)
+
+    def save(self, path: Path) -> None:
+        """writes the state to path, atomically, so a crash keeps the last checkpoint"""
+        path = Path(path)
+        temporary = path.with_suffix(f".{os.getpid()}.tmp")
+        temporary.write_text(json.dumps(self.state()))
+        os.replace(temporary, path)
+
+    @classmethod
+    def load(cls, path: Path) -> "SonarAnalyser":
+        return cls.from_state(json.loads(Path(path).read_text()))
+
+
+def _parse_depths(text: bytes) -> "np.ndarray":
+    import numpy as np
+
+    with warnings.catch_warnings():
+        # the only sign fromstring gives of text it cannot parse
+        warnings.simplefilter("error", DeprecationWarning)
+        try:
+            return np.fromstring(text, dtype=np.int32, sep=" ")
+        except DeprecationWarning as e:
+            raise ValueError(f"depth readings that are not integers: {e}") from None
+
+
+def line_blocks(
+    path: Path, size: int = chunk_bytes, start: int = 0, stop: Optional[int] = None
+) -> Iterator[bytes]:
+    """
+    whole lines from between the offsets start and stop of a file, read about
+    size bytes at a time. a line cut off by one read is finished by the next
+    """
+    with open(path, "rb") as f:
+        f.seek(start)
+        remaining = None if stop is None else stop - start
+        partial = b""
+        while remaining is None or remaining > 0:
+            block = f.read(size if remaining is None else min(size, remaining))
+            if not block:
+                break
+            if remaining is not None:
+                remaining -= len(block)
+            block = partial + block
+            end = block.rfind(b"\n") + 1
+            partial = block[end:]
+            if end:
+                yield block[:end]
+        if partial.strip():
+            yield partial
+
+
+def depth_chunks(path: Path, size: int = chunk_bytes) -> Iterator["np.ndarray"]:
+    """the readings in a file as int32 arrays parsed from about size bytes at a time"""
+    for block in line_blocks(path, size):
+        yield _parse_depths(block)
+
+
+def byte_ranges(path: Path, parts: int) -> list[tuple[int, int]]:
+    """(start, stop) offsets splitting a file into parts that start at a line"""
+    size = os.path.getsize(path)
+    boundaries = [0]
+    with open(path, "rb") as f:
+        for part in range(1, parts):
+            target = max(size * part // parts, boundaries[-1])
+            # the first line that starts at or after target
+            f.seek(max(target - 1, 0))
+            if target:
+                f.readline()
+            boundaries.append(min(f.tell(), size))
+    boundaries.append(size)
+    return list(zip(boundaries, boundaries[1:]))
+
+
+@dataclass(frozen=True)
+class SonarCounts:
+    """
+    the counts for one run of readings, with the readings at either end that
+    comparisons with the runs before and after it need
+    """
+
+    window: int
+    readings: int
+    increases: int
+    window_increases: int
+    head: tuple[int, ...]
+    tail: tuple[int, ...]
+
+    def then(self, after: "SonarCounts") -> "SonarCounts":
+        """the counts for this run followed straight away by after"""
+        # only the first window readings of after are compared with this run,
+        # and after has already counted the comparisons among those
+        across = SonarAnalyser(self.window, len(self.tail), recent=self.tail).push_many(
+            after.head
+        )
+        within = SonarAnalyser(self.window).push_many(after.head)
+        return SonarCounts(
+            self.window,
+            self.readings + after.readings,
+            self.increases + after.increases + across.increases - within.increases,
+            self.window_increases
+            + after.window_increases
+            + across.window_increases
+            - within.window_increases,
+            (self.head + after.head)[: self.window],
+            (self.tail + after.tail)[-self.window :],
+        )
+
+
+def count_range(path: Path, start: int, stop: int, window: int = 3) -> SonarCounts:
+    """the counts for the readings between two offsets of a file, on their own"""
+    analyser = SonarAnalyser(window)
+    head: list[int] = []
+    vectorised = backends.installed("numpy")
+    for block in line_blocks(path, chunk_bytes, start, stop):
+        readings = _parse_depths(block) if vectorised else list(map(int, block.split()))
+        if len(head) < window:
+            head.extend(int(r) for r in readings[: window - len(head)])
+        if vectorised:
+            analyser.push_array(readings)
+        else:
+            analyser.push_many(readings)
+    return SonarCounts(
+        window,
+        analyser.readings,
+        analyser.increases,
+        analyser.window_increases,
+        tuple(head),
+        tuple(analyser.recent),
+    )
+
+
+def count_increases_in_parallel(
+    path: Path, window: int = 3, workers: Optional[int] = None
+) -> tuple[int, int]:
+    """
+    (increases, windowed increases) for a file split at line boundaries into
+    a range per worker, each counted in its own process and stitched together
+    """
+    ranges = byte_ranges(path, workers or backends.worker_count())
+    counts = reduce(
+        SonarCounts.then,
+        backends.parallel_map(
+            count_range, [(path, start, stop, window) for start, stop in ranges]
+        ),
+    )
+    return counts.increases, counts.window_increases
+
+
+def count_increases_in_file(path: Path, window: int = 3) -> tuple[int, int]:
+    """(increases, windowed increases) for a file of readings of any size"""
+    if os.path.getsize(path) >= parallel_min_bytes and backends.worker_count() > 1:
+        return count_increases_in_parallel(path, window)
+    analyser = SonarAnalyser(window).push_file(path)
+    return analyser.increases, analyser.window_increases
+
+
+def _count_increases(readings: Sequence[int], window: int) -> tuple[int, int]:
+    analyser = SonarAnalyser(window).push_many(readings)
+    return analyser.increases, analyser.window_increases
+
+
+def _random_readings(rng: random.Random, size: int) -> tuple[list[int], int]:
+    from lib import generators
+
+    readings = [int(r) for r in generators.sonar_readings(size, rng)]
+    return readings, rng.randint(1, 5)
+
+
+increases = backends.operation(
+    "DAY_ONE.count_increases", _count_increases, _random_readings
+)
+
+
+@increases.implementation("numpy", min_size=100_000, requires="numpy")
+def _count_increases_numpy(
+    readings: Sequence[int], window: int, chunk_size: int = 1 << 20
+) -> tuple[int, int]:
+    import numpy as np
+
+    # a memoryview of a mapped column becomes an array without being copied
+    readings = np.asarray(readings)
+    analyser = SonarAnalyser(window)
+    for start in range(0, len(readings), chunk_size):
+        analyser.push_array(readings[start : start + chunk_size])
+    return analyser.increases, analyser.window_increases
+
+
+def analyse_feed(
+    readings: Iterable[int],
+    checkpoint: Path,
+    window: int = 3,
+    every: int = 1_000_000,
+) -> SonarAnalyser:
+    """
+    analyses a feed of readings, carrying on from the state saved at
+    checkpoint if there is one and saving it every `every` readings and at
+    the end. readings are those that follow the ones already counted, a
+    replayed file can be skipped past with islice(readings, analyser.readings, None)
+    """
+    checkpoint = Path(checkpoint)
+    if checkpoint.exists():
+        analyser = SonarAnalyser.load(checkpoint)
+    else:
+        analyser = SonarAnalyser(window)
+    for _ in analyser.running(readings, every):
+        analyser.save(checkpoint)
+    return analyser
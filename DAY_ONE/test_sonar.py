@@ -1,32 +1,28 @@
-from itertools import islice, tee
+import random
+import tempfile
+from itertools import islice
 from pathlib import Path
-from typing import Optional, Iterator
-from unittest import TestCase
+from unittest import TestCase, mock, skipUnless
 
-puzzle_input_path = Path(__file__).parent / "./part1.input"
-
-
-def sliding_windows(sequence: Iterator, window_size: int = 3) -> list:
-    iterables = tee(iter(sequence), window_size)
-    window = zip(*(islice(t, n, None) for n, t in enumerate(iterables)))
-    yield from window
-
-
-def as_integers(ss: Iterator[str]) -> Iterator[int]:
-    for s in ss:
-        yield int(s)
+from DAY_ONE import sonar
+from DAY_ONE.sonar import (
+    SonarAnalyser,
+    SonarCounts,
+    SonarTracker,
+    analyse_feed,
+    as_integers,
+    byte_ranges,
+    check_sonar_readings_for_increases,
+    count_increases_in_file,
+    count_increases_in_parallel,
+    count_range,
+    depth_chunks,
+    sliding_windows,
+)
+from lib import backends
+from lib.puzzle_input import read_ints, read_lines
 
-
-def check_sonar_readings_for_increases(sonar_readings: Iterator[str]) -> int:
-    previous: Optional[int] = None
-    increases = 0
-    for reading in [int(s) for s in sonar_readings]:
-        if previous:
-            if reading - previous > 0:
-                increases += 1
-
-        previous = reading
-    return increases
+puzzle_input_path = Path(__file__).parent / "./part1.input"
 
 
 example_sonar_readings = """199
@@ -50,10 +46,9 @@ class DayOne(TestCase):
         assert increases == 7
 
     def test_file_input(self):
-        with open(puzzle_input_path, "r", newline="\n") as f:
-            increases = check_sonar_readings_for_increases(iter(f.readlines()))
+        increases = check_sonar_readings_for_increases(read_lines(puzzle_input_path))
 
-            assert increases == 1374
+        assert increases == 1374
 
     def test_read_sequence_in_threes(self):
         sequence = [0, 1, 2, 3, 4, 5]
@@ -77,9 +72,185 @@ class DayOne(TestCase):
         assert increases == 5
 
     def test_file_input_in_windows(self):
-        with open(puzzle_input_path, "r", newline="\n") as f:
-            increases = check_sonar_readings_for_increases(
-                [sum(w) for w in sliding_windows(as_integers(iter(f.readlines())))]
+        increases = check_sonar_readings_for_increases(
+            [
+                sum(w)
+                for w in sliding_windows(as_integers(read_lines(puzzle_input_path)))
+            ]
+        )
+
+        assert increases == 1418
+
+    def test_analyser_counts_both_series_in_one_pass(self):
+        readings = as_integers(iter(example_sonar_readings.splitlines()))
+        analyser = SonarAnalyser().push_many(readings)
+        assert (analyser.increases, analyser.window_increases) == (7, 5)
+        assert list(analyser.recent) == [269, 260, 263]
+
+    def test_analyser_agrees_with_the_file_input(self):
+        analyser = SonarAnalyser().push_many(read_ints(puzzle_input_path))
+        assert (analyser.increases, analyser.window_increases) == (1374, 1418)
+
+    def test_analyser_reports_running_counts(self):
+        readings = as_integers(iter(example_sonar_readings.splitlines()))
+        running = list(SonarAnalyser().running(readings, every=4))
+        assert running == [(3, 1), (6, 3), (7, 5)]
+
+    def test_analyser_resumes_from_a_checkpoint(self):
+        readings = list(read_ints(puzzle_input_path))
+        whole = SonarAnalyser().push_many(readings)
+        with tempfile.TemporaryDirectory() as directory:
+            checkpoint = Path(directory) / "sonar.json"
+            first = analyse_feed(islice(readings, 777), checkpoint, every=100)
+            assert first.readings == 777
+            resumed = analyse_feed(
+                islice(readings, first.readings, None), checkpoint, every=100
             )
+            assert resumed == whole
+            assert SonarAnalyser.load(checkpoint) == whole
+
+    def test_counts_stitched_across_any_split_match_one_pass(self):
+        rng = random.Random(2)
+        readings = [rng.randint(0, 30) for _ in range(200)]
+        for window in [1, 3, 5]:
+            whole = SonarAnalyser(window).push_many(readings)
+            for _ in range(20):
+                cuts = sorted(rng.choices(range(len(readings) + 1), k=6))
+                parts = [
+                    readings[start:stop]
+                    for start, stop in zip([0, *cuts], [*cuts, len(readings)])
+                ]
+                counts = [self.counts_of(part, window) for part in parts]
+                stitched = counts[0]
+                for after in counts[1:]:
+                    stitched = stitched.then(after)
+                assert stitched.readings == len(readings)
+                assert (stitched.increases, stitched.window_increases) == (
+                    whole.increases,
+                    whole.window_increases,
+                )
+                assert stitched.tail == tuple(whole.recent)
+
+    @staticmethod
+    def counts_of(readings, window):
+        analyser = SonarAnalyser(window).push_many(readings)
+        return SonarCounts(
+            window,
+            analyser.readings,
+            analyser.increases,
+            analyser.window_increases,
+            tuple(readings[:window]),
+            tuple(analyser.recent),
+        )
+
+    def test_byte_ranges_start_on_a_line(self):
+        text = puzzle_input_path.read_bytes()
+        ranges = byte_ranges(puzzle_input_path, 7)
+        assert ranges[0][0] == 0 and ranges[-1][1] == len(text)
+        for (_, stop), (start, _) in zip(ranges, ranges[1:]):
+            assert stop == start
+            assert text[start - 1 : start] == b"\n"
+
+    def test_file_input_counted_in_parallel(self):
+        expected = (
+            check_sonar_readings_for_increases(read_lines(puzzle_input_path)),
+            check_sonar_readings_for_increases(
+                [
+                    sum(w)
+                    for w in sliding_windows(as_integers(read_lines(puzzle_input_path)))
+                ]
+            ),
+        )
+        for workers in [1, 3, 16]:
+            assert count_increases_in_parallel(puzzle_input_path, workers=workers) == (
+                expected
+            )
+
+    def test_a_range_is_counted_without_numpy(self):
+        start, stop = byte_ranges(puzzle_input_path, 3)[1]
+        counted = count_range(puzzle_input_path, start, stop)
+        with mock.patch.object(backends, "installed", return_value=False):
+            assert count_range(puzzle_input_path, start, stop) == counted
+
+    def test_a_reading_of_zero_is_compared_like_any_other(self):
+        assert check_sonar_readings_for_increases(["0", "1", "0", "2"]) == 2
+        assert check_sonar_readings_for_increases(["-3", "-1", "-2"]) == 1
+
+    def test_tracker_counts_every_window_at_once(self):
+        tracker = SonarTracker(windows=(3, 1))
+        for reading in as_integers(iter(example_sonar_readings.splitlines())):
+            tracker.push(reading)
+        assert tracker.increases == {1: 7, 3: 5}
+        assert tracker.readings == 10
+        assert tracker.recent() == [269, 260, 263]
+
+    def test_tracker_handles_zero_and_negative_readings(self):
+        rng = random.Random(4)
+        readings = [rng.randint(-3, 3) for _ in range(300)]
+        windows = (1, 2, 5, 17)
+        tracker = SonarTracker(windows).push_many(readings)
+        assert tracker.increases == {
+            w: sum(readings[i] > readings[i - w] for i in range(w, len(readings)))
+            for w in windows
+        }
+
+    def test_tracker_windows_hold_at_least_one_reading(self):
+        with self.assertRaises(ValueError):
+            SonarTracker(windows=(0, 3))
+
+    def test_tracker_carries_on_from_an_earlier_count(self):
+        readings = list(read_ints(puzzle_input_path))
+        whole = SonarTracker((1, 3, 10)).push_many(readings)
+        first = SonarTracker((1, 3, 10)).push_many(readings[:500])
+        resumed = SonarTracker(
+            (1, 3, 10), first.readings, first.increases, first.recent()
+        ).push_many(readings[500:])
+        assert resumed.increases == whole.increases
+        assert resumed.recent() == whole.recent()
+        with self.assertRaises(ValueError):
+            SonarTracker((1, 3), readings=5, recent=[1, 2])
+
+
+@skipUnless(backends.installed("numpy"), "numpy is not installed")
+class DayOneInNumpyChunks(TestCase):
+    def test_chunks_carry_readings_over_to_the_next(self):
+        import numpy as np
+
+        rng = random.Random(1)
+        readings = [rng.randint(0, 50) for _ in range(500)]
+        for window in [1, 3, 7]:
+            expected = SonarAnalyser(window).push_many(readings)
+            for size in [1, 2, 5, 64]:
+                analyser = SonarAnalyser(window)
+                for start in range(0, len(readings), size):
+                    analyser.push_array(np.array(readings[start : start + size]))
+                assert analyser == expected, (window, size)
+
+    def test_lines_cut_between_reads_are_joined(self):
+        chunks = list(depth_chunks(puzzle_input_path, size=7))
+        assert len(chunks) > 1
+        joined = [int(r) for chunk in chunks for r in chunk]
+        assert joined == list(read_ints(puzzle_input_path))
+
+    def test_tracker_takes_numpy_chunks(self):
+        import numpy as np
+
+        readings = list(read_ints(puzzle_input_path))
+        expected = SonarTracker((1, 3, 10)).push_many(readings)
+        tracker = SonarTracker((1, 3, 10))
+        for start in range(0, len(readings), 7):
+            tracker.push_many(np.array(readings[start : start + 7]))
+        assert tracker.increases == expected.increases
+        assert tracker.increases[1] == 1374 and tracker.increases[3] == 1418
+        assert tracker.recent() == expected.recent()
+
+    def test_file_input_in_numpy_chunks(self):
+        with mock.patch.multiple(sonar, numpy_min_bytes=0, chunk_bytes=4096):
+            assert count_increases_in_file(puzzle_input_path) == (1374, 1418)
 
-            assert increases == 1418
+    def test_text_that_is_not_readings_is_an_error(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "depths"
+            path.write_text("199\n200\nfathoms\n208\n")
+            with self.assertRaises(ValueError):
+                list(depth_chunks(path))
@@ -0,0 +1,112 @@
+import random
+from statistics import mean
+from typing import Sequence
+
+from lib import backends
+
+
+def positions_of(crabs_positions: str) -> list[int]:
+    return [int(c) for c in crabs_positions.split(",")]
+
+
+def max_from(crabs: str) -> int:
+    return max(positions_of(crabs))
+
+
+def distance_between(a: int, b: int) -> int:
+    return abs(a - b)
+
+
+def distances_for(positions: list[int], target: int) -> list[int]:
+    return [distance_between(p, target) for p in positions]
+
+
+increasing_costs: dict[int, int] = {}
+
+
+def increasing_fuel_cost_for(distance: int) -> int:
+    if distance not in increasing_costs:
+        """cleverness from https://math.stackexchange.com/a/50487/405349"""
+        increasing_costs[distance] = mean([1, distance]) * distance
+
+    return increasing_costs[distance]
+
+
+def cost_of(distances: list[int], fuel_cost_is_constant: bool = True) -> int:
+    if fuel_cost_is_constant:
+        return sum(distances)
+    else:
+        return sum([increasing_fuel_cost_for(d) for d in distances])
+
+
+def get_cheapest_fuel_cost(crabs: str, fuel_cost_is_constant: bool = True):
+    positions = positions_of(crabs)
+    return fuel_cost.select(len(positions))(positions, fuel_cost_is_constant)
+
+
+def cheapest_fuel_cost(positions: Sequence[int], fuel_cost_is_constant: bool = True):
+    max_target = max(positions)
+    current_smallest = 200000000
+    for n in range(0, max_target + 1):
+        cost = cost_of(distances_for(positions, n), fuel_cost_is_constant)
+        if cost < current_smallest:
+            current_smallest = cost
+    return current_smallest
+
+
+def _random_crabs(rng: random.Random, size: int) -> tuple[list[int], bool]:
+    positions = [rng.randrange(50 + size * 10) for _ in range(size + 1)]
+    return positions, rng.choice([True, False])
+
+
+fuel_cost = backends.operation(
+    "DAY_SEVEN.cheapest_fuel_cost", cheapest_fuel_cost, _random_crabs
+)
+
+
+@fuel_cost.implementation("numpy", min_size=100, requires="numpy")
+def _cheapest_fuel_cost_numpy(
+    positions: Sequence[int], fuel_cost_is_constant: bool = True
+) -> int:
+    import numpy as np
+
+    crabs = np.asarray(positions, dtype=np.int64)
+    max_target = int(crabs.max())
+    # a block of targets at a time keeps the distance matrix to a few MiB
+    block = max(1, 1_000_000 // len(crabs))
+    cheapest = None
+    for start in range(0, max_target + 1, block):
+        targets = np.arange(start, min(start + block, max_target + 1))
+        distances = np.abs(crabs[np.newaxis, :] - targets[:, np.newaxis])
+        if not fuel_cost_is_constant:
+            distances = distances * (distances + 1) // 2
+        smallest = int(distances.sum(axis=1).min())
+        cheapest = smallest if cheapest is None else min(cheapest, smallest)
+    return cheapest
+
+
+def _cheapest_between(
+    positions: Sequence[int], start: int, stop: int, fuel_cost_is_constant: bool
+) -> int:
+    return min(
+        cost_of(distances_for(positions, n), fuel_cost_is_constant)
+        for n in range(start, stop)
+    )
+
+
+@fuel_cost.implementation(backends.parallel, min_size=5000)
+def _cheapest_fuel_cost_parallel(
+    positions: Sequence[int], fuel_cost_is_constant: bool = True
+) -> int:
+    positions = list(positions)
+    targets = max(positions) + 1
+    step = -(-targets // backends.worker_count())
+    return min(
+        backends.parallel_map(
+            _cheapest_between,
+            [
+                (positions, start, min(start + step, targets), fuel_cost_is_constant)
+                for start in range(0, targets, step)
+            ],
+        )
+    )
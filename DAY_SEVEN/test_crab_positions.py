@@ -1,50 +1,16 @@
 from pathlib import Path
-from statistics import mean
 from unittest import TestCase
 
-
-def positions_of(crabs_positions: str) -> list[int]:
-    return [int(c) for c in crabs_positions.split(",")]
-
-
-def max_from(crabs: str) -> int:
-    return max(positions_of(crabs))
-
-
-def distance_between(a: int, b: int) -> int:
-    return abs(a - b)
-
-
-def distances_for(positions: list[int], target: int) -> list[int]:
-    return [distance_between(p, target) for p in positions]
-
-
-increasing_costs: dict[int, int] = {}
-
-
-def increasing_fuel_cost_for(distance: int) -> int:
-    if distance not in increasing_costs:
-        """cleverness from https://math.stackexchange.com/a/50487/405349"""
-        increasing_costs[distance] = mean([1, distance]) * distance
-
-    return increasing_costs[distance]
-
-
-def cost_of(distances: list[int], fuel_cost_is_constant: bool = True) -> int:
-    if fuel_cost_is_constant:
-        return sum(distances)
-    else:
-        return sum([increasing_fuel_cost_for(d) for d in distances])
-
-
-def get_cheapest_fuel_cost(crabs: str, fuel_cost_is_constant: bool = True):
-    max_target = max_from(crabs)
-    current_smallest = 200000000
-    for n in range(0, max_target + 1):
-        cost = cost_of(distances_for(positions_of(crabs), n), fuel_cost_is_constant)
-        if cost < current_smallest:
-            current_smallest = cost
-    return current_smallest
+from DAY_SEVEN.crab_positions import (
+    cheapest_fuel_cost,
+    cost_of,
+    distance_between,
+    distances_for,
+    get_cheapest_fuel_cost,
+    increasing_fuel_cost_for,
+    max_from,
+    positions_of,
+)
 
 
 class TestCrabPositions(TestCase):
@@ -104,3 +70,8 @@ class TestCrabPositions(TestCase):
                 get_cheapest_fuel_cost(f.read(), fuel_cost_is_constant=False)
                 == 98231647
             )
+
+    def test_cheapest_fuel_cost_of_parsed_positions(self):
+        positions = positions_of("16,1,2,0,4,2,7,1,2,14")
+        assert cheapest_fuel_cost(positions) == 37
+        assert cheapest_fuel_cost(positions, fuel_cost_is_constant=False) == 168
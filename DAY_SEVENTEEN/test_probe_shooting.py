@@ -1,92 +1,14 @@
-import dataclasses
+from pathlib import Path
 from typing import Callable
 from unittest import TestCase
 
-puzzle_input = "target area: x=185..221, y=-122..-74"
+from DAY_SEVENTEEN.probe_shooting import (
+    Probe,
+    parse_target_is_passed,
+    parse_target_is_within,
+)
 
-
-def to_ranges(description: str) -> tuple[list[int, int], list[int, int]]:
-    [x_desc, y_desc] = description[13:].split(", ")
-    x_range_description = x_desc[2::].split("..")
-    y_range_description = sorted(y_desc[2::].split(".."))
-    x_range = [int(x) for x in x_range_description]
-    y_range = [int(y) for y in y_range_description]
-    # logging.debug(f"x_range: {x_range} and y_range: {y_range}")
-    return x_range, y_range
-
-
-def parse_target_is_passed(description: str) -> Callable[[tuple[int, int]], bool]:
-    """
-    negative y is down
-    negative x is left
-    :param description: looks like "x=-10..10, y=-10..10"
-    :return:
-    """
-    (x_range, y_range) = to_ranges(description)
-
-    def _is_passed(coord: tuple[int, int]) -> bool:
-        is_passed_x = coord[0] > x_range[1]
-        is_passed_y = coord[1] < y_range[0]
-        # logging.debug(f"{coord[0]} > {x_range[1]}")
-        # logging.debug(f"{coord[1]} < {y_range[0]}")
-        # logging.debug(f"{coord} -> past x: {is_passed_x}, past y: {is_passed_y}")
-        return is_passed_x or is_passed_y
-
-    return _is_passed
-
-
-def parse_target_is_within(description: str) -> Callable[[tuple[int, int]], bool]:
-    """
-    negative y is down
-    negative x is left
-    :param description: looks like "x=-10..10, y=--10..10"
-    :return:
-    """
-    (x_range, y_range) = to_ranges(description)
-
-    def _is_within(coord: tuple[int, int]) -> bool:
-        is_within_x = x_range[0] <= coord[0] <= x_range[1]
-        is_within_y = y_range[0] <= coord[1] <= y_range[1]
-        # logging.debug(f"{x_range[0]} <= {coord[0]} <= {x_range[1]}")
-        # logging.debug(f"{y_range[0]} <= {coord[1]} <= {y_range[1]}")
-        # logging.debug(f"{coord} -> within x: {is_within_x}, within_y: {is_within_y}")
-        return is_within_x and is_within_y
-
-    return _is_within
-
-
-@dataclasses.dataclass(frozen=True)
-class Probe:
-    x_velocity: int
-    y_velocity: int
-    position: tuple[int, int] = (0, 0)
-
-    def step(self):
-        """
-        * The probe's x position increases by its x velocity.
-        * The probe's y position increases by its y velocity.
-        * Due to drag, the probe's x velocity changes by 1 toward the value 0; that is,
-            it decreases by 1 if it is greater than 0, increases by 1 if it is less than 0,
-            or does not change if it is already 0.
-        * Due to gravity, the probe's y velocity decreases by 1.
-        """
-        return Probe(
-            position=(
-                self.position[0] + self.x_velocity,
-                self.position[1] + self.y_velocity,
-            ),
-            x_velocity=self._approach_zero(self.x_velocity),
-            y_velocity=self.y_velocity - 1,
-        )
-
-    @staticmethod
-    def _approach_zero(x_velocity: int) -> int:
-        if x_velocity == 0:
-            return 0
-        elif x_velocity > 0:
-            return x_velocity - 1
-        else:
-            return x_velocity + 1
+puzzle_input = (Path(__file__).parent / "puzzle.input").read_text()
 
 
 class TestProbeShooting(TestCase):
@@ -0,0 +1,27 @@
+
+
+def parse_list_to_dict(ns: list[int]) -> dict[int, int]:
+    result = {}
+    for n in ns:
+        if n not in result:
+            result[n] = 0
+        result[n] += 1
+
+    return result
+
+
+def tick(fish: dict[int, int], times: int) -> dict[int, int]:
+    current = fish
+    for x in range(1, times + 1):
+        next_fish = {}
+        for n in range(8, -1, -1):
+            if n != 0:
+                next_fish[n - 1] = current.get(n, 0)
+            else:
+                birthing = current.get(0, 0)
+                next_fish[6] += birthing
+                next_fish[8] = next_fish.get(8, 0) + birthing
+
+        current = next_fish
+
+    return current
@@ -1,339 +1,16 @@
+from pathlib import Path
 from unittest import TestCase
 
+from DAY_SIX.lanternfish import parse_list_to_dict, tick
+
 puzzle_input = [
-    5,
-    1,
-    5,
-    3,
-    2,
-    2,
-    3,
-    1,
-    1,
-    4,
-    2,
-    4,
-    1,
-    2,
-    1,
-    4,
-    1,
-    1,
-    5,
-    3,
-    5,
-    1,
-    5,
-    3,
-    1,
-    2,
-    4,
-    4,
-    1,
-    1,
-    3,
-    1,
-    1,
-    3,
-    1,
-    1,
-    5,
-    1,
-    5,
-    4,
-    5,
-    4,
-    5,
-    1,
-    3,
-    2,
-    4,
-    3,
-    5,
-    3,
-    5,
-    4,
-    3,
-    1,
-    4,
-    3,
-    1,
-    1,
-    1,
-    4,
-    5,
-    1,
-    1,
-    1,
-    2,
-    1,
-    2,
-    1,
-    1,
-    4,
-    1,
-    4,
-    1,
-    1,
-    3,
-    3,
-    2,
-    2,
-    4,
-    2,
-    1,
-    1,
-    5,
-    3,
-    1,
-    3,
-    1,
-    1,
-    4,
-    3,
-    3,
-    3,
-    1,
-    5,
-    2,
-    3,
-    1,
-    3,
-    1,
-    5,
-    2,
-    2,
-    1,
-    2,
-    1,
-    1,
-    1,
-    3,
-    4,
-    1,
-    1,
-    1,
-    5,
-    4,
-    1,
-    1,
-    1,
-    4,
-    4,
-    2,
-    1,
-    5,
-    4,
-    3,
-    1,
-    2,
-    5,
-    1,
-    1,
-    1,
-    1,
-    2,
-    1,
-    5,
-    5,
-    1,
-    1,
-    1,
-    1,
-    3,
-    1,
-    4,
-    1,
-    3,
-    1,
-    5,
-    1,
-    1,
-    1,
-    5,
-    5,
-    1,
-    4,
-    5,
-    4,
-    5,
-    4,
-    3,
-    3,
-    1,
-    3,
-    1,
-    1,
-    5,
-    5,
-    5,
-    5,
-    1,
-    2,
-    5,
-    4,
-    1,
-    1,
-    1,
-    2,
-    2,
-    1,
-    3,
-    1,
-    1,
-    2,
-    4,
-    2,
-    2,
-    2,
-    1,
-    1,
-    2,
-    2,
-    1,
-    5,
-    2,
-    1,
-    1,
-    2,
-    1,
-    3,
-    1,
-    3,
-    2,
-    2,
-    4,
-    3,
-    1,
-    2,
-    4,
-    5,
-    2,
-    1,
-    4,
-    5,
-    4,
-    2,
-    1,
-    1,
-    1,
-    5,
-    4,
-    1,
-    1,
-    4,
-    1,
-    4,
-    3,
-    1,
-    2,
-    5,
-    2,
-    4,
-    1,
-    1,
-    5,
-    1,
-    5,
-    4,
-    1,
-    1,
-    4,
-    1,
-    1,
-    5,
-    5,
-    1,
-    5,
-    4,
-    2,
-    5,
-    2,
-    5,
-    4,
-    1,
-    1,
-    4,
-    1,
-    2,
-    4,
-    1,
-    2,
-    2,
-    2,
-    1,
-    1,
-    1,
-    5,
-    5,
-    1,
-    2,
-    5,
-    1,
-    3,
-    4,
-    1,
-    1,
-    1,
-    1,
-    5,
-    3,
-    4,
-    1,
-    1,
-    2,
-    1,
-    1,
-    3,
-    5,
-    5,
-    2,
-    3,
-    5,
-    1,
-    1,
-    1,
-    5,
-    4,
-    3,
-    4,
-    2,
-    2,
-    1,
-    3,
+    int(n) for n in (Path(__file__).parent / "puzzle.input").read_text().split(",")
 ]
 
 
-def parse_list_to_dict(ns: list[int]) -> dict[int, int]:
-    result = {}
-    for n in ns:
-        if n not in result:
-            result[n] = 0
-        result[n] += 1
-
-    return result
-
-
 example_input = {1: 1, 2: 1, 3: 2, 4: 1}
 
 
-def tick(fish: dict[int, int], times: int) -> dict[int, int]:
-    current = fish
-    for x in range(1, times + 1):
-        next_fish = {}
-        for n in range(8, -1, -1):
-            if n != 0:
-                next_fish[n - 1] = current.get(n, 0)
-            else:
-                birthing = current.get(0, 0)
-                next_fish[6] += birthing
-                next_fish[8] = next_fish.get(8, 0) + birthing
-
-        current = next_fish
-
-    return current
-
-
 class TestLanternFish(TestCase):
     def test_single_fish_one_tick(self):
         fish = tick({3: 1}, times=1)
@@ -0,0 +1,188 @@
+from collections import deque
+from typing import Optional
+
+from lib import trace
+from lib.profiling import hot_path
+
+hexa_to_binary = {
+    "0": "0000",
+    "1": "0001",
+    "2": "0010",
+    "3": "0011",
+    "4": "0100",
+    "5": "0101",
+    "6": "0110",
+    "7": "0111",
+    "8": "1000",
+    "9": "1001",
+    "A": "1010",
+    "B": "1011",
+    "C": "1100",
+    "D": "1101",
+    "E": "1110",
+    "F": "1111",
+}
+
+
+def to_binary(hexadecimal: str) -> str:
+    return "".join([hexa_to_binary[c] for c in list(hexadecimal)])
+
+
+class Packet:
+    LITERAL_TYPE = 4
+
+    @hot_path
+    def __init__(self, source: str, starting_pointer: int = 0):
+        self.version_sum = 0
+        self.pointer = starting_pointer
+        self.version = int(source[self.pointer : self.pointer + 3], 2)
+        self.version_sum += self.version
+        self.type_id = int(source[self.pointer + 3 : self.pointer + 6], 2)
+        trace.debug("reading packet with type %s", self.type_id)
+        self.inner_packets: list[Packet] = []
+        self.literal_value: Optional[int] = None
+        if self.type_id == Packet.LITERAL_TYPE:
+            self.pointer += 6
+            binary_number = ""
+            # read groups of five bits until one of them starts with 0 instead of 1
+            group = None
+            while group is None or group.startswith("1"):
+                group = source[self.pointer : self.pointer + 5]
+                binary_number += group[1:]
+                self.pointer += 5
+
+            self.literal_value = int(binary_number, 2)
+            trace.debug(
+                "read literal value %s and ended at pointer position %s",
+                self.literal_value,
+                self.pointer,
+            )
+            return
+        else:
+            # it is an operator
+            # an operator packet contains one or more sub packets
+            self.length_type_id = int(
+                source[starting_pointer + 6 : starting_pointer + 7], 2
+            )
+            if self.length_type_id == 0:
+                bits_for_subpacket_length = 15
+                self.subpacket_length = int(
+                    source[
+                        (starting_pointer + 7) : (
+                            starting_pointer + 7 + bits_for_subpacket_length
+                        )
+                    ],
+                    2,
+                )
+
+                self.pointer = starting_pointer + 7 + bits_for_subpacket_length
+                # so the next `subpacket_length` bits contain one or more packets
+                operator_ends_at = self.pointer + self.subpacket_length
+                trace.debug("operator ends at %s", operator_ends_at)
+                while self.pointer < operator_ends_at - 1:
+                    trace.debug("pointer is currently %s", self.pointer)
+                    self.inner_packets.append(Packet(source, self.pointer))
+                    self.pointer = self.inner_packets[-1].pointer
+            else:
+                bits_for_subpacket_length = 11
+                self.subpacket_length = int(
+                    source[
+                        starting_pointer
+                        + 7 : (starting_pointer + 7 + bits_for_subpacket_length)
+                    ],
+                    2,
+                )
+                self.pointer = starting_pointer + 7 + bits_for_subpacket_length
+                # so the operator contains `subpacket_length` number of packets
+                for _ in range(self.subpacket_length):
+                    trace.debug("pointer is currently %s", self.pointer)
+                    self.inner_packets.append(Packet(source, self.pointer))
+                    self.pointer = self.inner_packets[-1].pointer
+
+            if self.type_id == 0:
+                self.literal_value = sum(
+                    [
+                        p.literal_value
+                        for p in self.inner_packets
+                        if p.literal_value is not None
+                    ]
+                )
+                trace.debug(
+                    "read sum operator with literal value %s", self.literal_value
+                )
+
+            if self.type_id == 1:
+                for p in [
+                    ip for ip in self.inner_packets if ip.literal_value is not None
+                ]:
+                    if self.literal_value is None:
+                        self.literal_value = p.literal_value
+                    else:
+                        self.literal_value *= p.literal_value
+                trace.debug(
+                    "read product operator with literal value %s", self.literal_value
+                )
+
+            if self.type_id == 2:
+                literal_values = [
+                    ip.literal_value
+                    for ip in self.inner_packets
+                    if ip.literal_value is not None
+                ]
+                self.literal_value = (
+                    min(literal_values) if len(literal_values) > 0 else None
+                )
+
+            if self.type_id == 3:
+                literal_values = [
+                    ip.literal_value
+                    for ip in self.inner_packets
+                    if ip.literal_value is not None
+                ]
+                self.literal_value = (
+                    max(literal_values) if len(literal_values) > 0 else None
+                )
+
+            if self.type_id == 5:
+                self.literal_value = (
+                    1
+                    if self.inner_packets[0].literal_value
+                    > self.inner_packets[1].literal_value
+                    else 0
+                )
+
+            if self.type_id == 6:
+                self.literal_value = (
+                    1
+                    if self.inner_packets[0].literal_value
+                    < self.inner_packets[1].literal_value
+                    else 0
+                )
+
+            if self.type_id == 7:
+                self.literal_value = (
+                    1
+                    if self.inner_packets[0].literal_value
+                    == self.inner_packets[1].literal_value
+                    else 0
+                )
+
+            q = deque()
+            for p in self.inner_packets:
+                q.append(p)
+
+            while q:
+                current = q.popleft()
+                self.version_sum += current.version
+                for ip in current.inner_packets:
+                    q.append(ip)
+
+    @staticmethod
+    def _next_multiple_of_four(start_pointer: int) -> int:
+        n = start_pointer
+        is_multiple_of_four = n % 4 == 0
+        while not is_multiple_of_four:
+            n += 1
+            is_multiple_of_four = n % 4 == 0
+
+        return n
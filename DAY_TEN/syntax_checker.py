@@ -0,0 +1,84 @@
+from dataclasses import dataclass
+from typing import Optional
+
+chunk_delimiters = {"{": "}", "[": "]", "<": ">", "(": ")"}
+
+valid_opening_characters = list(chunk_delimiters.keys())
+
+readable_characters = valid_opening_characters + list(chunk_delimiters.values())
+
+error_points = {
+    ")": 3,
+    "]": 57,
+    "}": 1197,
+    ">": 25137,
+}
+
+fix_points = {
+    ")": 1,
+    "]": 2,
+    "}": 3,
+    ">": 4,
+}
+
+
+@dataclass
+class SyntaxCheckResult:
+    is_valid: bool
+    expected_character: Optional[str] = None
+    illegal_character: Optional[str] = None
+    needed_closing_characters: Optional[list[str]] = None
+
+
+def is_valid_line(line: str) -> SyntaxCheckResult:
+    chunk_opening_stack: list[str] = []
+    for char in line:
+        if char in readable_characters:
+            if char in valid_opening_characters:
+                chunk_opening_stack.append(char)
+            else:
+                expected_closing_character = (
+                    chunk_delimiters[chunk_opening_stack.pop()]
+                    if chunk_opening_stack
+                    else None
+                )
+                if char != expected_closing_character:
+                    return SyntaxCheckResult(
+                        is_valid=False,
+                        expected_character=expected_closing_character,
+                        illegal_character=char,
+                    )
+
+    if chunk_opening_stack:
+        closers = list(
+            reversed([chunk_delimiters[char] for char in chunk_opening_stack])
+        )
+
+        return SyntaxCheckResult(
+            is_valid=True,
+            expected_character="incomplete",
+            illegal_character="incomplete",
+            needed_closing_characters=closers,
+        )
+
+    return SyntaxCheckResult(is_valid=True)
+
+
+def syntax_check(
+    lines: str,
+) -> (list[SyntaxCheckResult], list[SyntaxCheckResult], int, list[int]):
+    results = [is_valid_line(chunk) for chunk in lines.splitlines()]
+    corrupt_lines = [chunk for chunk in results if not chunk.is_valid]
+    score = sum([error_points[c.illegal_character] for c in corrupt_lines])
+    incomplete_lines = [
+        chunk for chunk in results if chunk.illegal_character == "incomplete"
+    ]
+
+    fix_scores = []
+    for incomplete_line in incomplete_lines:
+        fix_scores.append(0)
+        for closer in incomplete_line.needed_closing_characters:
+            fix_scores[-1] *= 5
+            fix_scores[-1] += fix_points[closer]
+
+    return incomplete_lines, corrupt_lines, score, fix_scores
@@ -0,0 +1,81 @@
+from typing import Iterable
+
+
+def get_grid_from(instructions: str) -> dict[int, dict[int, bool]]:
+    return parse_dots(instructions.split("\n\n")[0].splitlines())
+
+
+def parse_dots(dots: Iterable[str]) -> dict[int, dict[int, bool]]:
+    # assume lookup speed is going to matter
+    grid: dict[int, dict[int, bool]] = {}
+    for line in dots:
+        [x, y] = line.split(",")
+        x = int(x)
+        y = int(y)
+        if y not in grid:
+            grid[y] = {}
+        grid[y][x] = True
+
+    return grid
+
+
+def get_folds_from(instructions: str) -> list[tuple[str, int]]:
+    return parse_folds(instructions.split("\n\n")[1].splitlines())
+
+
+def parse_folds(folds: Iterable[str]) -> list[tuple[str, int]]:
+    return [
+        (instruction[0], int(instruction[1]))
+        for instruction in [tuple(pair.split("=")) for pair in [s[11:] for s in folds]]
+    ]
+
+
+def fold_grid(
+    grid: dict[int, dict[int, bool]], fold: tuple[str, int]
+) -> dict[int, dict[int, bool]]:
+    if fold[0] == "y":
+        new_grid: dict[int, dict[int, bool]] = {}
+
+        for y, row in grid.items():
+            diff = y - fold[1]
+            if diff > 0:
+                target_y = fold[1] - diff
+            else:
+                target_y = y
+
+            for x, item in row.items():
+                if target_y not in new_grid:
+                    new_grid[target_y] = {}
+                new_grid[target_y][x] = item
+
+        return new_grid
+
+    else:
+        new_grid: dict[int, dict[int, bool]] = {}
+        for y, row in grid.items():
+            for x, item in row.items():
+                diff = fold[1] - x
+                if diff < 0:  # point is to right of fold
+                    target_x = fold[1] + diff
+                else:
+                    target_x = x
+
+                if y not in new_grid:
+                    new_grid[y] = {}
+                new_grid[y][target_x] = item
+
+        return new_grid
+
+
+def draw_grid(grid: dict[int, dict[int, bool]]) -> str:
+    max_y = max(grid.keys())
+    max_x = 0
+    for row in grid.values():
+        row_max_x = max(row.keys())
+        max_x = max(max_x, row_max_x)
+    drawing = ""
+    for y in range(max_y + 1):
+        for x in range(max_x + 1):
+            drawing += "#" if grid.get(y, {}).get(x, False) else "."
+        drawing += "\n"
+    return drawing
@@ -0,0 +1,148 @@
+import random
+from typing import Callable, Iterator, Sequence
+
+from lib import backends
+
+
+def as_columns(rows: Iterator[str]) -> Iterator[list[int]]:
+    columns: list[list[int]] = []
+    for row in rows:
+        for index, c in enumerate(list(row.strip())):
+            try:
+                columns[index].append(int(c))
+            except IndexError:
+                columns.append([int(c)])
+
+    for column in columns:
+        yield column
+
+
+def count_bits(columns: Iterator[list[int]]) -> dict[int, dict[int]]:
+    grouped = {}
+    for index, column in enumerate(columns):
+        grouped[index] = {0: 0, 1: 0}
+        for bit in column:
+            if bit in grouped[index]:
+                grouped[index][bit] += 1
+            else:
+                grouped[index][bit] = 1
+
+    return grouped
+
+
+def to_most_common_bits(counted_bits: dict[int, dict[int]]) -> list[int]:
+    rates = []
+    for column_count in counted_bits.values():
+        rates.append(0 if column_count[0] > column_count[1] else 1)
+
+    return rates
+
+
+def to_least_common_bits(counted_bits: dict[int, dict[int]]) -> list[int]:
+    rates = []
+    for column_count in counted_bits.values():
+        rates.append(1 if column_count[0] > column_count[1] else 0)
+
+    return rates
+
+
+def as_epsilon(bits: list[int]) -> list[int]:
+    return [1 if x == 0 else 0 for x in bits]
+
+
+def to_number(bits):
+    return int("".join([str(i) for i in bits]), 2)
+
+
+def get_rating(
+    diagnostic_input: list[str],
+    bit_comparison: Callable[[dict[int, dict[int]]], list[int]],
+) -> int:
+    candidates = diagnostic_input
+
+    column_index = 0
+    while len(candidates) != 1 and column_index <= len(candidates[0]):
+        compared = bit_comparison(count_bits(as_columns(iter(candidates))))
+
+        candidates = [
+            c
+            for c in candidates
+            if list(c)[column_index] == str(compared[column_index])
+        ]
+        column_index += 1
+
+    return to_number(candidates[0])
+
+
+def get_o2_rating(diagnostic_input: list[str]) -> int:
+    return get_rating(diagnostic_input, to_most_common_bits)
+
+
+def get_co2_scrubber_rating(diagnostic_input: list[str]) -> int:
+    return get_rating(diagnostic_input, to_least_common_bits)
+
+
+def count_ones(values: Sequence[int], width: int) -> list[int]:
+    """how many of the width bit numbers have each bit set, most significant first"""
+    return [
+        sum((value >> bit) & 1 for value in values) for bit in reversed(range(width))
+    ]
+
+
+def power_consumption_from(ones: list[int], rows: int) -> int:
+    gamma = 0
+    for count in ones:
+        gamma = gamma << 1 | (count >= rows - count)
+    epsilon = ~gamma & ((1 << len(ones)) - 1)
+    return gamma * epsilon
+
+
+def power_consumption(values: Sequence[int], width: int) -> int:
+    """gamma times epsilon for report rows already read as width bit numbers"""
+    return power_consumption_from(count_ones(values, width), len(values))
+
+
+def rating(values: Sequence[int], width: int, keep_most_common: bool) -> int:
+    """get_rating for report rows already read as width bit numbers"""
+    candidates = list(values)
+    for bit in reversed(range(width)):
+        if len(candidates) == 1:
+            break
+        ones = sum((value >> bit) & 1 for value in candidates)
+        zeros = len(candidates) - ones
+        wanted = ones >= zeros if keep_most_common else zeros > ones
+        candidates = [value for value in candidates if (value >> bit) & 1 == wanted]
+    return candidates[0]
+
+
+def life_support_rating(values: Sequence[int], width: int) -> int:
+    return rating(values, width, True) * rating(values, width, False)
+
+
+def _random_report(rng: random.Random, size: int) -> tuple[list[int], int]:
+    width = rng.randint(1, 16)
+    return [rng.getrandbits(width) for _ in range(size + 1)], width
+
+
+ones_per_bit = backends.operation("DAY_THREE.count_ones", count_ones, _random_report)
+
+
+@ones_per_bit.implementation("numpy", min_size=200, requires="numpy")
+def _count_ones_numpy(values: Sequence[int], width: int) -> list[int]:
+    import numpy as np
+
+    rows = np.asarray(values, dtype=np.uint64)
+    return [
+        int(((rows >> np.uint64(bit)) & np.uint64(1)).sum())
+        for bit in reversed(range(width))
+    ]
+
+
+@ones_per_bit.implementation(backends.parallel, min_size=500_000)
+def _count_ones_parallel(values: Sequence[int], width: int) -> list[int]:
+    step = -(-len(values) // backends.worker_count())
+    chunks = [
+        (list(values[start : start + step]), width)
+        for start in range(0, len(values), step)
+    ]
+    return [sum(column) for column in zip(*backends.parallel_map(count_ones, chunks))]
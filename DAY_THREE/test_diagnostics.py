@@ -1,7 +1,19 @@
 from pathlib import Path
-from typing import Iterator, Callable
 from unittest import TestCase
 
+from DAY_THREE.diagnostics import (
+    as_columns,
+    as_epsilon,
+    count_bits,
+    get_co2_scrubber_rating,
+    get_o2_rating,
+    life_support_rating,
+    power_consumption,
+    to_most_common_bits,
+    to_number,
+)
+from lib.puzzle_input import read_lines
+
 puzzle_input_path = Path(__file__).parent / "./puzzle.input"
 
 example_input = """00100
@@ -18,84 +30,6 @@ example_input = """00100
 01010"""
 
 
-def as_columns(rows: Iterator[str]) -> Iterator[list[int]]:
-    columns: list[list[int]] = []
-    for row in rows:
-        for index, c in enumerate(list(row.strip())):
-            try:
-                columns[index].append(int(c))
-            except IndexError:
-                columns.append([int(c)])
-
-    for column in columns:
-        yield column
-
-
-def count_bits(columns: Iterator[list[int]]) -> dict[int, dict[int]]:
-    grouped = {}
-    for index, column in enumerate(columns):
-        grouped[index] = {0: 0, 1: 0}
-        for bit in column:
-            if bit in grouped[index]:
-                grouped[index][bit] += 1
-            else:
-                grouped[index][bit] = 1
-
-    return grouped
-
-
-def to_most_common_bits(counted_bits: dict[int, dict[int]]) -> list[int]:
-    rates = []
-    for column_count in counted_bits.values():
-        rates.append(0 if column_count[0] > column_count[1] else 1)
-
-    return rates
-
-
-def to_least_common_bits(counted_bits: dict[int, dict[int]]) -> list[int]:
-    rates = []
-    for column_count in counted_bits.values():
-        rates.append(1 if column_count[0] > column_count[1] else 0)
-
-    return rates
-
-
-def as_epsilon(bits: list[int]) -> list[int]:
-    return [1 if x == 0 else 0 for x in bits]
-
-
-def to_number(bits):
-    return int("".join([str(i) for i in bits]), 2)
-
-
-def get_rating(
-    diagnostic_input: list[str],
-    bit_comparison: Callable[[dict[int, dict[int]]], list[int]],
-) -> int:
-    candidates = diagnostic_input
-
-    column_index = 0
-    while len(candidates) != 1 and column_index <= len(candidates[0]):
-        compared = bit_comparison(count_bits(as_columns(iter(candidates))))
-
-        candidates = [
-            c
-            for c in candidates
-            if list(c)[column_index] == str(compared[column_index])
-        ]
-        column_index += 1
-
-    return to_number(candidates[0])
-
-
-def get_o2_rating(diagnostic_input: list[str]) -> int:
-    return get_rating(diagnostic_input, to_most_common_bits)
-
-
-def get_co2_scrubber_rating(diagnostic_input: list[str]) -> int:
-    return get_rating(diagnostic_input, to_least_common_bits)
-
-
 class TestDiagnotics(TestCase):
     def test_read_as_columns(self):
         columns = [c for c in as_columns(iter(example_input.splitlines()))]
@@ -122,12 +56,13 @@ class TestDiagnotics(TestCase):
         assert 9 == to_number(epsilon_bits)
 
     def test_solve_part_one(self):
-        with open(puzzle_input_path, "r", newline="\n") as f:
-            bits = to_most_common_bits(count_bits(as_columns(iter(f.readlines()))))
-            gamma = to_number(bits)
-            epsilon = to_number(as_epsilon(bits))
-            power_consumption = gamma * epsilon
-            assert power_consumption == 3847100
+        bits = to_most_common_bits(
+            count_bits(as_columns(read_lines(puzzle_input_path)))
+        )
+        gamma = to_number(bits)
+        epsilon = to_number(as_epsilon(bits))
+        power_consumption = gamma * epsilon
+        assert power_consumption == 3847100
 
     def test_most_common_is_one_if_equal_number_of_bits(self):
         most_common_bits = to_most_common_bits(count_bits(as_columns(iter(["0", "1"]))))
@@ -155,9 +90,23 @@ class TestDiagnotics(TestCase):
         assert rating == 10
 
     def test_solve_part_two(self):
-        with open(puzzle_input_path, "r", newline="\n") as f:
-            lines = f.readlines()
-            o2_rating = get_o2_rating(lines)
-            co2_rating = get_co2_scrubber_rating(lines)
-
-            assert o2_rating * co2_rating == 4105235
+        lines = list(read_lines(puzzle_input_path))
+        o2_rating = get_o2_rating(lines)
+        co2_rating = get_co2_scrubber_rating(lines)
+
+        assert o2_rating * co2_rating == 4105235
+
+    def test_numeric_rows_give_the_same_ratings(self):
+        for lines in [
+            example_input.splitlines(),
+            [line for line in read_lines(puzzle_input_path) if line],
+        ]:
+            values = [int(line, 2) for line in lines]
+            width = len(lines[0])
+            bits = to_most_common_bits(count_bits(as_columns(iter(lines))))
+            assert power_consumption(values, width) == to_number(bits) * to_number(
+                as_epsilon(bits)
+            )
+            assert life_support_rating(values, width) == get_o2_rating(
+                lines
+            ) * get_co2_scrubber_rating(lines)
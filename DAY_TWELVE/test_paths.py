@@ -1,93 +1,9 @@
-from collections import Counter
+from pathlib import Path
 from unittest import TestCase
 
+from DAY_TWELVE.paths import CaveSystem, CaveSystemPartTwo
 
-class CaveSystem:
-    def __init__(self, cave_description: str):
-        self.paths = []
-        self.cave_description = cave_description
-        self.visited = {}
-        self.links: dict[str, list[str]] = {}
-
-        for p in self.cave_description.splitlines():
-            start: str
-            end: str
-            start, end = p.split("-")
-            start = start.strip()
-            end = end.strip()
-            if start not in self.links:
-                self.links[start] = []
-            if end not in self.links:
-                self.links[end] = []
-
-            self.links[start].append(end)
-            self.links[end].append(start)
-
-        self.paths = self.explore_caves("start", "end", [])
-
-    def explore_caves(self, start: str, end: str, path: list[str]) -> list[list[str]]:
-        path = path + [start]
-        if start == end:
-            return [path]
-
-        paths = []
-        for node in self.links.get(start, []):
-            if node.isupper() or node not in path:
-                new_paths = self.explore_caves(node, end, path)
-                for new_path in new_paths:
-                    paths.append(new_path)
-
-        return paths
-
-
-class CaveSystemPartTwo:
-    def __init__(self, cave_description: str):
-        self.paths = []
-        self.cave_description = cave_description
-        self.visited = {}
-        self.links: dict[str, list[str]] = {}
-
-        for p in self.cave_description.splitlines():
-            start: str
-            end: str
-            start, end = p.split("-")
-            start = start.strip()
-            end = end.strip()
-            if start not in self.links:
-                self.links[start] = []
-            if end not in self.links:
-                self.links[end] = []
-
-            self.links[start].append(end)
-            self.links[end].append(start)
-
-        self.paths = self.explore_caves("start", "end", [])
-
-    def explore_caves(self, start: str, end: str, path: list[str]) -> list[list[str]]:
-        path = path + [start]
-        if start == end:
-            return [path]
-
-        paths = []
-        for node in self.links.get(start, []):
-            if self.can_visit(node, path):
-                new_paths = self.explore_caves(node, end, path)
-                for new_path in new_paths:
-                    paths.append(new_path)
-
-        return paths
-
-    def can_visit(self, node, path):
-        isupper = node.isupper()
-        not_in_path = node not in path
-        not_in_start_end_ = node not in ["start", "end"]
-        nothing_in_path_twice = (
-            max(Counter([p for p in path if p.islower()]).values()) < 2
-        )
-        can_visit = (
-            isupper or not_in_path or (not_in_start_end_ and nothing_in_path_twice)
-        )
-        return can_visit
+puzzle_input = (Path(__file__).parent / "puzzle.input").read_text()
 
 
 class TestPaths(TestCase):
@@ -196,37 +112,7 @@ kj-dc"""
         )
 
     def test_puzzle_input(self):
-        assert (
-            len(
-                CaveSystem(
-                    """start-qs
-                                                                        qs-jz
-                                                                        start-lm
-                                                                        qb-QV
-                                                                        QV-dr
-                                                                        QV-end
-                                                                        ni-qb
-                                                                        VH-jz
-                                                                        qs-lm
-                                                                        qb-end
-                                                                        dr-fu
-                                                                        jz-lm
-                                                                        start-VH
-                                                                        QV-jz
-                                                                        VH-qs
-                                                                        lm-dr
-                                                                        dr-ni
-                                                                        ni-jz
-                                                                        lm-QV
-                                                                        jz-dr
-                                                                        ni-end
-                                                                        VH-dr
-                                                                        VH-ni
-                                                                        qb-HE"""
-                ).paths
-            )
-            == 5178
-        )
+        assert len(CaveSystem(puzzle_input).paths) == 5178
 
     def test_example_paths_part_two(self):
         cave_system = CaveSystemPartTwo(
@@ -281,31 +167,6 @@ b-end"""
         )
 
     def test_puzzle_input_paths_part_two(self):
-        cave_system = CaveSystemPartTwo(
-            """start-qs
-                                                        qs-jz
-                                                        start-lm
-                                                        qb-QV
-                                                        QV-dr
-                                                        QV-end
-                                                        ni-qb
-                                                        VH-jz
-                                                        qs-lm
-                                                        qb-end
-                                                        dr-fu
-                                                        jz-lm
-                                                        start-VH
-                                                        QV-jz
-                                                        VH-qs
-                                                        lm-dr
-                                                        dr-ni
-                                                        ni-jz
-                                                        lm-QV
-                                                        jz-dr
-                                                        ni-end
-                                                        VH-dr
-                                                        VH-ni
-                                                        qb-HE"""
-        )
+        cave_system = CaveSystemPartTwo(puzzle_input)
 
         assert len(cave_system.paths) == 130094
@@ -0,0 +1,123 @@
+import dataclasses
+from dataclasses import dataclass
+from typing import Iterator
+
+from lib import trace
+from lib.profiling import hot_path
+
+
+@dataclass(frozen=True)
+class Player:
+    score: int
+    position: int
+    player_index: int
+
+    @hot_path
+    def roll_for(self, player_index: int, roll: int) -> "Player":
+        if player_index != self.player_index:
+            trace.debug(
+                "this roll is not for player %s. Returning a clone",
+                self.player_index + 1,
+            )
+            return dataclasses.replace(self)
+        else:
+            new_position = track(starting_at=self.position, steps=roll)
+            player = Player(
+                score=self.score + new_position,
+                position=new_position,
+                player_index=self.player_index,
+            )
+            trace.debug(
+                """
+            player %s taking a turn
+            starting with %s
+            having rolled %s
+            ends at %s
+            """,
+                self.player_index + 1,
+                self,
+                roll,
+                player,
+            )
+            return player
+
+    def __str__(self):
+        return f"score {self.score} at position {self.position}"
+
+
+@hot_path
+def roll_deterministic_dice() -> Iterator[int]:
+    i = 0
+    while True:
+        i += 1
+        if i > 100:
+            i = 1
+
+        trace.debug("die rolled %s", i)
+        yield i
+
+
+def player_order_generator() -> Iterator[int]:
+    next_player = 1
+    while True:
+        next_player = 0 if next_player == 1 else 1
+        yield next_player
+
+
+@dataclass(frozen=True)
+class Game:
+    players: tuple[Player, Player]
+    die: Iterator[int] = dataclasses.field(
+        default=roll_deterministic_dice(), compare=False
+    )
+    player_order: Iterator[int] = dataclasses.field(
+        default=player_order_generator(), compare=False
+    )
+
+    def take_next_turn(self) -> "Game":
+        roll_total = roll_three_times(self.die)
+
+        player_index = next(self.player_order)
+
+        return Game(
+            (
+                self.players[0].roll_for(player_index, roll_total),
+                self.players[1].roll_for(player_index, roll_total),
+            ),
+            die=self.die,
+            player_order=self.player_order,
+        )
+
+    @staticmethod
+    def play_to(
+        game: "Game", finishing_score: int
+    ) -> tuple[int, tuple[Player, Player]]:
+        number_of_turns: int = 0
+        while (
+            game.players[0].score < finishing_score
+            and game.players[1].score < finishing_score
+        ):
+            number_of_turns += 3
+            game = game.take_next_turn()
+
+        return number_of_turns, game.players
+
+    @staticmethod
+    def parse(game_starting_description: str) -> "Game":
+        (player_one, player_two) = [
+            int(s[-1]) for s in game_starting_description.split("\n")
+        ]
+        return Game(
+            players=(Player(0, player_one, 0), Player(0, player_two, 1)),
+            die=roll_deterministic_dice(),
+            player_order=player_order_generator(),
+        )
+
+
+def roll_three_times(die: Iterator[int]) -> int:
+    return sum([next(die), next(die), next(die)])
+
+
+def track(starting_at: int, steps: int) -> int:
+    next_on_track = (starting_at + steps) % 10
+    return 10 if next_on_track == 0 else next_on_track
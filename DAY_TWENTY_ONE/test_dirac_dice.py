@@ -1,126 +1,20 @@
-import dataclasses
-import logging
-from dataclasses import dataclass
-from typing import Iterator
+from pathlib import Path
 from unittest import TestCase
 
-puzzle_input = """Player 1 starting position: 1
-Player 2 starting position: 3"""
+from DAY_TWENTY_ONE.dirac_dice import (
+    Game,
+    Player,
+    player_order_generator,
+    roll_deterministic_dice,
+    track,
+)
+
+puzzle_input = (Path(__file__).parent / "puzzle.input").read_text()
 
 example_input = """Player 1 starting position: 4
 Player 2 starting position: 8"""
 
 
-@dataclass(frozen=True)
-class Player:
-    score: int
-    position: int
-    player_index: int
-
-    def roll_for(self, player_index: int, roll: int) -> "Player":
-        if player_index != self.player_index:
-            logging.debug(
-                f"this roll is not for player {self.player_index + 1}. Returning a clone"
-            )
-            return dataclasses.replace(self)
-        else:
-            new_position = track(starting_at=self.position, steps=roll)
-            player = Player(
-                score=self.score + new_position,
-                position=new_position,
-                player_index=self.player_index,
-            )
-            logging.debug(
-                f"""
-            player {self.player_index + 1} taking a turn
-            starting with {self}
-            having rolled {roll}
-            ends at {player}
-            """
-            )
-            return player
-
-    def __str__(self):
-        return f"score {self.score} at position {self.position}"
-
-
-def roll_deterministic_dice() -> Iterator[int]:
-    i = 0
-    while True:
-        i += 1
-        if i > 100:
-            i = 1
-
-        logging.debug(f"die rolled {i}")
-        yield i
-
-
-def player_order_generator() -> Iterator[int]:
-    next_player = 1
-    while True:
-        next_player = 0 if next_player == 1 else 1
-        yield next_player
-
-
-@dataclass(frozen=True)
-class Game:
-    players: tuple[Player, Player]
-    die: Iterator[int] = dataclasses.field(
-        default=roll_deterministic_dice(), compare=False
-    )
-    player_order: Iterator[int] = dataclasses.field(
-        default=player_order_generator(), compare=False
-    )
-
-    def take_next_turn(self) -> "Game":
-        roll_total = roll_three_times(self.die)
-
-        player_index = next(self.player_order)
-
-        return Game(
-            (
-                self.players[0].roll_for(player_index, roll_total),
-                self.players[1].roll_for(player_index, roll_total),
-            ),
-            die=self.die,
-            player_order=self.player_order,
-        )
-
-    @staticmethod
-    def play_to(
-        game: "Game", finishing_score: int
-    ) -> tuple[int, tuple[Player, Player]]:
-        number_of_turns: int = 0
-        while (
-            game.players[0].score < finishing_score
-            and game.players[1].score < finishing_score
-        ):
-            number_of_turns += 3
-            game = game.take_next_turn()
-
-        return number_of_turns, game.players
-
-    @staticmethod
-    def parse(game_starting_description: str) -> "Game":
-        (player_one, player_two) = [
-            int(s[-1]) for s in game_starting_description.split("\n")
-        ]
-        return Game(
-            players=(Player(0, player_one, 0), Player(0, player_two, 1)),
-            die=roll_deterministic_dice(),
-            player_order=player_order_generator(),
-        )
-
-
-def roll_three_times(die: Iterator[int]) -> int:
-    return sum([next(die), next(die), next(die)])
-
-
-def track(starting_at: int, steps: int) -> int:
-    next_on_track = (starting_at + steps) % 10
-    return 10 if next_on_track == 0 else next_on_track
-
-
 class TestDiracDice(TestCase):
     def test_yield_one_to_a_hundred_and_then_wrap(self):
         expected = [
@@ -0,0 +1,122 @@
+import dataclasses
+from array import array
+from itertools import accumulate, compress, islice
+from operator import mul
+from typing import Iterable, Iterator, Union
+
+
+@dataclasses.dataclass
+class Position:
+    horizontal: int = 0
+    depth: int = 0
+
+    def move(self, instruction: str):
+        parts = instruction.split(" ")
+        if parts[0] == "forward":
+            self.horizontal += int(parts[1])
+        if parts[0] == "down":
+            self.depth += int(parts[1])
+        if parts[0] == "up":
+            self.depth -= int(parts[1])
+        return self
+
+    @staticmethod
+    def follow_instructions(instructions: Iterator[str]):
+        position = Position()
+        for instruction in iter(instructions):
+            position = position.move(instruction)
+        return position
+
+
+@dataclasses.dataclass
+class PartTwoPosition:
+    horizontal: int = 0
+    depth: int = 0
+    aim: int = 0
+
+    def move(self, instruction: str):
+        parts = instruction.split(" ")
+        if parts[0] == "forward":
+            self.horizontal += int(parts[1])
+            self.depth += int(parts[1]) * self.aim
+        if parts[0] == "down":
+            self.aim += int(parts[1])
+        if parts[0] == "up":
+            self.aim -= int(parts[1])
+
+        return self
+
+    @staticmethod
+    def follow_instructions(instructions: Iterator[str]):
+        position = PartTwoPosition()
+        for instruction in iter(instructions):
+            position = position.move(instruction)
+        return position
+
+
+FORWARD, DOWN, UP = 0, 1, 2
+opcodes = {"forward": FORWARD, "down": DOWN, "up": UP}
+# bytes.translate tables from an opcode to a flag or a sign, as bytes
+_is_forward = bytes([1, 0, 0]) + bytes(253)
+_aim_sign = bytes([0, 1, 0xFF]) + bytes(253)
+# how many lines are tokenised at a time
+_batch = 1 << 16
+
+Buffer = Union[array, memoryview]
+
+
+@dataclasses.dataclass(frozen=True)
+class Program:
+    """
+    an instruction stream tokenised once into an opcode and an operand per
+    command, which both parts' rules can be run over as often as needed.
+    running it never goes back to the text, or round a python loop per
+    command: flags and signs are made by translating the opcodes as bytes,
+    and sums and running totals come from itertools in C
+    """
+
+    opcodes: Buffer
+    operands: Buffer
+
+    @classmethod
+    def compile(cls, instructions: Iterable[str]) -> "Program":
+        codes = array("b")
+        operands = array("i")
+        lines = iter(instructions)
+        while batch := list(islice(lines, _batch)):
+            tokens = " ".join(batch).split()
+            if len(tokens) % 2:
+                raise ValueError("a command is missing its distance")
+            try:
+                codes.extend(map(opcodes.__getitem__, tokens[0::2]))
+            except KeyError as e:
+                raise ValueError(f"{e.args[0]!r} is not a command") from None
+            operands.extend(map(int, tokens[1::2]))
+        return cls(codes, operands)
+
+    def _forward(self) -> bytes:
+        return bytes(self.opcodes).translate(_is_forward)
+
+    def _aim_changes(self) -> Iterator[int]:
+        signs = array("b")
+        signs.frombytes(bytes(self.opcodes).translate(_aim_sign))
+        return map(mul, self.operands, signs)
+
+    def run(self) -> Position:
+        """follows the commands the way Position does"""
+        return Position(
+            horizontal=sum(compress(self.operands, self._forward())),
+            depth=sum(self._aim_changes()),
+        )
+
+    def run_with_aim(self) -> PartTwoPosition:
+        """follows the commands the way PartTwoPosition does"""
+        forward = self._forward()
+        aims = accumulate(self._aim_changes())
+        return PartTwoPosition(
+            horizontal=sum(compress(self.operands, forward)),
+            depth=sum(
+                map(mul, compress(self.operands, forward), compress(aims, forward))
+            ),
+            aim=sum(self._aim_changes()),
+        )
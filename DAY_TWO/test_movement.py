@@ -1,7 +1,11 @@
-import dataclasses
+import random
+from array import array
 from pathlib import Path
-from typing import Iterator
-from unittest import TestCase
+from unittest import TestCase, mock
+
+from DAY_TWO import movement
+from DAY_TWO.movement import DOWN, FORWARD, UP, PartTwoPosition, Position, Program
+from lib.puzzle_input import read_lines
 
 puzzle_input_path = Path(__file__).parent / "./part1.input"
 
@@ -13,55 +17,6 @@ down 8
 forward 2"""
 
 
-@dataclasses.dataclass
-class Position:
-    horizontal: int = 0
-    depth: int = 0
-
-    def move(self, instruction: str):
-        parts = instruction.split(" ")
-        if parts[0] == "forward":
-            self.horizontal += int(parts[1])
-        if parts[0] == "down":
-            self.depth += int(parts[1])
-        if parts[0] == "up":
-            self.depth -= int(parts[1])
-        return self
-
-    @staticmethod
-    def follow_instructions(instructions: Iterator[str]):
-        position = Position()
-        for instruction in iter(instructions):
-            position = position.move(instruction)
-        return position
-
-
-@dataclasses.dataclass
-class PartTwoPosition:
-    horizontal: int = 0
-    depth: int = 0
-    aim: int = 0
-
-    def move(self, instruction: str):
-        parts = instruction.split(" ")
-        if parts[0] == "forward":
-            self.horizontal += int(parts[1])
-            self.depth += int(parts[1]) * self.aim
-        if parts[0] == "down":
-            self.aim += int(parts[1])
-        if parts[0] == "up":
-            self.aim -= int(parts[1])
-
-        return self
-
-    @staticmethod
-    def follow_instructions(instructions: Iterator[str]):
-        position = PartTwoPosition()
-        for instruction in iter(instructions):
-            position = position.move(instruction)
-        return position
-
-
 class TestMovementPartTwo(TestCase):
     def test_going_forward(self):
         position = PartTwoPosition().move("forward 5")
@@ -101,9 +56,8 @@ class TestMovementPartTwo(TestCase):
         assert position.horizontal * position.depth == 900
 
     def test_part_one(self):
-        with open(puzzle_input_path, "r", newline="\n") as f:
-            position = PartTwoPosition.follow_instructions(iter(f.readlines()))
-            assert position.horizontal * position.depth == 1176514794
+        position = PartTwoPosition.follow_instructions(read_lines(puzzle_input_path))
+        assert position.horizontal * position.depth == 1176514794
 
 
 class TestMovementPartOne(TestCase):
@@ -128,6 +82,55 @@ class TestMovementPartOne(TestCase):
         assert position.horizontal * position.depth == 150
 
     def test_part_one(self):
-        with open(puzzle_input_path, "r", newline="\n") as f:
-            position = Position.follow_instructions(iter(f.readlines()))
-            assert position.horizontal * position.depth == 1488669
+        position = Position.follow_instructions(read_lines(puzzle_input_path))
+        assert position.horizontal * position.depth == 1488669
+
+
+class TestProgram(TestCase):
+    def test_commands_compile_to_an_opcode_and_operand_each(self):
+        program = Program.compile(example.splitlines())
+        assert program.opcodes.tolist() == [FORWARD, DOWN, FORWARD, UP, DOWN, FORWARD]
+        assert program.operands.tolist() == [5, 5, 8, 3, 8, 2]
+
+    def test_one_program_runs_both_parts(self):
+        program = Program.compile(example.splitlines())
+        assert program.run() == Position(horizontal=15, depth=10)
+        assert program.run_with_aim() == PartTwoPosition(15, 60, 10)
+
+    def test_puzzle_input(self):
+        program = Program.compile(read_lines(puzzle_input_path))
+        assert program.run() == Position.follow_instructions(
+            read_lines(puzzle_input_path)
+        )
+        assert program.run_with_aim() == PartTwoPosition.follow_instructions(
+            read_lines(puzzle_input_path)
+        )
+
+    def test_compiles_in_batches(self):
+        rng = random.Random(2)
+        commands = [
+            f"{rng.choice(['forward', 'down', 'up'])} {rng.randint(0, 99)}"
+            for _ in range(1000)
+        ]
+        with mock.patch.object(movement, "_batch", 7):
+            program = Program.compile(commands)
+        assert program.run_with_aim() == PartTwoPosition.follow_instructions(commands)
+
+    def test_runs_over_mapped_columns(self):
+        compiled = Program.compile(example.splitlines())
+        program = Program(
+            memoryview(compiled.opcodes.tobytes()).cast("b"),
+            memoryview(compiled.operands.tobytes()).cast("i"),
+        )
+        assert program.run_with_aim() == compiled.run_with_aim()
+
+    def test_unknown_commands_are_an_error(self):
+        with self.assertRaises(ValueError):
+            Program.compile(["forward 5", "backward 2"])
+        with self.assertRaises(ValueError):
+            Program.compile(["forward 5", "down"])
+
+    def test_an_empty_program_goes_nowhere(self):
+        program = Program(array("b"), array("i"))
+        assert program.run() == Position()
+        assert program.run_with_aim() == PartTwoPosition()
@@ -0,0 +1,248 @@
+import argparse
+import contextlib
+import sys
+from pathlib import Path
+from typing import Optional
+
+from aoc.cache import SolutionCache, default_cache_directory, default_max_bytes
+from aoc.runner import solve
+from aoc.solvers import SOLVERS
+from lib import profiling
+
+
+def _add_cache_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--cache-dir", type=Path, default=default_cache_directory)
+    parser.add_argument("--cache-max-bytes", type=int, default=default_max_bytes)
+
+
+def _cache(args) -> Optional[SolutionCache]:
+    if getattr(args, "no_cache", False):
+        return None
+    return SolutionCache(args.cache_dir, args.cache_max_bytes)
+
+
+def _memory_bytes(args) -> Optional[int]:
+    return args.memory_limit * 1024 * 1024 if args.memory_limit else None
+
+
+def _list(args, parser) -> int:
+    for (day, part), solver in SOLVERS.items():
+        print(f"{day} part {part} (default input {solver.default_input})")
+    return 0
+
+
+def _cache_command(args, parser) -> int:
+    solution_cache = _cache(args)
+    if args.action == "clear":
+        solution_cache.clear()
+    print(solution_cache.stats())
+    return 0
+
+
+def _write_results(args, tasks: list, results) -> int:
+    """
+    runs results with the file named by --output, or stdout, and reports the
+    counts it returns by status on stderr
+    """
+    with contextlib.ExitStack() as stack:
+        output = (
+            stack.enter_context(args.output.open("w")) if args.output else sys.stdout
+        )
+        counts = results(output)
+    print(
+        ", ".join(f"{count} {status}" for status, count in counts.items()),
+        file=sys.stderr,
+    )
+    return 0 if counts["ok"] == len(tasks) else 1
+
+
+def _batch(args, parser) -> int:
+    # the process pool machinery is slow to import and only batches need it
+    from aoc.batch import run_batch, tasks_from_directory, tasks_from_manifest
+
+    if args.source.is_dir():
+        if args.day is None:
+            parser.error("--day is required when batching a directory")
+        tasks = tasks_from_directory(args.source, args.day, args.part)
+    else:
+        tasks = tasks_from_manifest(args.source)
+    return _write_results(
+        args,
+        tasks,
+        lambda output: run_batch(
+            tasks,
+            output,
+            args.workers,
+            args.chunk_size,
+            args.timeout,
+            _cache(args),
+            _memory_bytes(args),
+        ),
+    )
+
+
+def _stream(args, parser) -> int:
+    import asyncio
+
+    from aoc.batch import Task
+    from aoc.ingest import run_pipeline
+
+    tasks = [
+        Task(args.day, part, source) for source in args.sources for part in args.part
+    ]
+    return _write_results(
+        args,
+        tasks,
+        lambda output: asyncio.run(
+            run_pipeline(
+                tasks,
+                output,
+                args.workers,
+                args.readers,
+                args.queue_size,
+                args.timeout,
+                _memory_bytes(args),
+            )
+        ),
+    )
+
+
+def _run(args, parser) -> int:
+    if args.profile or args.profile_output:
+        # has to happen before the day modules are imported, and the answer has
+        # to be worked out rather than read back from the cache
+        profiling.enable()
+        args.no_cache = True
+    memory = None
+    if args.memory:
+        from lib.memory import MemoryTracker
+
+        memory = MemoryTracker(args.memory_top)
+        args.no_cache = True
+    solution_cache = _cache(args)
+    try:
+        # some solvers print as they go, keep stdout for the answer alone
+        with contextlib.redirect_stdout(sys.stderr):
+            solution = solve(args.day, args.part, args.input, solution_cache, memory)
+    except (KeyError, FileNotFoundError) as e:
+        print(e.args[0], file=sys.stderr)
+        return 2
+
+    print(solution.answer)
+    if args.timings or args.memory:
+        print(solution.report(), file=sys.stderr)
+        if solution_cache is not None:
+            print(f"cache: {solution_cache.stats()}", file=sys.stderr)
+    if profiling.enabled:
+        print(profiling.report(), file=sys.stderr)
+        if args.profile_output:
+            profiling.write_collapsed_stacks(args.profile_output)
+    return 0
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m aoc")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="solve one day against one input file")
+    run.add_argument("day", choices=sorted({day for (day, _) in SOLVERS}))
+    run.add_argument("--part", type=int, choices=[1, 2], default=1)
+    run.add_argument("input", type=Path, nargs="?", default=None)
+    run.add_argument(
+        "--timings",
+        action="store_true",
+        help="report parse, solve and format times and peak memory on stderr",
+    )
+    run.add_argument("--no-cache", action="store_true")
+    run.add_argument(
+        "--profile",
+        action="store_true",
+        help="report the counters and timers of the instrumented hot paths on stderr",
+    )
+    run.add_argument(
+        "--profile-output",
+        type=Path,
+        default=None,
+        help="also write the hot paths as collapsed stacks for a flame graph",
+    )
+    run.add_argument(
+        "--memory",
+        action="store_true",
+        help="report each phase's peak traced memory and top allocation sites",
+    )
+    run.add_argument("--memory-top", type=int, default=10, metavar="SITES")
+    _add_cache_arguments(run)
+    run.set_defaults(handler=_run)
+
+    batch = commands.add_parser(
+        "batch", help="solve a directory or manifest of inputs across processes"
+    )
+    batch.add_argument(
+        "source",
+        type=Path,
+        help="a directory of inputs for --day, or a manifest of 'DAY part path' lines",
+    )
+    batch.add_argument("--day", choices=sorted({day for (day, _) in SOLVERS}))
+    batch.add_argument("--part", type=int, nargs="+", choices=[1, 2], default=[1])
+    batch.add_argument("--workers", type=int, default=None)
+    batch.add_argument("--chunk-size", type=int, default=1)
+    batch.add_argument("--timeout", type=float, default=None, help="seconds per task")
+    batch.add_argument(
+        "--memory-limit", type=int, default=None, help="MiB resident per worker"
+    )
+    batch.add_argument("--output", type=Path, default=None, help="defaults to stdout")
+    batch.add_argument("--no-cache", action="store_true")
+    _add_cache_arguments(batch)
+    batch.set_defaults(handler=_batch)
+
+    stream = commands.add_parser(
+        "stream",
+        help="read inputs from files and pipes while earlier ones are being solved",
+    )
+    stream.add_argument(
+        "sources",
+        type=Path,
+        nargs="+",
+        help="input files, FIFOs or - for stdin, all for --day",
+    )
+    stream.add_argument(
+        "--day", required=True, choices=sorted({day for (day, _) in SOLVERS})
+    )
+    stream.add_argument("--part", type=int, nargs="+", choices=[1, 2], default=[1])
+    stream.add_argument("--workers", type=int, default=None)
+    stream.add_argument(
+        "--readers", type=int, default=4, help="inputs read at the same time"
+    )
+    stream.add_argument(
+        "--queue-size",
+        type=int,
+        default=8,
+        help="inputs read and waiting for a worker before reading pauses",
+    )
+    stream.add_argument("--timeout", type=float, default=None, help="seconds per task")
+    stream.add_argument(
+        "--memory-limit", type=int, default=None, help="MiB resident per worker"
+    )
+    stream.add_argument("--output", type=Path, default=None, help="defaults to stdout")
+    stream.set_defaults(handler=_stream)
+
+    cache = commands.add_parser("cache", help="report on or empty the answer cache")
+    cache.add_argument("action", choices=["stats", "clear"])
+    _add_cache_arguments(cache)
+    cache.set_defaults(handler=_cache_command)
+
+    listing = commands.add_parser(
+        "list", help="list every day and part that can be solved"
+    )
+    listing.set_defaults(handler=_list)
+    return parser
+
+
+def main(argv=None) -> int:
+    parser = _parser()
+    args = parser.parse_args(argv)
+    return args.handler(args, parser)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
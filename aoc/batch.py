@@ -0,0 +1,227 @@
+"""
+fans many (day, part, input) tasks out across a process pool and streams one
+JSON line per task as each one finishes
+
+tasks are sent to the workers in chunks so that cheap days are not dominated
+by the cost of pickling work back and forth. every task gets its own timeout
+and memory limit, enforced inside the worker through a lib.budget Budget, so
+one slow or greedy input cannot hold up the rest of its chunk. a task stopped
+by its budget reports how far it got, and one that never reaches a checkpoint
+is stopped by an interval timer `grace_seconds` after its timeout. a SIGTERM
+to a worker cancels the task it is running the same way
+"""
+
+import contextlib
+import json
+import os
+import signal
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Optional, TextIO
+
+from aoc.cache import SolutionCache
+from aoc.runner import Solution, solve
+from lib import budget
+
+# how long past its timeout a task with no checkpoints runs before it is stopped
+grace_seconds = 1.0
+statuses = {"time": "timeout", "memory": "memory", "cancelled": "cancelled"}
+
+
+@dataclass(frozen=True)
+class Task:
+    day: str
+    part: int
+    input_path: Path
+
+
+class TaskTimeout(Exception):
+    pass
+
+
+def tasks_from_directory(directory: Path, day: str, parts: list[int]) -> list[Task]:
+    """every file in directory, solved for each of parts"""
+    return [
+        Task(day, part, path)
+        for path in sorted(Path(directory).iterdir())
+        if path.is_file()
+        for part in parts
+    ]
+
+
+def tasks_from_manifest(manifest: Path) -> list[Task]:
+    """
+    one task per line as "DAY_FIFTEEN 2 path/to/input", relative paths are
+    relative to the manifest. blank lines and lines starting with # are skipped
+    """
+    manifest = Path(manifest)
+    tasks = []
+    for line in manifest.read_text().splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        day, part, input_path = line.split(maxsplit=2)
+        tasks.append(Task(day, int(part), manifest.parent / input_path))
+    return tasks
+
+
+def chunked(tasks: list[Task], chunk_size: int) -> Iterator[list[Task]]:
+    for start in range(0, len(tasks), chunk_size):
+        yield tasks[start : start + chunk_size]
+
+
+def _raise_timeout(signum, frame):
+    raise TaskTimeout()
+
+
+@contextlib.contextmanager
+def time_limit(timeout: Optional[float]):
+    """raises TaskTimeout in the body once timeout seconds have passed"""
+    if not timeout:
+        yield
+        return
+    previous_handler = signal.signal(signal.SIGALRM, _raise_timeout)
+    signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous_handler)
+
+
+@contextlib.contextmanager
+def cancelled_by(signum: int):
+    """the budget in effect is cancelled when signum arrives in the body"""
+    previous_handler = signal.signal(signum, lambda signum, frame: budget.cancel())
+    try:
+        yield
+    finally:
+        signal.signal(signum, previous_handler)
+
+
+def status_counts() -> dict[str, int]:
+    return {"ok": 0, "error": 0, "timeout": 0, "memory": 0, "cancelled": 0}
+
+
+def task_result(
+    task: Task,
+    timeout: Optional[float],
+    solve: Callable[[], Solution],
+    memory_bytes: Optional[int] = None,
+) -> dict:
+    """
+    the JSON line for one task, which has timeout seconds to solve and may
+    not take the worker's resident memory over memory_bytes
+    """
+    result = {"day": task.day, "part": task.part, "input": str(task.input_path)}
+    limits = budget.Budget(seconds=timeout, memory_bytes=memory_bytes)
+    hard_timeout = timeout + grace_seconds if timeout else None
+    try:
+        # some solvers print as they go, stdout belongs to the results stream
+        with (
+            time_limit(hard_timeout),
+            cancelled_by(signal.SIGTERM),
+            limits,
+            contextlib.redirect_stdout(sys.stderr),
+        ):
+            solution = solve()
+        result.update(
+            status="ok",
+            answer=solution.answer,
+            timings=solution.timings,
+            peak_rss_kb=solution.peak_rss_kb,
+            cached=solution.cached,
+        )
+    except budget.BudgetExceeded as e:
+        result.update(status=statuses[e.limit], progress=e.progress, seconds=e.seconds)
+        if e.limit == "time":
+            result["timeout"] = timeout
+    except TaskTimeout:
+        result.update(
+            status="timeout",
+            timeout=timeout,
+            progress=limits.progress,
+            seconds=limits.elapsed,
+        )
+    except MemoryError:
+        result.update(status="memory", progress=limits.progress, seconds=limits.elapsed)
+    except Exception as e:
+        result.update(status="error", error=f"{type(e).__name__}: {e}")
+    result["worker"] = os.getpid()
+    return result
+
+
+def run_task(
+    task: Task,
+    timeout: Optional[float] = None,
+    cache: Optional[SolutionCache] = None,
+    memory_bytes: Optional[int] = None,
+) -> dict:
+    return task_result(
+        task,
+        timeout,
+        lambda: solve(task.day, task.part, task.input_path, cache),
+        memory_bytes,
+    )
+
+
+def run_chunk(
+    tasks: list[Task],
+    timeout: Optional[float],
+    cache: Optional[SolutionCache],
+    memory_bytes: Optional[int] = None,
+) -> list[dict]:
+    return [run_task(task, timeout, cache, memory_bytes) for task in tasks]
+
+
+def run_batch(
+    tasks: Iterable[Task],
+    output: TextIO,
+    workers: Optional[int] = None,
+    chunk_size: int = 1,
+    timeout: Optional[float] = None,
+    cache: Optional[SolutionCache] = None,
+    memory_bytes: Optional[int] = None,
+) -> dict[str, int]:
+    """
+    writes a JSON line per task in completion order, returns counts by status
+    and of answers served from the cache
+    """
+    counts = {**status_counts(), "cached": 0}
+    if cache is not None:
+        # counted once here, each worker's copy adds what it stores to this
+        cache.size()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(run_chunk, chunk, timeout, cache, memory_bytes): chunk
+            for chunk in chunked(list(tasks), chunk_size)
+        }
+        for future in as_completed(futures):
+            try:
+                results = future.result()
+            except BrokenProcessPool as e:
+                # the worker died outright, there is nothing more to learn
+                # about this chunk than that
+                results = [
+                    {
+                        "day": task.day,
+                        "part": task.part,
+                        "input": str(task.input_path),
+                        "status": "error",
+                        "error": f"{type(e).__name__}: {e}",
+                    }
+                    for task in futures[future]
+                ]
+            for result in results:
+                counts[result["status"]] += 1
+                counts["cached"] += result.get("cached", False)
+                output.write(json.dumps(result) + "\n")
+            output.flush()
+    if cache is not None:
+        # the workers only saw their own stores, between them they may have
+        # taken the cache past its limit
+        cache.evict()
+    return counts
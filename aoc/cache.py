@@ -0,0 +1,181 @@
+"""
+a content addressed, on disk cache of solver answers
+
+an answer is keyed by the day, the part, a hash of the source the solver runs
+and a hash of the input bytes, so editing a solver or its input can never
+serve a stale answer. every entry is one small file, its modification time is
+bumped on every hit and the least recently used entries are removed once the
+cache grows past its size limit. the size is counted once and then kept up to
+date as answers are stored, so storing one does not stat the whole cache.
+hits and misses are counted in the cache directory as well as on the cache
+object, so `cache stats` reports them across every run that used it
+"""
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+from aoc.solvers import repository_root
+
+default_cache_directory = (
+    Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+    / "advent-of-code2021"
+)
+default_max_bytes = 64 * 1024 * 1024
+
+
+@lru_cache(maxsize=None)
+def solver_version(day: str) -> str:
+    """a hash of every source file the solvers for day can run"""
+    sources = sorted(
+        [
+            *(repository_root / day).glob("*.py"),
+            *(repository_root / "lib").glob("*.py"),
+            repository_root / "aoc" / "solvers.py",
+        ]
+    )
+    digest = hashlib.sha256()
+    for source in sources:
+        digest.update(source.relative_to(repository_root).as_posix().encode())
+        digest.update(source.read_bytes())
+    return digest.hexdigest()
+
+
+def cache_key(day: str, part: int, input_bytes: bytes) -> str:
+    digest = hashlib.sha256()
+    digest.update(f"{day}\0{part}\0{solver_version(day)}\0".encode())
+    digest.update(hashlib.sha256(input_bytes).digest())
+    return digest.hexdigest()
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.hits} hits, {self.misses} misses, "
+            f"{self.entries} entries using {self.bytes} bytes"
+        )
+
+
+class SolutionCache:
+    def __init__(
+        self,
+        directory: Path = default_cache_directory,
+        max_bytes: int = default_max_bytes,
+    ):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        # bytes used as last counted, plus what has been stored since
+        self._bytes: Optional[int] = None
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def _entries(self) -> list[Path]:
+        return list(self.directory.glob("*/*.json"))
+
+    def _count(self, outcome: str) -> None:
+        """adds a lookup to the hits or misses counted in the directory"""
+        # a byte appended per lookup, appends from many processes cannot race
+        counter = self.directory / outcome
+        try:
+            with open(counter, "ab") as f:
+                f.write(b".")
+        except FileNotFoundError:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with open(counter, "ab") as f:
+                f.write(b".")
+
+    def _counted(self, outcome: str) -> int:
+        try:
+            return (self.directory / outcome).stat().st_size
+        except FileNotFoundError:
+            return 0
+
+    def get(self, key: str) -> Optional[str]:
+        path = self._path(key)
+        try:
+            answer = json.loads(path.read_bytes())["answer"]
+            os.utime(path)
+        except (OSError, ValueError, KeyError):
+            self.misses += 1
+            self._count("misses")
+            return None
+        self.hits += 1
+        self._count("hits")
+        return answer
+
+    def size(self) -> int:
+        """
+        the bytes the entries use, counted on the first call and estimated
+        from the answers stored since. stores by other processes are not
+        seen until the next eviction counts again
+        """
+        if self._bytes is None:
+            self._bytes = self.stats().bytes
+        return self._bytes
+
+    def put(self, key: str, answer: str) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        size = self.size()
+        try:
+            size -= path.stat().st_size
+        except FileNotFoundError:
+            pass
+        entry = json.dumps({"answer": answer}).encode()
+        # write then rename, batch workers may be storing the same key at once
+        temporary = path.with_suffix(f".{os.getpid()}.tmp")
+        temporary.write_bytes(entry)
+        os.replace(temporary, path)
+        self._bytes = size + len(entry)
+        if self._bytes > self.max_bytes:
+            self.evict()
+
+    def evict(self) -> None:
+        """drop least recently used entries until the cache fits in max_bytes"""
+        entries = []
+        for path in self._entries():
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for (_, size, _) in entries)
+        for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+        self._bytes = total
+
+    def clear(self) -> None:
+        for path in self._entries():
+            path.unlink(missing_ok=True)
+        for outcome in ["hits", "misses"]:
+            (self.directory / outcome).unlink(missing_ok=True)
+        self._bytes = 0
+
+    def stats(self) -> CacheStats:
+        """hits and misses across every run, not only those of this object"""
+        sizes = []
+        for path in self._entries():
+            try:
+                sizes.append(path.stat().st_size)
+            except FileNotFoundError:
+                continue
+        return CacheStats(
+            self._counted("hits"), self._counted("misses"), len(sizes), sum(sizes)
+        )
@@ -0,0 +1,235 @@
+"""
+reads inputs from files and pipes concurrently while a process pool solves
+the ones already read
+
+every input is read without blocking the event loop, a regular file through
+a thread and a FIFO or stdin through the loop's own pipe transport, and split
+into lines (or blank line separated blocks) as its chunks arrive. each
+finished input goes onto a bounded queue that the workers take from, so once
+`queue_size` inputs are waiting no more are read until a worker frees a slot.
+at most `readers + queue_size + workers` inputs are held in memory at once
+however quickly they arrive
+
+only solvers with a `stream` parser can be fed this way, see aoc.solvers
+"""
+
+import asyncio
+import codecs
+import json
+import multiprocessing
+import os
+import stat
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from pathlib import Path
+from typing import AsyncIterator, Iterable, Optional, TextIO
+
+from aoc.batch import Task, status_counts, task_result
+from aoc.runner import find_solver, solve_streamed
+
+chunk_size = 64 * 1024
+# stands for this process's stdin in a list of sources
+stdin_path = Path("-")
+
+
+@dataclass
+class Ingested:
+    day: str
+    parts: list[int]
+    input_path: Path
+    shape: str
+    content: list
+    read_seconds: float
+
+
+def _is_pipe(path: Path) -> bool:
+    if path == stdin_path:
+        return True
+    mode = os.stat(path).st_mode
+    return stat.S_ISFIFO(mode) or stat.S_ISCHR(mode)
+
+
+async def read_chunks(path: Path) -> AsyncIterator[bytes]:
+    """the bytes of path as they become available"""
+    path = Path(path)
+    loop = asyncio.get_running_loop()
+    if not _is_pipe(path):
+        with open(path, "rb") as f:
+            while chunk := await loop.run_in_executor(None, f.read, chunk_size):
+                yield chunk
+        return
+
+    if path == stdin_path:
+        pipe = os.fdopen(os.dup(sys.stdin.fileno()), "rb", buffering=0)
+    else:
+        # opening the read end of a FIFO blocks until a writer turns up
+        pipe = await loop.run_in_executor(None, open, path, "rb", 0)
+    reader = asyncio.StreamReader(limit=chunk_size)
+    transport, _ = await loop.connect_read_pipe(
+        lambda: asyncio.StreamReaderProtocol(reader), pipe
+    )
+    try:
+        while chunk := await reader.read(chunk_size):
+            yield chunk
+    finally:
+        transport.close()
+
+
+async def read_lines(path: Path) -> AsyncIterator[str]:
+    """
+    every line of path without its line ending, including blank lines, the
+    same as lib.puzzle_input.read_lines but without waiting for the whole input
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    partial = ""
+    async for chunk in read_chunks(path):
+        lines = (partial + decoder.decode(chunk)).split("\n")
+        partial = lines.pop()
+        for line in lines:
+            yield line.removesuffix("\r")
+    partial += decoder.decode(b"", final=True)
+    if partial:
+        yield partial.removesuffix("\r")
+
+
+async def read_blocks(lines: AsyncIterator[str]) -> AsyncIterator[list[str]]:
+    """runs of lines separated by one or more blank lines"""
+    block = []
+    async for line in lines:
+        if line.strip():
+            block.append(line)
+        elif block:
+            yield block
+            block = []
+    if block:
+        yield block
+
+
+async def ingest(day: str, parts: list[int], input_path: Path) -> Ingested:
+    """reads input_path into the shape the stream parsers of day's parts expect"""
+    shapes = set()
+    for part in parts:
+        solver = find_solver(day, part)
+        if solver.stream is None:
+            raise KeyError(f"{day} part {part} cannot be solved from a stream")
+        shapes.add(solver.stream.shape)
+    (shape,) = shapes
+
+    started = time.perf_counter()
+    lines = read_lines(input_path)
+    if shape == "blocks":
+        content = [block async for block in read_blocks(lines)]
+    else:
+        content = [line async for line in lines]
+    return Ingested(
+        day, parts, input_path, shape, content, time.perf_counter() - started
+    )
+
+
+def solve_ingested(
+    task: Task,
+    content: list,
+    read_seconds: float,
+    timeout: Optional[float],
+    memory_bytes: Optional[int] = None,
+) -> dict:
+    """runs in a worker process"""
+    result = task_result(
+        task,
+        timeout,
+        lambda: solve_streamed(task.day, task.part, task.input_path, content),
+        memory_bytes,
+    )
+    if result["status"] == "ok":
+        result["timings"] = {"read": read_seconds, **result["timings"]}
+    return result
+
+
+def _grouped(tasks: Iterable[Task]) -> dict[tuple[str, Path], list[int]]:
+    """each input is read once however many of its parts are being solved"""
+    groups: dict[tuple[str, Path], list[int]] = {}
+    for task in tasks:
+        groups.setdefault((task.day, task.input_path), []).append(task.part)
+    return groups
+
+
+def _error(task: Task, e: BaseException) -> dict:
+    return {
+        "day": task.day,
+        "part": task.part,
+        "input": str(task.input_path),
+        "status": "error",
+        "error": f"{type(e).__name__}: {e}",
+    }
+
+
+async def run_pipeline(
+    tasks: Iterable[Task],
+    output: TextIO,
+    workers: Optional[int] = None,
+    readers: int = 4,
+    queue_size: int = 8,
+    timeout: Optional[float] = None,
+    memory_bytes: Optional[int] = None,
+) -> dict[str, int]:
+    """
+    writes a JSON line per task in completion order, returns counts by status.
+    the timings of each task start with the seconds spent reading its input
+    """
+    workers = workers or os.cpu_count() or 1
+    counts = status_counts()
+    queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+    reading = asyncio.Semaphore(readers)
+    loop = asyncio.get_running_loop()
+
+    def write(result: dict) -> None:
+        counts[result["status"]] += 1
+        output.write(json.dumps(result) + "\n")
+        output.flush()
+
+    async def read(day: str, parts: list[int], input_path: Path) -> None:
+        async with reading:
+            try:
+                ingested = await ingest(day, parts, input_path)
+            except Exception as e:
+                for part in parts:
+                    write(_error(Task(day, part, input_path), e))
+                return
+            # waits here while the queue is full, holding up the next read
+            await queue.put(ingested)
+
+    async def solve(pool: ProcessPoolExecutor) -> None:
+        while (ingested := await queue.get()) is not None:
+            for part in ingested.parts:
+                task = Task(ingested.day, part, ingested.input_path)
+                try:
+                    result = await loop.run_in_executor(
+                        pool,
+                        solve_ingested,
+                        task,
+                        ingested.content,
+                        ingested.read_seconds,
+                        timeout,
+                        memory_bytes,
+                    )
+                except BrokenProcessPool as e:
+                    result = _error(task, e)
+                write(result)
+
+    # the readers run in threads, which a forked worker would inherit mid-read
+    context = multiprocessing.get_context("forkserver")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        solving = [asyncio.create_task(solve(pool)) for _ in range(workers)]
+        await asyncio.gather(
+            *(
+                read(day, parts, input_path)
+                for (day, input_path), parts in _grouped(tasks).items()
+            )
+        )
+        for _ in solving:
+            await queue.put(None)
+        await asyncio.gather(*solving)
+    return counts
@@ -0,0 +1,149 @@
+"""
+solves one (day, part) against one input file, timing each phase on the way
+
+when given a cache the answer is looked up by the input's content before any
+solver runs, and stored afterwards. when given a MemoryTracker each phase also
+records its peak traced memory and biggest allocation sites
+"""
+
+import contextlib
+import resource
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+from aoc.solvers import SOLVERS, Solver
+
+if TYPE_CHECKING:
+    # only needed when a cache or a memory tracker is passed in, which is not
+    # every run, and tracemalloc is slow to import
+    from aoc.cache import SolutionCache
+    from lib.memory import MemoryTracker
+
+
+@dataclass
+class Solution:
+    day: str
+    part: int
+    input_path: Path
+    answer: str
+    timings: dict[str, float] = field(default_factory=dict)
+    peak_rss_kb: int = 0
+    cached: bool = False
+    memory: Optional["MemoryTracker"] = None
+
+    def report(self) -> str:
+        phases = ", ".join(f"{k} {v * 1000:.1f}ms" for k, v in self.timings.items())
+        source = " from cache" if self.cached else ""
+        report = (
+            f"{self.day} part {self.part} ({self.input_path}){source}: {phases}, "
+            f"peak rss {self.peak_rss_kb / 1024:.1f}MiB"
+        )
+        if self.memory is not None:
+            report += "\n" + self.memory.report()
+        return report
+
+
+def find_solver(day: str, part: int) -> Solver:
+    try:
+        return SOLVERS[(day, part)]
+    except KeyError:
+        raise KeyError(f"there is no solver for {day} part {part}") from None
+
+
+def _run_phases(
+    solver: Solver,
+    parse: Callable[[], Any],
+    timings: dict[str, float],
+    memory: Optional["MemoryTracker"],
+) -> str:
+    def phase(name: str):
+        return contextlib.nullcontext() if memory is None else memory.phase(name)
+
+    with contextlib.nullcontext() if memory is None else memory:
+        started = time.perf_counter()
+        with phase("parse"):
+            parsed = parse()
+        timings["parse"] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        with phase("solve"):
+            answer = solver.solve(parsed)
+        timings["solve"] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        with phase("format"):
+            formatted = solver.format(answer)
+        timings["format"] = time.perf_counter() - started
+
+    return formatted
+
+
+def solve(
+    day: str,
+    part: int,
+    input_path: Optional[Path] = None,
+    cache: Optional["SolutionCache"] = None,
+    memory: Optional["MemoryTracker"] = None,
+) -> Solution:
+    solver = find_solver(day, part)
+    input_path = Path(input_path or solver.default_input)
+    if not input_path.exists():
+        raise FileNotFoundError(f"no input for {day} at {input_path}")
+
+    timings = {}
+    if cache is not None:
+        from aoc.cache import cache_key
+
+        started = time.perf_counter()
+        key = cache_key(day, part, input_path.read_bytes())
+        answer = cache.get(key)
+        timings["cache"] = time.perf_counter() - started
+        if answer is not None:
+            return Solution(
+                day,
+                part,
+                input_path,
+                answer,
+                timings,
+                resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+                cached=True,
+            )
+
+    formatted = _run_phases(solver, lambda: solver.parse(input_path), timings, memory)
+
+    if cache is not None:
+        cache.put(key, formatted)
+
+    return Solution(
+        day,
+        part,
+        input_path,
+        formatted,
+        timings,
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        memory=memory,
+    )
+
+
+def solve_streamed(day: str, part: int, source: Path, ingested: Any) -> Solution:
+    """
+    solves input that has already been read into the lines or blocks its
+    solver's `stream` parser expects, see aoc.ingest
+    """
+    solver = find_solver(day, part)
+    if solver.stream is None:
+        raise KeyError(f"{day} part {part} cannot be solved from a stream")
+    timings = {}
+    formatted = _run_phases(
+        solver, lambda: solver.stream.parse(ingested), timings, None
+    )
+    return Solution(
+        day,
+        part,
+        Path(source),
+        formatted,
+        timings,
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    )
@@ -0,0 +1,463 @@
+"""
+every solvable day and part, wired to the functions that already live in the
+DAY_* modules
+
+a solver is split into `parse` (input file to the shape the day works on),
+`solve` (that shape to an answer) and `format` (answer to text) so that the
+runner can time each phase separately. days whose input is a list of lines or
+of blank line separated blocks also have a `stream` parser, which builds the
+same shape from lines that aoc.ingest has already read
+"""
+
+import importlib
+import math
+from array import array
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional
+
+from lib import budget, columnar
+from lib.grid import Grid
+from lib.puzzle_input import PuzzleInput, read_blocks, read_lines
+
+repository_root = Path(__file__).parent.parent
+
+
+@dataclass(frozen=True)
+class StreamParser:
+    # "lines" for a list of every line, "blocks" for a list of the runs of non
+    # blank lines
+    shape: str
+    parse: Callable[[list], Any]
+
+
+@dataclass(frozen=True)
+class Solver:
+    day: str
+    part: int
+    parse: Callable[[Path], Any]
+    solve: Callable[[Any], Any]
+    format: Callable[[Any], str] = str
+    stream: Optional[StreamParser] = None
+
+    @property
+    def default_input(self) -> Path:
+        for name in ["puzzle.input", "part1.input"]:
+            candidate = repository_root / self.day / name
+            if candidate.exists():
+                return candidate
+        return repository_root / self.day / "puzzle.input"
+
+
+def _day(module: str):
+    return importlib.import_module(module)
+
+
+def _text(path: Path) -> str:
+    return Path(path).read_text()
+
+
+_lines = StreamParser("lines", list)
+_joined_lines = StreamParser("lines", "\n".join)
+
+
+def _sonar(path: Path):
+    """every reading is counted as it is read, see DAY_ONE.sonar.SonarAnalyser"""
+    return _day("DAY_ONE.sonar").SonarAnalyser().push_file(path)
+
+
+def _sonar_lines(lines: list[str]):
+    readings = (int(line) for line in lines if line.strip())
+    return _day("DAY_ONE.sonar").SonarAnalyser().push_many(readings)
+
+
+_sonar_stream = StreamParser("lines", _sonar_lines)
+
+
+def _columns(key: str, from_lines: Callable[[Iterable[str]], Any]):
+    """parse through lib.columnar, so a repeated solve maps the parsed columns"""
+    return lambda path: columnar.load(path, key, lambda p: from_lines(read_lines(p)))
+
+
+def _program_columns(lines: Iterable[str]) -> dict[str, array]:
+    program = _day("DAY_TWO.movement").Program.compile(lines)
+    return {"opcodes": program.opcodes, "operands": program.operands}
+
+
+def _program(columns: dict):
+    return _day("DAY_TWO.movement").Program(columns["opcodes"], columns["operands"])
+
+
+def _report_columns(lines: Iterable[str]) -> dict[str, array]:
+    values = array("Q")
+    width = 0
+    for line in lines:
+        line = line.strip()
+        if line:
+            values.append(int(line, 2))
+            width = len(line)
+    return {"values": values, "width": array("I", [width])}
+
+
+def _power_consumption(report) -> int:
+    day = _day("DAY_THREE.diagnostics")
+    values = report["values"]
+    ones = day.ones_per_bit.select(len(values))(values, report["width"][0])
+    return day.power_consumption_from(ones, len(values))
+
+
+def _life_support(report) -> int:
+    day = _day("DAY_THREE.diagnostics")
+    return day.life_support_rating(report["values"], report["width"][0])
+
+
+def _bingo(play_until_last_winner: bool) -> Callable[[Path], Any]:
+    def parse(path: Path):
+        return _bingo_blocks(play_until_last_winner)(read_blocks(path))
+
+    return parse
+
+
+def _bingo_blocks(play_until_last_winner: bool) -> Callable[[list], Any]:
+    def parse(blocks: list[list[str]]):
+        bingo = _day("DAY_FOUR.bingo").Bingo
+        return bingo.from_blocks(blocks, play_until_last_winner)
+
+    return parse
+
+
+def _vent_columns(lines: Iterable[str]) -> dict[str, array]:
+    columns = {name: array("i") for name in ["x1", "y1", "x2", "y2"]}
+    for line in lines:
+        if not line.strip():
+            continue
+        start, end = line.split(" -> ")
+        for name, value in zip(columns, [*start.split(","), *end.split(",")]):
+            columns[name].append(int(value))
+    return columns
+
+
+def _overlaps(allow_diagonals: bool) -> Callable[[dict], int]:
+    def solve(vents) -> int:
+        day = _day("DAY_FIVE.hydrothermal_vents")
+        columns = [vents["x1"], vents["y1"], vents["x2"], vents["y2"]]
+        count = day.overlap_count.select(len(columns[0]))
+        return count(*columns, allow_diagonals)
+
+    return solve
+
+
+def _crab_columns(lines: Iterable[str]) -> dict[str, array]:
+    positions = array("i")
+    for line in lines:
+        positions.extend(int(n) for n in line.split(",") if n.strip())
+    return {"positions": positions}
+
+
+def _cheapest_fuel_cost(fuel_cost_is_constant: bool) -> Callable[[dict], int]:
+    def solve(crabs) -> int:
+        day = _day("DAY_SEVEN.crab_positions")
+        positions = crabs["positions"]
+        cheapest = day.fuel_cost.select(len(positions))
+        return cheapest(positions, fuel_cost_is_constant)
+
+    return solve
+
+
+def _lanternfish(path: Path) -> dict[int, int]:
+    day = _day("DAY_SIX.lanternfish")
+    return day.parse_list_to_dict([int(n) for n in _text(path).split(",")])
+
+
+def _lanternfish_after(days: int) -> Callable[[dict[int, int]], int]:
+    def solve(fish: dict[int, int]) -> int:
+        return sum(_day("DAY_SIX.lanternfish").tick(fish, times=days).values())
+
+    return solve
+
+
+def _unique_segment_digits(lines: list[str]) -> int:
+    day = _day("DAY_EIGHT.signals")
+    total = 0
+    for line in lines:
+        lengths = day.as_lengths(day.parse_line(line.strip()))
+        for counter in [day.count_ones, day.count_fours, day.count_sevens]:
+            total += counter(lengths)
+        total += day.count_eights(lengths)
+    return total
+
+
+def _height_map(path: Path):
+    with PuzzleInput(path) as p:
+        return Grid.from_rows(p.lines())
+
+
+def _risk_of_low_points(grid) -> int:
+    day = _day("DAY_NINE.low_points")
+    return sum(day.get_risk_levels_of_lowest_points(day.get_lowest_points(grid)))
+
+
+def _largest_basins(grid) -> int:
+    day = _day("DAY_NINE.low_points")
+    lowest_points = [coord for (_, coord) in day.get_lowest_points(grid)]
+    basins = day.get_basins(grid, lowest_points)
+    return math.prod(sorted((len(b) for b in basins), reverse=True)[:3])
+
+
+def _syntax_error_score(lines: str) -> int:
+    return _day("DAY_TEN.syntax_checker").syntax_check(lines)[2]
+
+
+def _middle_completion_score(lines: str) -> int:
+    fix_scores = _day("DAY_TEN.syntax_checker").syntax_check(lines)[3]
+    return sorted(fix_scores)[len(fix_scores) // 2]
+
+
+def _flashes_after_one_hundred_steps(grid: str) -> int:
+    cavern = _day("DAY_ELEVEN.octopuses").Cavern(grid)
+    for _ in range(100):
+        cavern.step()
+    return cavern.flashes
+
+
+def _first_synchronised_flash(grid: str) -> int:
+    cavern = _day("DAY_ELEVEN.octopuses").Cavern(grid)
+    while cavern.synchronised_at == -1:
+        cavern.step()
+    return cavern.synchronised_at
+
+
+def _cave_paths(class_name: str) -> Callable[[str], int]:
+    def solve(description: str) -> int:
+        return len(getattr(_day("DAY_TWELVE.paths"), class_name)(description).paths)
+
+    return solve
+
+
+def _manual(path: Path):
+    return _manual_blocks(read_blocks(path))
+
+
+def _manual_blocks(blocks):
+    day = _day("DAY_THIRTEEN.manual_code")
+    dots, folds = blocks
+    return day.parse_dots(dots), day.parse_folds(folds)
+
+
+def _dots_after_first_fold(manual) -> int:
+    grid, folds = manual
+    grid = _day("DAY_THIRTEEN.manual_code").fold_grid(grid, folds[0])
+    return sum(len(row) for row in grid.values())
+
+
+def _code_after_folding(manual) -> str:
+    day = _day("DAY_THIRTEEN.manual_code")
+    grid, folds = manual
+    for fold in folds:
+        grid = day.fold_grid(grid, fold)
+    return day.draw_grid(grid)
+
+
+def _polymer_strength(instructions) -> int:
+    day = _day("DAY_FOURTEEN.polymers")
+    template, insertions = instructions
+    day.cache.clear()
+    for _ in range(10):
+        template = day.take_step(insertions, template)
+    counts = Counter(template)
+    return max(counts.values()) - min(counts.values())
+
+
+def _five_by_five(grid):
+    day = _day("DAY_FIFTEEN.risk_path")
+    return day.make_five_tall(day.make_five_wide(grid))
+
+
+def _lowest_total_risk(grid) -> int:
+    return _day("DAY_FIFTEEN.risk_path").lowest_total_risk(grid)
+
+
+def _packet(path: Path):
+    day = _day("DAY_SIXTEEN.bits")
+    return day.Packet(day.to_binary(_text(path).strip()))
+
+
+def _probe_sweep(description: str) -> tuple[int, int]:
+    """(highest y reached, number of velocities that hit) for every sensible launch"""
+    day = _day("DAY_SEVENTEEN.probe_shooting")
+    (_, max_x), (min_y, _) = day.to_ranges(description)
+    is_within_target = day.parse_target_is_within(description)
+    is_past_target = day.parse_target_is_passed(description)
+    highest = 0
+    on_target = 0
+    for x in range(0, max_x + 1):
+        for y in range(min_y, -min_y + 1):
+            budget.checkpoint("velocities")
+            p = day.Probe(x_velocity=x, y_velocity=y)
+            max_height = 0
+            while not is_past_target(p.position):
+                p = p.step()
+                max_height = max(max_height, p.position[1])
+                if is_within_target(p.position):
+                    highest = max(highest, max_height)
+                    on_target += 1
+                    break
+    return highest, on_target
+
+
+def _deterministic_dice(description: str) -> int:
+    game = _day("DAY_TWENTY_ONE.dirac_dice").Game
+    turns, players = game.play_to(game.parse(description.strip()), 1000)
+    return turns * min(p.score for p in players)
+
+
+SOLVERS: dict[tuple[str, int], Solver] = {
+    (solver.day, solver.part): solver
+    for solver in [
+        Solver(
+            "DAY_ONE",
+            1,
+            _sonar,
+            lambda sonar: sonar.increases,
+            stream=_sonar_stream,
+        ),
+        Solver(
+            "DAY_ONE",
+            2,
+            _sonar,
+            lambda sonar: sonar.window_increases,
+            stream=_sonar_stream,
+        ),
+        Solver(
+            "DAY_TWO",
+            1,
+            _columns("DAY_TWO.program/1", _program_columns),
+            lambda program: _program(program).run(),
+            lambda position: str(position.horizontal * position.depth),
+            stream=StreamParser("lines", _program_columns),
+        ),
+        Solver(
+            "DAY_TWO",
+            2,
+            _columns("DAY_TWO.program/1", _program_columns),
+            lambda program: _program(program).run_with_aim(),
+            lambda position: str(position.horizontal * position.depth),
+            stream=StreamParser("lines", _program_columns),
+        ),
+        Solver(
+            "DAY_THREE",
+            1,
+            _columns("DAY_THREE.report/1", _report_columns),
+            _power_consumption,
+            stream=StreamParser("lines", _report_columns),
+        ),
+        Solver(
+            "DAY_THREE",
+            2,
+            _columns("DAY_THREE.report/1", _report_columns),
+            _life_support,
+            stream=StreamParser("lines", _report_columns),
+        ),
+        Solver(
+            "DAY_FOUR",
+            1,
+            _bingo(play_until_last_winner=False),
+            lambda bingo: bingo.play().final_score(),
+            stream=StreamParser("blocks", _bingo_blocks(play_until_last_winner=False)),
+        ),
+        Solver(
+            "DAY_FOUR",
+            2,
+            _bingo(play_until_last_winner=True),
+            lambda bingo: bingo.play().final_score(),
+            stream=StreamParser("blocks", _bingo_blocks(play_until_last_winner=True)),
+        ),
+        Solver(
+            "DAY_FIVE",
+            1,
+            _columns("DAY_FIVE.vents/1", _vent_columns),
+            _overlaps(False),
+            stream=StreamParser("lines", _vent_columns),
+        ),
+        Solver(
+            "DAY_FIVE",
+            2,
+            _columns("DAY_FIVE.vents/1", _vent_columns),
+            _overlaps(True),
+            stream=StreamParser("lines", _vent_columns),
+        ),
+        Solver("DAY_SIX", 1, _lanternfish, _lanternfish_after(80)),
+        Solver("DAY_SIX", 2, _lanternfish, _lanternfish_after(256)),
+        Solver(
+            "DAY_SEVEN",
+            1,
+            _columns("DAY_SEVEN.crabs/1", _crab_columns),
+            _cheapest_fuel_cost(fuel_cost_is_constant=True),
+        ),
+        Solver(
+            "DAY_SEVEN",
+            2,
+            _columns("DAY_SEVEN.crabs/1", _crab_columns),
+            _cheapest_fuel_cost(fuel_cost_is_constant=False),
+            lambda cost: str(int(cost)),
+        ),
+        Solver(
+            "DAY_EIGHT",
+            1,
+            lambda path: list(read_lines(path)),
+            _unique_segment_digits,
+            stream=_lines,
+        ),
+        Solver("DAY_NINE", 1, _height_map, _risk_of_low_points),
+        Solver("DAY_NINE", 2, _height_map, _largest_basins),
+        Solver("DAY_TEN", 1, _text, _syntax_error_score, stream=_joined_lines),
+        Solver("DAY_TEN", 2, _text, _middle_completion_score, stream=_joined_lines),
+        Solver("DAY_ELEVEN", 1, _text, _flashes_after_one_hundred_steps),
+        Solver("DAY_ELEVEN", 2, _text, _first_synchronised_flash),
+        Solver("DAY_TWELVE", 1, _text, _cave_paths("CaveSystem")),
+        Solver("DAY_TWELVE", 2, _text, _cave_paths("CaveSystemPartTwo")),
+        Solver(
+            "DAY_THIRTEEN",
+            1,
+            _manual,
+            _dots_after_first_fold,
+            stream=StreamParser("blocks", _manual_blocks),
+        ),
+        Solver(
+            "DAY_THIRTEEN",
+            2,
+            _manual,
+            _code_after_folding,
+            stream=StreamParser("blocks", _manual_blocks),
+        ),
+        Solver(
+            "DAY_FOURTEEN",
+            1,
+            lambda path: _day("DAY_FOURTEEN.polymers").parse(_text(path)),
+            _polymer_strength,
+        ),
+        Solver("DAY_FIFTEEN", 1, _height_map, _lowest_total_risk),
+        Solver(
+            "DAY_FIFTEEN",
+            2,
+            lambda path: _five_by_five(_height_map(path)),
+            _lowest_total_risk,
+        ),
+        Solver("DAY_SIXTEEN", 1, _packet, lambda packet: packet.version_sum),
+        Solver("DAY_SIXTEEN", 2, _packet, lambda packet: packet.literal_value),
+        Solver(
+            "DAY_SEVENTEEN",
+            1,
+            lambda path: _text(path).strip(),
+            lambda target: _probe_sweep(target)[0],
+        ),
+        Solver(
+            "DAY_SEVENTEEN",
+            2,
+            lambda path: _text(path).strip(),
+            lambda target: _probe_sweep(target)[1],
+        ),
+        Solver("DAY_TWENTY_ONE", 1, _text, _deterministic_dice),
+    ]
+}
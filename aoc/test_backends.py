@@ -0,0 +1,76 @@
+import importlib
+import os
+import random
+from unittest import TestCase, mock, skipUnless
+
+from benchmarks.startup import solver_modules
+from DAY_THREE.diagnostics import as_columns, count_bits, count_ones
+from lib import backends, differential
+
+
+class TestBackends(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # registering happens when a day's module is imported
+        for module in solver_modules():
+            importlib.import_module(module)
+
+    def setUp(self):
+        environment = mock.patch.dict(os.environ)
+        environment.start()
+        self.addCleanup(environment.stop)
+        os.environ.pop("AOC_BACKEND", None)
+
+    def register(self, name, reference, backend, min_size, other):
+        self.addCleanup(backends.operations.pop, name)
+        operation = backends.operation(name, reference, lambda rng, size: ())
+        operation.implementation(backend, min_size=min_size)(other)
+        return operation
+
+    def test_every_backend_agrees_with_its_reference(self):
+        assert backends.operations
+        for name, operation in backends.operations.items():
+            with self.subTest(operation=name):
+                assert operation.check() == []
+
+    def test_in_process_backends_agree_on_many_generated_inputs(self):
+        for name, operation in backends.operations.items():
+            with self.subTest(operation=name):
+                report = differential.run(operation, cases=200, only=["numpy"])
+                assert report.mismatch is None, str(report.mismatch)
+
+    def test_the_day_three_reference_agrees_with_counting_columns(self):
+        rng = random.Random(3)
+        values = [rng.getrandbits(12) for _ in range(300)]
+        counted = count_bits(as_columns(format(v, "012b") for v in values))
+        assert count_ones(values, 12) == [counted[i][1] for i in range(12)]
+
+    @skipUnless(backends.installed("numpy"), "numpy is not installed")
+    def test_a_backend_can_be_selected_by_name(self):
+        operation = backends.operations["DAY_SEVEN.cheapest_fuel_cost"]
+        selected = operation.select(backend="numpy")
+        assert selected is operation.implementations["numpy"].func
+        assert selected([16, 1, 2, 0, 4, 2, 7, 1, 2, 14]) == 37
+
+    def test_selecting_an_unknown_backend_is_an_error(self):
+        operation = backends.operations["DAY_SEVEN.cheapest_fuel_cost"]
+        with self.assertRaises(KeyError):
+            operation.select(backend="fortran")
+
+    @skipUnless(backends.installed("numpy"), "numpy is not installed")
+    def test_the_environment_picks_a_backend(self):
+        operation = backends.operations["DAY_FIVE.count_overlaps"]
+        os.environ["AOC_BACKEND"] = "numpy"
+        assert operation.select(size=1) is operation.implementations["numpy"].func
+
+    def test_small_inputs_use_the_reference(self):
+        operation = self.register("test.small", sum, "numpy", 100, len)
+        assert operation.select(size=10) is sum
+        assert operation.select(size=100) is len
+
+    def test_multiprocessing_is_not_chosen_on_one_cpu(self):
+        operation = self.register("test.parallel", sum, backends.parallel, 100, len)
+        with mock.patch.object(backends, "worker_count", return_value=1):
+            assert operation.select(size=1000) is sum
+        with mock.patch.object(backends, "worker_count", return_value=4):
+            assert operation.select(size=1000) is len
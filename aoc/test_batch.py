@@ -0,0 +1,95 @@
+import io
+import json
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+from aoc.batch import (
+    Task,
+    chunked,
+    run_batch,
+    run_task,
+    tasks_from_directory,
+    tasks_from_manifest,
+)
+
+repository_root = Path(__file__).parent.parent
+
+
+class TestBatch(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def test_directory_is_one_task_per_file_and_part(self):
+        for name in ["b.input", "a.input"]:
+            (Path(self.directory.name) / name).write_text("1\n2\n")
+        tasks = tasks_from_directory(Path(self.directory.name), "DAY_ONE", [1, 2])
+        assert [(t.input_path.name, t.part) for t in tasks] == [
+            ("a.input", 1),
+            ("a.input", 2),
+            ("b.input", 1),
+            ("b.input", 2),
+        ]
+
+    def test_manifest_paths_are_relative_to_the_manifest(self):
+        manifest = Path(self.directory.name) / "manifest"
+        manifest.write_text("# comment\n\nDAY_FIFTEEN 2 inputs/one.input\n")
+        assert tasks_from_manifest(manifest) == [
+            Task("DAY_FIFTEEN", 2, Path(self.directory.name) / "inputs/one.input")
+        ]
+
+    def test_chunks_cover_every_task(self):
+        tasks = [Task("DAY_ONE", 1, Path(str(n))) for n in range(5)]
+        assert [len(c) for c in chunked(tasks, 2)] == [2, 2, 1]
+
+    def test_results_are_streamed_as_json_lines(self):
+        tasks = [
+            Task("DAY_ONE", 1, repository_root / "DAY_ONE" / "part1.input"),
+            Task("DAY_THREE", 2, repository_root / "DAY_THREE" / "puzzle.input"),
+            Task("DAY_ONE", 1, Path(self.directory.name) / "missing.input"),
+        ]
+        output = io.StringIO()
+        counts = run_batch(tasks, output, workers=2, chunk_size=2)
+        results = [json.loads(line) for line in output.getvalue().splitlines()]
+
+        assert counts == {
+            "ok": 2,
+            "error": 1,
+            "timeout": 0,
+            "memory": 0,
+            "cancelled": 0,
+            "cached": 0,
+        }
+        answers = {(r["day"], r["part"]): r.get("answer") for r in results}
+        assert answers[("DAY_THREE", 2)] == "4105235"
+        assert sorted(r["status"] for r in results) == ["error", "ok", "ok"]
+
+    def test_slow_tasks_time_out_without_stopping_the_chunk(self):
+        tasks = [
+            Task("DAY_FIFTEEN", 2, repository_root / "DAY_FIFTEEN" / "puzzle.input"),
+            Task("DAY_ONE", 2, repository_root / "DAY_ONE" / "part1.input"),
+        ]
+        output = io.StringIO()
+        counts = run_batch(tasks, output, workers=1, chunk_size=2, timeout=0.5)
+        assert counts == {
+            "ok": 1,
+            "error": 0,
+            "timeout": 1,
+            "memory": 0,
+            "cancelled": 0,
+            "cached": 0,
+        }
+        (timed_out,) = [
+            r
+            for r in map(json.loads, output.getvalue().splitlines())
+            if r["status"] == "timeout"
+        ]
+        # stopped while building the five times bigger grid or searching it
+        assert timed_out["progress"]["rows expanded"] > 0
+
+    def test_a_task_over_its_memory_limit_reports_its_progress(self):
+        task = Task("DAY_TWELVE", 2, repository_root / "DAY_TWELVE" / "puzzle.input")
+        result = run_task(task, memory_bytes=1)
+        assert result["status"] == "memory"
+        assert result["progress"] == {"caves": 10_000}
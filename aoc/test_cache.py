@@ -0,0 +1,85 @@
+import os
+import tempfile
+from pathlib import Path
+from unittest import TestCase, mock
+
+from aoc.cache import SolutionCache, cache_key
+from aoc.runner import solve
+
+repository_root = Path(__file__).parent.parent
+
+
+class TestSolutionCache(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.cache = SolutionCache(Path(self.directory.name))
+
+    def test_key_depends_on_day_part_and_input_bytes(self):
+        key = cache_key("DAY_ONE", 1, b"1\n2\n")
+        assert key == cache_key("DAY_ONE", 1, b"1\n2\n")
+        assert key != cache_key("DAY_ONE", 2, b"1\n2\n")
+        assert key != cache_key("DAY_TWO", 1, b"1\n2\n")
+        assert key != cache_key("DAY_ONE", 1, b"1\n3\n")
+
+    def test_misses_then_hits(self):
+        assert self.cache.get("ab12") is None
+        self.cache.put("ab12", "42")
+        assert self.cache.get("ab12") == "42"
+
+        stats = self.cache.stats()
+        assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+        assert stats.bytes > 0
+
+    def test_hits_and_misses_are_counted_across_runs(self):
+        self.cache.get("ab12")
+        self.cache.put("ab12", "42")
+        self.cache.get("ab12")
+        later = SolutionCache(Path(self.directory.name))
+        later.get("ab12")
+        assert (later.hits, later.misses) == (1, 0)
+
+        stats = later.stats()
+        assert (stats.hits, stats.misses, stats.entries) == (2, 1, 1)
+        later.clear()
+        stats = self.cache.stats()
+        assert (stats.hits, stats.misses, stats.entries) == (0, 0, 0)
+
+    def test_least_recently_used_entries_are_evicted_first(self):
+        for n, key in enumerate(["aa01", "bb02", "cc03"]):
+            self.cache.put(key, str(n))
+            path = self.cache._path(key)
+            os.utime(path, (n, n))
+        entry_size = self.cache._path("aa01").stat().st_size
+        self.cache.get("aa01")
+
+        self.cache.max_bytes = 2 * entry_size
+        self.cache.evict()
+        assert self.cache.get("bb02") is None
+        assert self.cache.get("aa01") == "0"
+        assert self.cache.get("cc03") == "2"
+
+    def test_storing_under_the_limit_does_not_count_every_entry(self):
+        self.cache.put("aa01", "0")
+        entry_size = self.cache._path("aa01").stat().st_size
+        self.cache.max_bytes = 3 * entry_size
+        with mock.patch.object(self.cache, "_entries", wraps=self.cache._entries):
+            self.cache.put("bb02", "1")
+            self.cache.put("bb02", "1")
+            self.cache.put("cc03", "2")
+            assert self.cache._entries.call_count == 0
+            assert self.cache.size() == 3 * entry_size
+
+            self.cache.put("dd04", "3")
+            assert self.cache._entries.call_count == 1
+        assert self.cache.stats().entries == 3
+        assert self.cache.size() == 3 * entry_size
+
+    def test_second_solve_is_served_from_the_cache(self):
+        input_path = repository_root / "DAY_THREE" / "puzzle.input"
+        first = solve("DAY_THREE", 1, input_path, self.cache)
+        second = solve("DAY_THREE", 1, input_path, self.cache)
+
+        assert not first.cached and second.cached
+        assert first.answer == second.answer == "3847100"
+        assert list(second.timings) == ["cache"]
@@ -0,0 +1,93 @@
+import asyncio
+import io
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from unittest import TestCase
+
+from aoc.batch import Task
+from aoc.ingest import read_blocks, read_lines, run_pipeline
+from lib.puzzle_input import read_lines as read_lines_from_file
+
+repository_root = Path(__file__).parent.parent
+
+
+async def collect(iterator) -> list:
+    return [item async for item in iterator]
+
+
+class TestIngest(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def write(self, name: str, content: bytes) -> Path:
+        path = Path(self.directory.name) / name
+        path.write_bytes(content)
+        return path
+
+    def test_lines_match_the_memory_mapped_reader(self):
+        for content in [b"", b"a\nb\n", b"a\r\nb", b"a\n\n\nb\n\n", "é\n".encode()]:
+            path = self.write("lines.input", content)
+            assert asyncio.run(collect(read_lines(path))) == list(
+                read_lines_from_file(path)
+            ), content
+
+    def test_blocks_are_separated_by_blank_lines(self):
+        path = self.write("blocks.input", b"1,2\n3,4\n\n \nfold\n")
+        blocks = asyncio.run(collect(read_blocks(read_lines(path))))
+        assert blocks == [["1,2", "3,4"], ["fold"]]
+
+    def test_reads_from_a_fifo(self):
+        path = Path(self.directory.name) / "fifo"
+        os.mkfifo(path)
+
+        def feed():
+            with open(path, "wb") as f:
+                f.write(b"199\n200\n")
+
+        writer = threading.Thread(target=feed)
+        writer.start()
+        lines = asyncio.run(collect(read_lines(path)))
+        writer.join()
+        assert lines == ["199", "200"]
+
+    def test_pipeline_solves_each_part_of_each_input(self):
+        bingo = repository_root / "DAY_FOUR" / "puzzle.input"
+        output = io.StringIO()
+        counts = asyncio.run(
+            run_pipeline(
+                [Task("DAY_FOUR", 1, bingo), Task("DAY_FOUR", 2, bingo)],
+                output,
+                workers=1,
+                readers=1,
+                queue_size=1,
+            )
+        )
+        assert counts == {
+            "ok": 2,
+            "error": 0,
+            "timeout": 0,
+            "memory": 0,
+            "cancelled": 0,
+        }
+        results = sorted(
+            (json.loads(line) for line in output.getvalue().splitlines()),
+            key=lambda result: result["part"],
+        )
+        assert [r["answer"] for r in results] == ["60368", "17435"]
+        assert list(results[0]["timings"]) == ["read", "parse", "solve", "format"]
+
+    def test_days_without_a_stream_parser_are_errors(self):
+        output = io.StringIO()
+        counts = asyncio.run(
+            run_pipeline(
+                [Task("DAY_SIX", 1, repository_root / "DAY_SIX" / "puzzle.input")],
+                output,
+                workers=1,
+            )
+        )
+        assert counts["error"] == 1
+        assert "cannot be solved from a stream" in output.getvalue()
@@ -0,0 +1,53 @@
+import contextlib
+import io
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+from aoc.__main__ import main
+from aoc.runner import solve
+from aoc.solvers import SOLVERS
+from lib.memory import MemoryTracker
+
+
+class TestRunner(TestCase):
+    def test_solves_the_committed_puzzle_input_by_default(self):
+        solution = solve("DAY_ONE", 1)
+        assert solution.answer == "1374"
+        assert solution.input_path.name == "part1.input"
+        assert list(solution.timings) == ["parse", "solve", "format"]
+        assert solution.peak_rss_kb > 0
+
+    def test_solves_any_input_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "example.input"
+            path.write_text("16,1,2,0,4,2,7,1,2,14\n")
+            assert solve("DAY_SEVEN", 1, path).answer == "37"
+            assert solve("DAY_SEVEN", 2, path).answer == "168"
+
+    def test_memory_mode_records_every_phase(self):
+        solution = solve("DAY_SIX", 1, memory=MemoryTracker(top=3))
+        assert solution.answer == "362346"
+        assert list(solution.memory.phases) == ["parse", "solve", "format"]
+        assert solution.memory.peak_bytes > 0
+        assert "solve: peak" in solution.report()
+
+    def test_every_solver_has_both_phases(self):
+        for (day, part), solver in SOLVERS.items():
+            assert solver.day == day and solver.part == part
+            assert callable(solver.parse) and callable(solver.solve)
+
+    def test_unknown_part_is_an_error(self):
+        with self.assertRaises(KeyError):
+            solve("DAY_EIGHT", 2)
+
+    def test_command_line_prints_only_the_answer(self):
+        stdout = io.StringIO()
+        stderr = io.StringIO()
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            exit_code = main(
+                ["run", "DAY_TWO", "--part", "2", "--timings", "--no-cache"]
+            )
+        assert exit_code == 0
+        assert stdout.getvalue() == "1176514794\n"
+        assert "parse" in stderr.getvalue() and "peak rss" in stderr.getvalue()
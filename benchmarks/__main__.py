@@ -0,0 +1,107 @@
+import argparse
+import contextlib
+import json
+import sys
+from pathlib import Path
+
+from benchmarks.cases import CASES
+from benchmarks.runner import compare, measure, repository_root, run_all
+from benchmarks.startup import default_budget_ms, measure_startup, solver_modules
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="benchmark every case at every scale")
+    run.add_argument("--only", nargs="*", default=None, help="case name prefixes")
+    run.add_argument("--scales", nargs="*", type=int, default=[1, 10, 100, 1000])
+    run.add_argument("--seed", type=int, default=2021)
+    run.add_argument("--timeout", type=float, default=600)
+    run.add_argument("--no-allocations", action="store_true")
+    run.add_argument("--output", type=Path, default=None)
+
+    single = commands.add_parser("measure", help="measure one case in this process")
+    single.add_argument("case", choices=sorted(CASES))
+    single.add_argument("scale", type=int)
+    single.add_argument("--seed", type=int, default=2021)
+    single.add_argument("--no-allocations", action="store_true")
+
+    diff = commands.add_parser("compare", help="compare two results files")
+    diff.add_argument("before", type=Path)
+    diff.add_argument("after", type=Path)
+    diff.add_argument("--tolerance", type=float, default=0.2)
+    diff.add_argument(
+        "--memory-tolerance",
+        type=float,
+        default=None,
+        help="allowed growth in peak memory, defaults to --tolerance",
+    )
+
+    startup = commands.add_parser(
+        "startup", help="check how long each solver module takes to import"
+    )
+    startup.add_argument("--only", nargs="*", default=None, help="module names")
+    startup.add_argument("--budget-ms", type=float, default=default_budget_ms)
+
+    commands.add_parser("list", help="list the benchmark cases")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "list":
+        for name, case in CASES.items():
+            print(f"{name} (max scale {case.max_scale})")
+        return 0
+
+    if args.command == "measure":
+        # some solvers print as they go, keep stdout for the measurement alone
+        with contextlib.redirect_stdout(sys.stderr):
+            result = measure(args.case, args.scale, args.seed, not args.no_allocations)
+        print(json.dumps(result))
+        return 0
+
+    if args.command == "compare":
+        regressions = compare(
+            json.loads(args.before.read_text()),
+            json.loads(args.after.read_text()),
+            args.tolerance,
+            args.memory_tolerance,
+        )
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        return 1 if regressions else 0
+
+    if args.command == "startup":
+        over_budget = 0
+        for module, milliseconds in measure_startup(
+            args.only or solver_modules()
+        ).items():
+            flag = ""
+            if milliseconds > args.budget_ms:
+                over_budget += 1
+                flag = f"  OVER BUDGET ({args.budget_ms:g}ms)"
+            print(f"{module:<40} {milliseconds:>8.2f}ms{flag}")
+        return 1 if over_budget else 0
+
+    names = [
+        name
+        for name in CASES
+        if args.only is None or any(name.startswith(prefix) for prefix in args.only)
+    ]
+    results = run_all(
+        names, args.scales, args.seed, not args.no_allocations, args.timeout
+    )
+    output = args.output or (
+        repository_root
+        / "benchmarks"
+        / "results"
+        / f"{(results['commit'] or 'local')[:10]}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(results, indent=2) + "\n")
+    print(f"wrote {output}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
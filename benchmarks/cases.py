@@ -0,0 +1,253 @@
+"""
+one benchmark case per day's solver
+
+`scale` 1 is roughly the size of the committed puzzle input, every case grows
+its input linearly with scale. cases whose solver is super-linear declare a
+`max_scale` beyond which a run would take hours rather than minutes
+"""
+
+import importlib
+import math
+import random
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from lib import generators
+
+
+@dataclass(frozen=True)
+class BenchmarkCase:
+    name: str
+    make_input: Callable[[int, random.Random], Any]
+    run: Callable[[Any], Any]
+    max_scale: int = 1000
+
+
+def _day(module: str):
+    return importlib.import_module(module)
+
+
+def _grid_side(scale: int) -> int:
+    return round(100 * math.sqrt(scale))
+
+
+def _sonar(readings: list[str]) -> int:
+    return _day("DAY_ONE.sonar").check_sonar_readings_for_increases(readings)
+
+
+def _bingo(description: str):
+    bingo = _day("DAY_FOUR.bingo").Bingo
+    return bingo.parse(description, play_until_last_winner=True).play().final_score()
+
+
+def _vents(lines: list[str]) -> int:
+    day = _day("DAY_FIVE.hydrothermal_vents")
+    overlaps = day.find_overlaps(
+        [day.as_packed_line(line, allow_diagonals=True) for line in lines]
+    )
+    return sum(1 for v in overlaps.values() if v >= 2)
+
+
+def _lanternfish_input(scale: int, rng: random.Random) -> tuple[dict[int, int], int]:
+    day = _day("DAY_SIX.lanternfish")
+    fish = [int(f) for f in next(generators.lanternfish(300, rng)).split(",")]
+    return day.parse_list_to_dict(fish), 256 * scale
+
+
+def _lanternfish(fish_and_days: tuple[dict[int, int], int]) -> int:
+    fish, days = fish_and_days
+    return sum(_day("DAY_SIX.lanternfish").tick(fish, times=days).values())
+
+
+def _crabs(positions: str) -> int:
+    day = _day("DAY_SEVEN.crab_positions")
+    return day.get_cheapest_fuel_cost(positions, fuel_cost_is_constant=False)
+
+
+def _basins(description: str) -> int:
+    day = _day("DAY_NINE.low_points")
+    grid = _day("lib.grid").as_grid(description)
+    lowest_points = [coord for (_, coord) in day.get_lowest_points(grid)]
+    basins = day.get_basins(grid, lowest_points)
+    return math.prod(sorted((len(b) for b in basins), reverse=True)[:3])
+
+
+def _syntax(lines: str) -> int:
+    _, _, score, _ = _day("DAY_TEN.syntax_checker").syntax_check(lines)
+    return score
+
+
+def _octopus_input(scale: int, rng: random.Random) -> tuple[str, int]:
+    return "\n".join(generators.digit_grid(10, 10, rng)), 100 * scale
+
+
+def _octopuses(grid_and_steps: tuple[str, int]) -> int:
+    grid, steps = grid_and_steps
+    cavern = _day("DAY_ELEVEN.octopuses").Cavern(grid)
+    for _ in range(steps):
+        cavern.step()
+    return cavern.flashes
+
+
+def _caves(description: str) -> int:
+    return len(_day("DAY_TWELVE.paths").CaveSystem(description).paths)
+
+
+def _fold(instructions: str) -> int:
+    day = _day("DAY_THIRTEEN.manual_code")
+    grid = day.get_grid_from(instructions)
+    for fold in day.get_folds_from(instructions):
+        grid = day.fold_grid(grid, fold)
+    return sum(len(row) for row in grid.values())
+
+
+def _polymer(instructions: str) -> int:
+    day = _day("DAY_FOURTEEN.polymers")
+    day.cache.clear()
+    template, insertions = day.parse(instructions)
+    for _ in range(10):
+        template = day.take_step(insertions, template)
+    return len(template)
+
+
+def _a_star(description: str) -> int:
+    day = _day("DAY_FIFTEEN.risk_path")
+    grid = _day("lib.grid").as_grid(description)
+    max_x, max_y = (grid.width - 1, grid.height - 1)
+    adjacency_list = day.as_adjacency_list(grid, max_y, max_x)
+    heuristic = {k: grid.cells[grid.index(*k)] for k in adjacency_list.keys()}
+    path = day.Graph(adjacency_list, heuristic).a_star_algorithm((0, 0), (max_x, max_y))
+    return sum(grid.cells[grid.index(*c)] for c in path[1:])
+
+
+def _packet(transmission: str) -> int:
+    day = _day("DAY_SIXTEEN.bits")
+    return day.Packet(day.to_binary(transmission)).version_sum
+
+
+def _snailfish(numbers: list[str]) -> int:
+    snailfish = _day("DAY_EIGHTEEN.snail_numbers").snailfish
+    return sum(len(snailfish(number)) for number in numbers)
+
+
+def _probe_input(scale: int, rng: random.Random) -> list[tuple[int, int]]:
+    return [
+        (rng.randrange(0, 100), rng.randrange(-100, 100)) for _ in range(6000 * scale)
+    ]
+
+
+def _probes(velocities: list[tuple[int, int]]) -> int:
+    day = _day("DAY_SEVENTEEN.probe_shooting")
+    target = "target area: x=20..30, y=-10..-5"
+    is_within_target = day.parse_target_is_within(target)
+    is_past_target = day.parse_target_is_passed(target)
+    on_target = 0
+    for x, y in velocities:
+        p = day.Probe(x_velocity=x, y_velocity=y)
+        while not is_past_target(p.position):
+            p = p.step()
+            if is_within_target(p.position):
+                on_target += 1
+                break
+    return on_target
+
+
+def _dice_input(scale: int, rng: random.Random) -> tuple[str, int]:
+    description = (
+        f"Player 1 starting position: {rng.randint(1, 9)}\n"
+        f"Player 2 starting position: {rng.randint(1, 9)}"
+    )
+    return description, 1000 * scale
+
+
+def _dice(description_and_score: tuple[str, int]) -> int:
+    description, finishing_score = description_and_score
+    game = _day("DAY_TWENTY_ONE.dirac_dice").Game
+    turns, players = game.play_to(game.parse(description), finishing_score)
+    return turns * min(p.score for p in players)
+
+
+CASES: dict[str, BenchmarkCase] = {
+    case.name: case
+    for case in [
+        BenchmarkCase(
+            "DAY_ONE.check_sonar_readings_for_increases",
+            lambda scale, rng: list(generators.sonar_readings(2000 * scale, rng)),
+            _sonar,
+        ),
+        BenchmarkCase(
+            "DAY_FOUR.Bingo.play",
+            lambda scale, rng: "\n".join(generators.bingo(100 * scale, rng)),
+            _bingo,
+        ),
+        BenchmarkCase(
+            "DAY_FIVE.find_overlaps",
+            lambda scale, rng: list(generators.vents(500 * scale, rng)),
+            _vents,
+            max_scale=100,
+        ),
+        BenchmarkCase("DAY_SIX.tick", _lanternfish_input, _lanternfish),
+        BenchmarkCase(
+            "DAY_SEVEN.get_cheapest_fuel_cost",
+            lambda scale, rng: next(generators.crab_positions(1000 * scale, rng)),
+            _crabs,
+            max_scale=10,
+        ),
+        BenchmarkCase(
+            "DAY_NINE.get_basins",
+            lambda scale, rng: "\n".join(
+                generators.height_map(_grid_side(scale), _grid_side(scale), rng)
+            ),
+            _basins,
+        ),
+        BenchmarkCase(
+            "DAY_TEN.syntax_check",
+            lambda scale, rng: "\n".join(
+                generators.navigation_subsystem(100 * scale, rng)
+            ),
+            _syntax,
+        ),
+        BenchmarkCase("DAY_ELEVEN.Cavern.step", _octopus_input, _octopuses),
+        BenchmarkCase(
+            "DAY_TWELVE.CaveSystem",
+            lambda scale, rng: "\n".join(generators.cave_links(scale, rng, layers=8)),
+            _caves,
+            max_scale=100,
+        ),
+        BenchmarkCase(
+            "DAY_THIRTEEN.fold_grid",
+            lambda scale, rng: "\n".join(
+                generators.transparent_paper(800 * scale, rng)
+            ),
+            _fold,
+        ),
+        BenchmarkCase(
+            "DAY_FOURTEEN.take_step",
+            lambda scale, rng: "\n".join(generators.polymer(20 * scale, rng)),
+            _polymer,
+            max_scale=100,
+        ),
+        BenchmarkCase(
+            "DAY_FIFTEEN.Graph.a_star_algorithm",
+            lambda scale, rng: "\n".join(
+                generators.digit_grid(_grid_side(scale), _grid_side(scale), rng)
+            ),
+            _a_star,
+            max_scale=10,
+        ),
+        BenchmarkCase(
+            "DAY_SIXTEEN.Packet",
+            lambda scale, rng: "".join(generators.bits_transmission(500 * scale, rng)),
+            _packet,
+        ),
+        BenchmarkCase("DAY_SEVENTEEN.Probe.step", _probe_input, _probes, max_scale=100),
+        BenchmarkCase(
+            "DAY_EIGHTEEN.snailfish",
+            lambda scale, rng: list(
+                generators.exploding_snail_numbers(100 * scale, rng)
+            ),
+            _snailfish,
+        ),
+        BenchmarkCase("DAY_TWENTY_ONE.Game.play_to", _dice_input, _dice),
+    ]
+}
@@ -0,0 +1,210 @@
+"""
+a pytest plugin for performance tests, loaded by the root conftest.py
+
+tests marked `@pytest.mark.perf` are skipped unless pytest is run with
+`--perf`, and then only they run, with logging and tracing switched off so
+the times mean something despite pytest.ini asking for DEBUG output
+
+    pytest --perf                          compare against the baseline
+    pytest --perf --perf-update-baseline   record a new baseline
+
+a perf test hands the `perf` fixture something to time. it is run
+`--perf-runs` times, or fewer once `--perf-max-seconds` have been spent on it,
+and the median wall time is compared with the one recorded in
+benchmarks/perf_baseline.json. the test fails when it is more than
+`--perf-tolerance` (a fraction) slower, plus `--perf-noise-ms` so that a
+solve taking a millisecond does not fail on scheduler jitter.
+
+shared and throttled machines can run everything at half speed for minutes
+at a time, so before each measurement a fixed reference loop is timed too,
+and the baseline is scaled by how much slower or faster that loop runs than
+it did when the baseline was recorded. that also makes a baseline roughly
+portable between machines, but it is most reliable updated where the gate
+runs
+"""
+
+import json
+import logging
+import platform
+import statistics
+import time
+from pathlib import Path
+from typing import Callable, Optional
+
+import pytest
+
+default_baseline = Path(__file__).parent / "perf_baseline.json"
+
+
+def median_seconds(func: Callable[[], object], runs: int, max_seconds: float) -> float:
+    """the median wall time of up to runs calls, always at least one"""
+    times = []
+    spent = 0.0
+    while len(times) < runs and (not times or spent < max_seconds):
+        started = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - started)
+        spent += times[-1]
+    return statistics.median(times)
+
+
+def _reference_work() -> int:
+    # a mix of the dict, int and list work the solvers do
+    counts: dict[int, int] = {}
+    for n in range(60_000):
+        counts[n % 997] = counts.get(n % 997, 0) + n
+    return sum(sorted(counts.values()))
+
+
+def calibration_seconds() -> float:
+    """how long this machine takes for a fixed piece of work right now"""
+    return median_seconds(_reference_work, runs=5, max_seconds=1.0)
+
+
+def regression(
+    name: str,
+    seconds: float,
+    baseline_seconds: float,
+    tolerance: float,
+    noise_seconds: float = 0.0,
+) -> Optional[str]:
+    """a description of the slowdown when seconds is beyond tolerance, else None"""
+    if seconds <= baseline_seconds * (1 + tolerance) + noise_seconds:
+        return None
+    ratio = seconds / baseline_seconds
+    return (
+        f"{name} took {seconds * 1000:.1f}ms, {ratio:.2f}x the "
+        f"{baseline_seconds * 1000:.1f}ms of its baseline (tolerance {tolerance:.0%})"
+    )
+
+
+class Perf:
+    def __init__(self, config):
+        self.runs = config.getoption("perf_runs")
+        self.max_seconds = config.getoption("perf_max_seconds")
+        self.tolerance = config.getoption("perf_tolerance")
+        self.noise_seconds = config.getoption("perf_noise_ms") / 1000
+        self.updating = config.getoption("perf_update_baseline")
+        self.baseline_path = config.getoption("perf_baseline")
+        self.baseline = {}
+        self.baseline_calibration = None
+        if self.baseline_path.exists():
+            recorded = json.loads(self.baseline_path.read_text())
+            self.baseline = recorded["medians"]
+            self.baseline_calibration = recorded.get("calibration_seconds")
+        self.measured: dict[str, float] = {}
+        self.calibrations: list[float] = []
+
+    def check(self, name: str, func: Callable[[], object]) -> float:
+        calibration = calibration_seconds()
+        self.calibrations.append(calibration)
+        seconds = median_seconds(func, self.runs, self.max_seconds)
+        self.measured[name] = seconds
+        if self.updating:
+            return seconds
+        if name not in self.baseline:
+            pytest.skip(f"{name} has no baseline, run with --perf-update-baseline")
+        expected = self.baseline[name]
+        if self.baseline_calibration:
+            expected *= calibration / self.baseline_calibration
+        slower = regression(name, seconds, expected, self.tolerance, self.noise_seconds)
+        if slower:
+            pytest.fail(slower, pytrace=False)
+        return seconds
+
+    def write_baseline(self) -> None:
+        medians = {**self.baseline, **self.measured}
+        calibration = statistics.median(self.calibrations)
+        if self.baseline_calibration:
+            # keep the medians that were not measured this time comparable
+            scale = calibration / self.baseline_calibration
+            medians = {name: seconds * scale for name, seconds in self.baseline.items()}
+            medians.update(self.measured)
+        self.baseline_path.write_text(
+            json.dumps(
+                {
+                    "python": platform.python_version(),
+                    "machine": platform.machine(),
+                    "runs": self.runs,
+                    "calibration_seconds": round(calibration, 6),
+                    "medians": {
+                        name: round(seconds, 6)
+                        for name, seconds in sorted(medians.items())
+                    },
+                },
+                indent=2,
+            )
+            + "\n"
+        )
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("perf", "performance regression tests")
+    group.addoption(
+        "--perf",
+        action="store_true",
+        help="run only the tests marked perf, against the committed baseline",
+    )
+    group.addoption("--perf-runs", type=int, default=5)
+    group.addoption(
+        "--perf-max-seconds",
+        type=float,
+        default=10.0,
+        help="stop repeating a slow test once this much time has been spent on it",
+    )
+    group.addoption(
+        "--perf-tolerance",
+        type=float,
+        default=0.25,
+        help="how much slower than the baseline median a test may be, as a fraction",
+    )
+    group.addoption(
+        "--perf-noise-ms",
+        type=float,
+        default=2.0,
+        help="slowdown in milliseconds that is never a regression",
+    )
+    group.addoption("--perf-update-baseline", action="store_true")
+    group.addoption("--perf-baseline", type=Path, default=default_baseline)
+
+
+def _perf_mode(config) -> bool:
+    return config.getoption("perf") or config.getoption("perf_update_baseline")
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "perf: a performance test, only run with --perf (see benchmarks)"
+    )
+    if _perf_mode(config):
+        from lib import trace
+
+        logging.disable(logging.CRITICAL)
+        trace.disable()
+
+
+def pytest_unconfigure(config):
+    if _perf_mode(config):
+        logging.disable(logging.NOTSET)
+
+
+def pytest_collection_modifyitems(config, items):
+    if not _perf_mode(config):
+        skip = pytest.mark.skip(reason="performance test, run with --perf")
+        for item in items:
+            if "perf" in item.keywords:
+                item.add_marker(skip)
+        return
+
+    deselected = [item for item in items if "perf" not in item.keywords]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = [item for item in items if "perf" in item.keywords]
+
+
+@pytest.fixture(scope="session")
+def perf(request):
+    perf = Perf(request.config)
+    yield perf
+    if perf.updating and perf.measured:
+        perf.write_baseline()
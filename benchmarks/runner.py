@@ -0,0 +1,189 @@
+"""
+runs each (case, scale) in a fresh interpreter so peak RSS belongs to that one
+solve, and collects the measurements into a results document
+"""
+
+import gc
+import json
+import platform
+import random
+import resource
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterable, Optional
+
+from benchmarks.cases import CASES
+from lib.memory import MemoryTracker
+
+repository_root = Path(__file__).parent.parent
+
+
+def measure(case_name: str, scale: int, seed: int, allocations: bool = True) -> dict:
+    """build the input then time the solve, in this process"""
+    case = CASES[case_name]
+    puzzle_input = case.make_input(scale, random.Random(seed))
+    gc.collect()
+    rss_before_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    started = time.perf_counter()
+    answer = case.run(puzzle_input)
+    wall_seconds = time.perf_counter() - started
+    peak_rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    result = {
+        "case": case_name,
+        "scale": scale,
+        "status": "ok",
+        "answer": repr(answer),
+        "wall_seconds": wall_seconds,
+        "rss_before_kb": rss_before_kb,
+        "peak_rss_kb": peak_rss_kb,
+    }
+
+    if allocations:
+        # a second solve under tracemalloc, it slows everything down too much to
+        # share a run with the wall clock measurement
+        puzzle_input = case.make_input(scale, random.Random(seed))
+        gc.collect()
+        blocks_before = sys.getallocatedblocks()
+        with MemoryTracker(top=5) as memory, memory.phase("run"):
+            answer = case.run(puzzle_input)
+        run = memory.phases["run"]
+        result["tracemalloc_peak_bytes"] = run.peak_bytes
+        result["allocated_blocks"] = sys.getallocatedblocks() - blocks_before
+        result["allocation_sites"] = [
+            {"location": site.location, "size_bytes": site.size_bytes}
+            for site in run.sites
+        ]
+
+    return result
+
+
+def measure_in_subprocess(
+    case_name: str, scale: int, seed: int, allocations: bool, timeout: float
+) -> dict:
+    command = [
+        sys.executable,
+        "-m",
+        "benchmarks",
+        "measure",
+        case_name,
+        str(scale),
+        "--seed",
+        str(seed),
+    ]
+    if not allocations:
+        command.append("--no-allocations")
+    try:
+        completed = subprocess.run(
+            command,
+            cwd=repository_root,
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+        )
+    except subprocess.TimeoutExpired:
+        return {"case": case_name, "scale": scale, "status": "timeout"}
+
+    if completed.returncode != 0:
+        return {
+            "case": case_name,
+            "scale": scale,
+            "status": "error",
+            "error": completed.stderr.strip().splitlines()[-1:],
+        }
+    return json.loads(completed.stdout)
+
+
+def current_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=repository_root,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_all(
+    case_names: Iterable[str],
+    scales: Iterable[int],
+    seed: int,
+    allocations: bool = True,
+    timeout: float = 600,
+) -> dict:
+    results = []
+    for case_name in case_names:
+        case = CASES[case_name]
+        for scale in scales:
+            if scale > case.max_scale:
+                result = {"case": case_name, "scale": scale, "status": "skipped"}
+            else:
+                result = measure_in_subprocess(
+                    case_name, scale, seed, allocations, timeout
+                )
+            print(summarise(result), file=sys.stderr)
+            results.append(result)
+
+    return {
+        "commit": current_commit(),
+        "created": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "seed": seed,
+        "results": results,
+    }
+
+
+def summarise(result: dict) -> str:
+    label = f"{result['case']} x{result['scale']}"
+    if result["status"] != "ok":
+        return f"{label}: {result['status']}"
+    return (
+        f"{label}: {result['wall_seconds']:.3f}s, "
+        f"peak rss {result['peak_rss_kb'] / 1024:.1f}MiB"
+    )
+
+
+memory_metrics = ("peak_rss_kb", "tracemalloc_peak_bytes")
+
+
+def compare(
+    before: dict,
+    after: dict,
+    tolerance: float,
+    memory_tolerance: Optional[float] = None,
+) -> list[str]:
+    """
+    the (case, scale) pairs that got slower or hungrier by more than tolerance,
+    memory_tolerance if given applies to peak memory instead
+    """
+    previous = {
+        (r["case"], r["scale"]): r for r in before["results"] if r["status"] == "ok"
+    }
+    regressions = []
+    for result in after["results"]:
+        old = previous.get((result["case"], result["scale"]))
+        if result["status"] != "ok" or old is None:
+            continue
+        for metric in ["wall_seconds", *memory_metrics]:
+            if metric not in result or metric not in old or not old[metric]:
+                continue
+            ratio = result[metric] / old[metric]
+            line = (
+                f"{result['case']} x{result['scale']} {metric}: "
+                f"{old[metric]:.6g} -> {result[metric]:.6g} ({ratio:.2f}x)"
+            )
+            print(line, file=sys.stderr)
+            allowed = tolerance
+            if metric in memory_metrics and memory_tolerance is not None:
+                allowed = memory_tolerance
+            if ratio > 1 + allowed:
+                regressions.append(line)
+    return regressions
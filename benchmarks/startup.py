@@ -0,0 +1,55 @@
+"""
+how long each solver module takes to import, measured by `python -X importtime`
+in a fresh interpreter so nothing is already loaded
+
+importing a day should only cost its own code and what it really needs, so a
+module that starts pulling in something heavy at import time shows up here as
+going over the budget
+"""
+
+import re
+import subprocess
+import sys
+from pathlib import Path
+from typing import Iterable
+
+repository_root = Path(__file__).parent.parent
+
+default_budget_ms = 25.0
+
+# import time: self [us] | cumulative | imported package
+_importtime_line = re.compile(r"^import time:\s+\d+ \|\s+(\d+) \|\s*(\S+)$")
+
+
+def solver_modules() -> list[str]:
+    """every DAY_* module that is not a test, plus the runner in front of them"""
+    modules = [
+        f"{path.parent.name}.{path.stem}"
+        for path in sorted(repository_root.glob("DAY_*/*.py"))
+        if not path.name.startswith("test_")
+    ]
+    return modules + ["aoc.runner"]
+
+
+def cumulative_microseconds(importtime_output: str, module: str) -> int:
+    """the cumulative import time `python -X importtime` reported for module"""
+    for line in importtime_output.splitlines():
+        match = _importtime_line.match(line)
+        if match and match.group(2) == module:
+            return int(match.group(1))
+    raise ValueError(f"{module} does not appear in the import time report")
+
+
+def import_milliseconds(module: str) -> float:
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=repository_root,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return cumulative_microseconds(process.stderr, module) / 1000
+
+
+def measure_startup(modules: Iterable[str]) -> dict[str, float]:
+    return {module: import_milliseconds(module) for module in modules}
@@ -0,0 +1,83 @@
+import random
+from unittest import TestCase
+
+from benchmarks.cases import CASES
+from benchmarks.pytest_perf import median_seconds, regression
+from benchmarks.runner import compare, measure
+from benchmarks.startup import (
+    cumulative_microseconds,
+    import_milliseconds,
+    solver_modules,
+)
+
+
+class TestBenchmarks(TestCase):
+    def test_inputs_are_the_same_for_the_same_seed(self):
+        for name, case in CASES.items():
+            first = case.make_input(1, random.Random(7))
+            second = case.make_input(1, random.Random(7))
+            assert first == second, name
+
+    def test_measure_records_time_memory_and_allocations(self):
+        result = measure("DAY_ONE.check_sonar_readings_for_increases", 1, seed=7)
+        assert result["status"] == "ok"
+        assert result["wall_seconds"] > 0
+        assert result["peak_rss_kb"] > 0
+        assert result["tracemalloc_peak_bytes"] > 0
+        assert "allocated_blocks" in result
+        assert isinstance(result["allocation_sites"], list)
+
+    def test_compare_flags_slowdowns_beyond_tolerance(self):
+        before = {
+            "results": [{"case": "a", "scale": 1, "status": "ok", "wall_seconds": 1.0}]
+        }
+        after = {
+            "results": [{"case": "a", "scale": 1, "status": "ok", "wall_seconds": 1.5}]
+        }
+        assert len(compare(before, after, tolerance=0.2)) == 1
+        assert compare(before, after, tolerance=0.6) == []
+
+    def test_compare_can_hold_memory_to_a_tighter_tolerance(self):
+        before = {
+            "results": [
+                {"case": "a", "scale": 1, "status": "ok", "peak_rss_kb": 1000}
+            ]
+        }
+        after = {
+            "results": [
+                {"case": "a", "scale": 1, "status": "ok", "peak_rss_kb": 1150}
+            ]
+        }
+        assert compare(before, after, tolerance=0.2) == []
+        assert len(compare(before, after, 0.2, memory_tolerance=0.1)) == 1
+
+    def test_cumulative_microseconds_reads_the_importtime_report(self):
+        report = (
+            "import time: self [us] | cumulative | imported package\n"
+            "import time:       120 |        120 |   lib.puzzle_input\n"
+            "import time:       450 |        570 | DAY_ONE.sonar\n"
+        )
+        assert cumulative_microseconds(report, "DAY_ONE.sonar") == 570
+        assert cumulative_microseconds(report, "lib.puzzle_input") == 120
+        with self.assertRaises(ValueError):
+            cumulative_microseconds(report, "DAY_TWO.movement")
+
+    def test_solver_modules_are_importable_without_their_tests(self):
+        modules = solver_modules()
+        assert "DAY_ONE.sonar" in modules
+        assert not any(".test_" in module for module in modules)
+        assert import_milliseconds("DAY_ONE.sonar") > 0
+
+    def test_perf_median_stops_repeating_once_over_time(self):
+        calls = []
+        median_seconds(lambda: calls.append(1), runs=5, max_seconds=10)
+        assert len(calls) == 5
+        calls.clear()
+        median_seconds(lambda: calls.append(1), runs=5, max_seconds=0)
+        assert len(calls) == 1
+
+    def test_perf_regression_allows_tolerance_and_noise(self):
+        assert regression("a", 1.2, 1.0, tolerance=0.25) is None
+        assert "1.50x" in regression("a", 1.5, 1.0, tolerance=0.25)
+        assert regression("a", 0.004, 0.001, 0.25, noise_seconds=0.002) is not None
+        assert regression("a", 0.003, 0.001, 0.25, noise_seconds=0.002) is None
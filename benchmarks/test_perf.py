@@ -0,0 +1,12 @@
+import pytest
+
+from aoc.runner import solve
+from aoc.solvers import SOLVERS
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize(
+    "day, part", list(SOLVERS), ids=[f"{day}-{part}" for (day, part) in SOLVERS]
+)
+def test_puzzle_input(perf, day, part):
+    perf.check(f"{day} part {part}", lambda: solve(day, part))
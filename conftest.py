@@ -0,0 +1,4 @@
+# pytest puts the directory of this file on sys.path, which lets the tests in
+# the DAY_* directories import their solvers as DAY_ONE.sonar and so on
+
+pytest_plugins = ["benchmarks.pytest_perf"]
@@ -0,0 +1,159 @@
+"""
+whole-grid operations for cellular simulations, backed by numpy
+
+a grid is a 2-D ndarray indexed [y, x]. a day's rule becomes a handful of
+calls to these rather than a loop over every cell, e.g. a step of the DAY_ELEVEN
+octopuses is
+
+    increment(energy)
+    flashed = cascade(energy, threshold=9, diagonals=True)
+    energy[flashed] = 0
+
+numpy is optional and only imported when one of these is first called, so
+importing a day that uses the engine costs nothing until it runs. `available`
+says whether numpy is installed and every function raises ImportError when it
+is not
+"""
+
+from importlib.util import find_spec
+from typing import Union
+
+from lib.grid import Grid
+
+np = None
+available = find_spec("numpy") is not None
+
+orthogonal_offsets = ((0, -1), (-1, 0), (1, 0), (0, 1))
+all_offsets = (
+    (-1, -1),
+    (0, -1),
+    (1, -1),
+    (-1, 0),
+    (1, 0),
+    (-1, 1),
+    (0, 1),
+    (1, 1),
+)
+
+
+def _require_numpy() -> None:
+    global np
+    if np is not None:
+        return
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError(
+            "lib.automaton needs numpy, pip install -r requirements.txt"
+        ) from e
+    np = numpy
+
+
+def as_array(grid: Union[Grid, str, bytes], copy: bool = True) -> "np.ndarray":
+    """a uint8 array of a digit grid, shares the Grid's memory unless copied"""
+    _require_numpy()
+    if not isinstance(grid, Grid):
+        grid = Grid.parse(grid)
+    values = np.frombuffer(grid.cells, dtype=np.uint8).reshape(grid.height, grid.width)
+    return values.copy() if copy else values
+
+
+def increment(values: "np.ndarray", amount: int = 1) -> "np.ndarray":
+    """add amount to every cell in place"""
+    _require_numpy()
+    np.add(values, amount, out=values, casting="unsafe")
+    return values
+
+
+def neighbour_sum(values: "np.ndarray", diagonals: bool = False) -> "np.ndarray":
+    """
+    each cell's 4 (or with diagonals 8) connected neighbours summed, cells off
+    the edge of the grid count as 0. a boolean grid gives neighbour counts
+    """
+    _require_numpy()
+    height, width = values.shape
+    dtype = np.int32 if values.dtype == np.bool_ else values.dtype
+    padded = np.pad(values.astype(dtype, copy=False), 1)
+    total = np.zeros(values.shape, dtype=dtype)
+    for dx, dy in all_offsets if diagonals else orthogonal_offsets:
+        total += padded[1 + dy : 1 + dy + height, 1 + dx : 1 + dx + width]
+    return total
+
+
+def cascade(
+    values: "np.ndarray", threshold: int, diagonals: bool = True
+) -> "np.ndarray":
+    """
+    every cell above threshold fires once, adding 1 to each of its neighbours,
+    which may push them over the threshold in turn. values is updated in place
+    and the mask of cells that fired is returned
+    """
+    _require_numpy()
+    fired = np.zeros(values.shape, dtype=np.bool_)
+    firing = values > threshold
+    while firing.any():
+        fired |= firing
+        values += neighbour_sum(firing, diagonals).astype(values.dtype, copy=False)
+        firing = (values > threshold) & ~fired
+    return fired
+
+
+def _edges(mask: "np.ndarray", diagonals: bool) -> tuple["np.ndarray", "np.ndarray"]:
+    """flat index pairs of neighbouring cells that are both in mask"""
+    height, width = mask.shape
+    index = np.arange(height * width).reshape(height, width)
+    # half the offsets is enough, every edge is found from one of its ends
+    offsets = [(1, 0), (0, 1)] + ([(1, 1), (-1, 1)] if diagonals else [])
+    sources = []
+    targets = []
+    for dx, dy in offsets:
+        x_from = slice(max(0, -dx), width - max(0, dx))
+        x_to = slice(max(0, dx), width - max(0, -dx))
+        both = mask[: -dy or None, x_from] & mask[dy:, x_to]
+        sources.append(index[: -dy or None, x_from][both])
+        targets.append(index[dy:, x_to][both])
+    return np.concatenate(sources), np.concatenate(targets)
+
+
+def label(mask: "np.ndarray", diagonals: bool = False) -> tuple["np.ndarray", int]:
+    """
+    connected components of mask. returns an int32 grid holding 0 outside the
+    mask and 1..count for each component, numbered in reading order of their
+    first cell, and the count
+
+    the components are found by repeatedly hooking every edge's larger root
+    onto its smaller one and then pointer jumping until every cell points at
+    its root, which takes a few whole-array passes rather than a flood fill
+    per component
+    """
+    _require_numpy()
+    mask = np.asarray(mask, dtype=np.bool_)
+    sources, targets = _edges(mask, diagonals)
+    parent = np.arange(mask.size)
+    while True:
+        source_roots, target_roots = parent[sources], parent[targets]
+        joining = source_roots != target_roots
+        if not joining.any():
+            break
+        low, high = (
+            np.minimum(source_roots[joining], target_roots[joining]),
+            np.maximum(source_roots[joining], target_roots[joining]),
+        )
+        np.minimum.at(parent, high, low)
+        while True:
+            grandparent = parent[parent]
+            if np.array_equal(grandparent, parent):
+                break
+            parent = grandparent
+
+    flat_mask = mask.ravel()
+    labels = np.zeros(mask.size, dtype=np.int32)
+    roots, numbered = np.unique(parent[flat_mask], return_inverse=True)
+    labels[flat_mask] = numbered.ravel() + 1
+    return labels.reshape(mask.shape), len(roots)
+
+
+def component_sizes(labels: "np.ndarray", count: int) -> "np.ndarray":
+    """the number of cells in each component 1..count of a label() grid"""
+    _require_numpy()
+    return np.bincount(labels.ravel(), minlength=count + 1)[1:]
@@ -0,0 +1,140 @@
+"""
+interchangeable implementations of a day's hot operation
+
+an operation is registered once with its reference implementation, the
+plain python the puzzle was first solved with, and a way of generating
+inputs for it. other implementations are added under a backend name
+("numpy", "multiprocessing", ...) with the smallest input size they are
+worth using at
+
+    fuel_cost = backends.operation(
+        "DAY_SEVEN.cheapest_fuel_cost", cheapest_fuel_cost, examples=random_crabs
+    )
+
+    @fuel_cost.implementation("numpy", min_size=200, requires="numpy")
+    def cheapest_fuel_cost_numpy(positions, fuel_cost_is_constant=True): ...
+
+    fuel_cost.select(size=len(positions))(positions)
+
+`select` picks, in order: the backend it is asked for, the AOC_BACKEND
+environment variable when that backend implements the operation, or else
+the available implementation with the largest `min_size` the input reaches
+(leaving out the multiprocessing backend on a single cpu).
+`check` runs every available implementation against the reference on the
+registered examples, which is how aoc/test_backends.py validates them all
+"""
+
+import os
+import random
+from dataclasses import dataclass, field
+from importlib.util import find_spec
+from typing import Any, Callable, Optional
+
+reference = "python"
+# only chosen automatically when there is more than one cpu to spread over
+parallel = "multiprocessing"
+
+
+@dataclass(frozen=True)
+class Implementation:
+    backend: str
+    func: Callable
+    min_size: int = 0
+    requires: Optional[str] = None
+
+    @property
+    def available(self) -> bool:
+        return self.requires is None or installed(self.requires)
+
+
+@dataclass
+class Operation:
+    name: str
+    # (rng, size) to the positional arguments for one call
+    examples: Callable[[random.Random, int], tuple]
+    implementations: dict[str, Implementation] = field(default_factory=dict)
+
+    def implementation(
+        self, backend: str, min_size: int = 0, requires: Optional[str] = None
+    ) -> Callable[[Callable], Callable]:
+        def register(func: Callable) -> Callable:
+            self.implementations[backend] = Implementation(
+                backend, func, min_size, requires
+            )
+            return func
+
+        return register
+
+    def available(self) -> dict[str, Implementation]:
+        return {
+            backend: implementation
+            for backend, implementation in self.implementations.items()
+            if implementation.available
+        }
+
+    def select(self, size: int = 0, backend: Optional[str] = None) -> Callable:
+        available = self.available()
+        if backend is not None:
+            if backend not in available:
+                raise KeyError(
+                    f"{self.name} has no available {backend} backend, "
+                    f"only {', '.join(available)}"
+                )
+            return available[backend].func
+        preferred = os.environ.get("AOC_BACKEND")
+        if preferred in available:
+            return available[preferred].func
+        eligible = [
+            i
+            for i in available.values()
+            if i.min_size <= size and (i.backend != parallel or worker_count() > 1)
+        ]
+        return max(eligible, key=lambda i: i.min_size).func
+
+    def check(self, seed: int = 2021, sizes=(0, 1, 10, 100)) -> list[str]:
+        """every disagreement between an available backend and the reference"""
+        expected = self.implementations[reference].func
+        mismatches = []
+        for size in sizes:
+            arguments = self.examples(random.Random(seed + size), size)
+            wanted = expected(*arguments)
+            for backend, implementation in self.available().items():
+                if backend == reference:
+                    continue
+                got = implementation.func(*arguments)
+                if got != wanted:
+                    mismatches.append(
+                        f"{self.name} {backend} at size {size}: "
+                        f"{got!r} != {wanted!r}"
+                    )
+        return mismatches
+
+
+operations: dict[str, Operation] = {}
+
+
+def operation(
+    name: str, func: Callable, examples: Callable[[random.Random, int], tuple]
+) -> Operation:
+    """registers func as the reference implementation of a new operation"""
+    registered = Operation(name, examples)
+    registered.implementation(reference)(func)
+    operations[name] = registered
+    return registered
+
+
+def installed(module: str) -> bool:
+    """whether module can be imported, without importing it"""
+    return find_spec(module) is not None
+
+
+def worker_count() -> int:
+    return os.cpu_count() or 1
+
+
+def parallel_map(func: Callable[..., Any], argument_lists: list[tuple]) -> list:
+    """func(*arguments) for each of argument_lists, across a process pool"""
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=worker_count()) as pool:
+        return list(pool.map(func, *zip(*argument_lists)))
@@ -0,0 +1,133 @@
+"""
+cooperative limits on how long a solve may run and how much memory it may use
+
+    from lib import budget
+
+    def explore(...):
+        budget.checkpoint("caves")
+        ...
+
+    with budget.Budget(seconds=60, memory_bytes=2 << 30):
+        explore(...)
+
+long running loops call `checkpoint` as they go, naming what they are
+counting. outside a budget it is a function that ignores its arguments.
+inside `with Budget(...)` every call adds to that budget's progress, and once
+`check_every` units of work have been counted the elapsed time, the resident
+memory of the process and whether the budget has been cancelled are checked.
+the first limit found to be passed raises BudgetExceeded out of the loop,
+carrying the progress made so far, so a batch can report how far a solve got
+rather than hang or be killed for running out of memory
+
+`cancel()` stops whatever budget is in effect at its next check, and is safe
+to call from a signal handler or another thread. budgets nest, and an inner
+budget checks the limits of the ones around it too
+"""
+
+import os
+import sys
+import time
+from typing import Optional
+
+# how many units of work are counted between checks of the clock and memory
+check_every = 10_000
+
+
+class BudgetExceeded(Exception):
+    """limit is "time", "memory" or "cancelled" """
+
+    def __init__(self, limit: str, progress: dict[str, int], seconds: float):
+        super().__init__(limit, progress, seconds)
+        self.limit = limit
+        self.progress = progress
+        self.seconds = seconds
+
+    def __str__(self) -> str:
+        done = ", ".join(f"{count} {what}" for what, count in self.progress.items())
+        return f"{self.limit} budget exceeded after {self.seconds:.2f}s ({done})"
+
+
+def resident_bytes() -> int:
+    """the memory this process has resident now, or at its peak where now is unknown"""
+    try:
+        with open("/proc/self/statm", "rb") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # kilobytes, except on macOS
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+class Budget:
+    def __init__(
+        self,
+        seconds: Optional[float] = None,
+        memory_bytes: Optional[int] = None,
+        check_every: int = check_every,
+    ):
+        self.seconds = seconds
+        self.memory_bytes = memory_bytes
+        self.check_every = check_every
+        self.progress: dict[str, int] = {}
+        self.cancelled = False
+        self.started = time.monotonic()
+        self._until_check = check_every
+        self._outer: Optional[Budget] = None
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started
+
+    def cancel(self) -> None:
+        self.cancelled = True
+
+    def spend(self, what: str, count: int = 1) -> None:
+        progress = self.progress
+        progress[what] = progress.get(what, 0) + count
+        self._until_check -= count
+        if self._until_check <= 0:
+            self._until_check = self.check_every
+            self.check()
+
+    def check(self) -> None:
+        """raises BudgetExceeded if this budget, or one around it, is spent"""
+        if self.cancelled:
+            self._exceeded("cancelled")
+        if self.seconds is not None and self.elapsed > self.seconds:
+            self._exceeded("time")
+        if self.memory_bytes is not None and resident_bytes() > self.memory_bytes:
+            self._exceeded("memory")
+        if self._outer is not None:
+            self._outer.check()
+
+    def _exceeded(self, limit: str) -> None:
+        raise BudgetExceeded(limit, dict(self.progress), self.elapsed)
+
+    def __enter__(self) -> "Budget":
+        global active, checkpoint
+        self._outer = active
+        self.started = time.monotonic()
+        active = self
+        checkpoint = self.spend
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        global active, checkpoint
+        active = self._outer
+        checkpoint = _ignore if active is None else active.spend
+
+
+def _ignore(what: str, count: int = 1) -> None:
+    pass
+
+
+active: Optional[Budget] = None
+checkpoint = _ignore
+
+
+def cancel() -> None:
+    """stops the budget in effect, if there is one, at its next check"""
+    if active is not None:
+        active.cancel()
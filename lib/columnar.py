@@ -0,0 +1,128 @@
+"""
+parse a text input once, then memory map the parsed columns on later runs
+
+    def parse_vents(path) -> dict[str, array]:
+        ...  # text to one array per column
+
+    columns = columnar.load(path, "DAY_FIVE.vents/1", parse_vents)
+    columns["x1"][0]
+
+the first load runs the parser and writes its columns to `<input>.columns`
+next to the input. later loads map that file and hand back a memoryview per
+column cast to the column's type, so nothing is parsed or even copied until
+it is read. variable length records are stored the usual columnar way, as a
+column of offsets into a column of data
+
+the file is rebuilt when the input's size or modification time changes, or
+when the parser's key changes, so bump the version in the key whenever a
+parser's output changes. AOC_COLUMNAR=0 turns the cache off, and an input in
+a directory that cannot be written to is simply parsed every time
+"""
+
+import json
+import mmap
+import os
+import struct
+from array import array
+from pathlib import Path
+from typing import Callable, Optional, Union
+
+enabled = os.environ.get("AOC_COLUMNAR") != "0"
+suffix = ".columns"
+
+_magic = b"AOCCOL1\n"
+# the header's length follows the magic, then the JSON header, then the data
+_header_length = struct.Struct("<Q")
+_alignment = 8
+
+Columns = dict[str, Union[array, memoryview]]
+
+
+def columns_path(path: Path) -> Path:
+    path = Path(path)
+    return path.with_name(path.name + suffix)
+
+
+def _source(path: Path) -> dict:
+    stat = os.stat(path)
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def _aligned(offset: int) -> int:
+    return -(-offset // _alignment) * _alignment
+
+
+def save(path: Path, key: str, columns: dict[str, array]) -> Path:
+    """writes columns parsed from the input at path, returns where to"""
+    layout = []
+    offset = 0
+    for name, column in columns.items():
+        layout.append(
+            {
+                "name": name,
+                "typecode": column.typecode,
+                "offset": offset,
+                "length": len(column),
+            }
+        )
+        offset = _aligned(offset + len(column) * column.itemsize)
+    header = json.dumps(
+        {"key": key, "source": _source(path), "columns": layout}
+    ).encode()
+    data_start = _aligned(len(_magic) + _header_length.size + len(header))
+
+    target = columns_path(path)
+    temporary = target.with_suffix(f".{os.getpid()}.tmp")
+    with open(temporary, "wb") as f:
+        f.write(_magic + _header_length.pack(len(header)) + header)
+        for entry, column in zip(layout, columns.values()):
+            f.write(b"\0" * (data_start + entry["offset"] - f.tell()))
+            column.tofile(f)
+    os.replace(temporary, target)
+    return target
+
+
+def _read(path: Path, key: str) -> Optional[Columns]:
+    try:
+        with open(columns_path(path), "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+    prefix = len(_magic) + _header_length.size
+    if mapped[: len(_magic)] != _magic:
+        return None
+    try:
+        (header_length,) = _header_length.unpack(mapped[len(_magic) : prefix])
+        header = json.loads(mapped[prefix : prefix + header_length])
+    except (struct.error, ValueError):
+        # half written by something other than save, which renames into place
+        return None
+    if header["key"] != key or header["source"] != _source(path):
+        return None
+
+    data_start = _aligned(prefix + header_length)
+    view = memoryview(mapped)
+    columns = {}
+    for entry in header["columns"]:
+        itemsize = array(entry["typecode"]).itemsize
+        start = data_start + entry["offset"]
+        columns[entry["name"]] = view[start : start + entry["length"] * itemsize].cast(
+            entry["typecode"]
+        )
+    return columns
+
+
+def load(path: Path, key: str, parse: Callable[[Path], dict[str, array]]) -> Columns:
+    """the columns of the input at path, parsed only if they are not on disk"""
+    if not enabled:
+        return parse(path)
+    columns = _read(path, key)
+    if columns is not None:
+        return columns
+    columns = parse(path)
+    try:
+        save(path, key, columns)
+    except OSError:
+        pass
+    return columns
@@ -0,0 +1,96 @@
+"""
+points on an unbounded plane packed into a single int
+
+a point (x, y) packs to `(y + bias) << 32 | (x + bias)`, so any x and y that
+fit in a signed 32 bit int round trip, and sets and dicts of points become
+sets and dicts of small ints, which hash without calling back into python.
+packed points sort in reading order (by y, then by x)
+
+because each half is biased to be non-negative, moving a point is one
+addition: `packed + offset(dx, dy)` is the packed form of (x + dx, y + dy)
+for as long as both stay in range. a straight or 45 degree line is therefore
+just a `range` of packed points, see `line`
+
+on a grid of known width use lib.grid instead, where a cell is the flat
+index `y * width + x` and NeighbourTable keeps neighbours inside the edges
+"""
+
+from typing import NamedTuple
+
+_bits = 32
+_bias = 1 << (_bits - 1)
+_mask = (1 << _bits) - 1
+_row = 1 << _bits
+
+
+class Point(NamedTuple):
+    """
+    an (x, y) pair for APIs that want named fields, it is a tuple so it hashes
+    and compares as cheaply as one, and equals the plain (x, y) tuple
+    """
+
+    x: int
+    y: int
+
+    @property
+    def packed(self) -> int:
+        return pack(self.x, self.y)
+
+
+def pack(x: int, y: int) -> int:
+    return ((y + _bias) << _bits) | (x + _bias)
+
+
+def unpack(packed: int) -> Point:
+    return Point((packed & _mask) - _bias, (packed >> _bits) - _bias)
+
+
+def x_of(packed: int) -> int:
+    return (packed & _mask) - _bias
+
+
+def y_of(packed: int) -> int:
+    return (packed >> _bits) - _bias
+
+
+def offset(dx: int, dy: int) -> int:
+    """what to add to a packed point to move it by (dx, dy)"""
+    return dy * _row + dx
+
+
+# (dx, dy) in the order lib.grid visits them, as offsets to add to packed points
+orthogonal_offsets = tuple(
+    offset(dx, dy) for (dx, dy) in ((-1, 0), (0, -1), (1, 0), (0, 1))
+)
+all_offsets = tuple(
+    offset(dx, dy)
+    for (dx, dy) in (
+        (-1, -1),
+        (0, -1),
+        (1, -1),
+        (-1, 0),
+        (1, 0),
+        (-1, 1),
+        (0, 1),
+        (1, 1),
+    )
+)
+
+
+def neighbours(packed: int, diagonals: bool = False) -> list[int]:
+    return [packed + o for o in (all_offsets if diagonals else orthogonal_offsets)]
+
+
+def line(start: int, end: int) -> range:
+    """
+    every packed point from start to end inclusive, which must be in a
+    horizontal, vertical or 45 degree diagonal line
+    """
+    dx = x_of(end) - x_of(start)
+    dy = y_of(end) - y_of(start)
+    if dx and dy and abs(dx) != abs(dy):
+        raise ValueError(
+            f"{unpack(start)} to {unpack(end)} is not horizontal, vertical or diagonal"
+        )
+    step = offset((dx > 0) - (dx < 0), (dy > 0) - (dy < 0)) or 1
+    return range(start, end + step, step)
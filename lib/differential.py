@@ -0,0 +1,241 @@
+"""
+differential testing of every registered backend against its reference
+
+each operation in lib.backends comes with a seeded generator of its
+arguments. `run` calls the reference and every other available backend on
+thousands of generated inputs and compares the answers. an input the
+reference itself rejects by raising is skipped rather than failed, so the
+reference decides what a valid input is
+
+the first disagreement is shrunk: lists get shorter, ints move towards zero,
+digits towards 0 and bools to False, for as long as the smaller input still
+disagrees. list arguments of the same length are taken to be columns of one
+table and lose the same rows together, so they stay aligned. what is left is
+reported as a call that can be pasted into a test
+
+    python -m lib.differential --cases 5000 DAY_FIVE.count_overlaps
+"""
+
+import argparse
+import contextlib
+import copy
+import importlib
+import io
+import random
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Collection, Iterator, Optional
+
+from lib import backends
+
+repository_root = Path(__file__).parent.parent
+
+
+@dataclass(frozen=True)
+class Mismatch:
+    operation: str
+    backend: str
+    case: int
+    arguments: tuple
+    expected: Any
+    got: Any
+
+    def __str__(self) -> str:
+        arguments = ", ".join(repr(a) for a in self.arguments)
+        return (
+            f"{self.operation} {self.backend} disagrees with the reference at case "
+            f"{self.case}, shrunk to\n"
+            f"    ({arguments})\n"
+            f"    expected {self.expected!r}\n"
+            f"    got      {self.got!r}"
+        )
+
+
+@dataclass(frozen=True)
+class Report:
+    operation: str
+    backends: tuple[str, ...]
+    cases: int
+    # inputs the reference raised on
+    skipped: int
+    mismatch: Optional[Mismatch]
+
+
+class _Raised:
+    """stands in for the result of a call that raised, equal to the same error"""
+
+    def __init__(self, e: BaseException):
+        self.error = f"{type(e).__name__}: {e}"
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, _Raised) and other.error == self.error
+
+    def __repr__(self) -> str:
+        return f"raised {self.error}"
+
+
+def load_operations() -> dict[str, backends.Operation]:
+    """imports every DAY_* module, which registers their operations"""
+    for path in sorted(repository_root.glob("DAY_*/*.py")):
+        if not path.name.startswith("test_"):
+            importlib.import_module(f"{path.parent.name}.{path.stem}")
+    return backends.operations
+
+
+def outcome(func: Callable, arguments: tuple) -> Any:
+    """func's answer for a copy of arguments, or a _Raised if it raised"""
+    # the original A* prints the path it finds
+    with contextlib.redirect_stdout(io.StringIO()):
+        try:
+            return func(*copy.deepcopy(arguments))
+        except Exception as e:
+            return _Raised(e)
+
+
+def disagrees(reference: Callable, variant: Callable, arguments: tuple) -> bool:
+    expected = outcome(reference, arguments)
+    return not isinstance(expected, _Raised) and outcome(variant, arguments) != expected
+
+
+def _removals(length: int) -> Iterator[range]:
+    """runs of indices to try removing, the biggest first"""
+    size = length
+    while size:
+        for start in range(0, length, size):
+            yield range(start, min(start + size, length))
+        size //= 2
+
+
+def _without(sequence, removed: range):
+    return sequence[: removed.start] + sequence[removed.stop :]
+
+
+def _simpler_values(value: Any, remove: bool = True) -> Iterator[Any]:
+    if isinstance(value, bool):
+        if value:
+            yield False
+    elif isinstance(value, int):
+        if value:
+            yield 0
+            if abs(value) > 2:
+                yield int(value / 2)
+            yield value - (1 if value > 0 else -1)
+    elif isinstance(value, str):
+        if remove:
+            for removed in _removals(len(value)):
+                yield _without(value, removed)
+        for i, c in enumerate(value):
+            if c.isdigit() and c != "0":
+                yield value[:i] + "0" + value[i + 1 :]
+                if c != "1":
+                    yield value[:i] + str(int(c) - 1) + value[i + 1 :]
+    elif isinstance(value, (list, tuple)):
+        if remove:
+            for removed in _removals(len(value)):
+                yield _without(value, removed)
+        for i, element in enumerate(value):
+            for simpler in _simpler_values(element):
+                yield value[:i] + type(value)([simpler]) + value[i + 1 :]
+
+
+def _simpler(arguments: tuple) -> Iterator[tuple]:
+    lengths = {len(a) for a in arguments if isinstance(a, list)}
+    for length in sorted(lengths, reverse=True):
+        columns = [isinstance(a, list) and len(a) == length for a in arguments]
+        for removed in _removals(length):
+            yield tuple(
+                _without(a, removed) if column else a
+                for a, column in zip(arguments, columns)
+            )
+    for i, argument in enumerate(arguments):
+        # the rows of a top level list were removed together above
+        for simpler in _simpler_values(argument, remove=not isinstance(argument, list)):
+            yield arguments[:i] + (simpler,) + arguments[i + 1 :]
+
+
+def shrink(
+    arguments: tuple, fails: Callable[[tuple], bool], max_attempts: int = 10_000
+) -> tuple:
+    """the simplest arguments found that still fail, greedily"""
+    attempts = 0
+    improved = True
+    while improved and attempts < max_attempts:
+        improved = False
+        for candidate in _simpler(arguments):
+            attempts += 1
+            if fails(candidate):
+                arguments = candidate
+                improved = True
+                break
+            if attempts >= max_attempts:
+                break
+    return arguments
+
+
+def run(
+    operation: backends.Operation,
+    cases: int = 1000,
+    seed: int = 0,
+    max_size: int = 20,
+    only: Optional[Collection[str]] = None,
+) -> Report:
+    """compares the backends of operation, or only those named, with its reference"""
+    reference = operation.implementations[backends.reference].func
+    variants = {
+        backend: implementation.func
+        for backend, implementation in operation.available().items()
+        if backend != backends.reference and (only is None or backend in only)
+    }
+    skipped = 0
+    for case in range(cases):
+        rng = random.Random(f"{operation.name}/{seed}/{case}")
+        arguments = operation.examples(rng, rng.randint(0, max_size))
+        expected = outcome(reference, arguments)
+        if isinstance(expected, _Raised):
+            skipped += 1
+            continue
+        for backend, variant in variants.items():
+            if outcome(variant, arguments) == expected:
+                continue
+            smallest = shrink(arguments, lambda a: disagrees(reference, variant, a))
+            mismatch = Mismatch(
+                operation.name,
+                backend,
+                case,
+                smallest,
+                outcome(reference, smallest),
+                outcome(variant, smallest),
+            )
+            return Report(operation.name, tuple(variants), case + 1, skipped, mismatch)
+    return Report(operation.name, tuple(variants), cases, skipped, None)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(prog="python -m lib.differential")
+    parser.add_argument("operations", nargs="*", help="every operation by default")
+    parser.add_argument("--cases", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-size", type=int, default=20)
+    parser.add_argument(
+        "--backend",
+        action="append",
+        dest="backends",
+        help="only compare these backends with the reference, may be repeated",
+    )
+    args = parser.parse_args()
+    operations = load_operations()
+    failed = False
+    for name in args.operations or sorted(operations):
+        report = run(
+            operations[name], args.cases, args.seed, args.max_size, args.backends
+        )
+        compared = ", ".join(report.backends) or "nothing"
+        print(
+            f"{name}: {report.cases} cases against {compared}, "
+            f"{report.skipped} rejected by the reference"
+        )
+        if report.mismatch:
+            failed = True
+            print(report.mismatch)
+    sys.exit(1 if failed else 0)
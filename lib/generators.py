@@ -0,0 +1,447 @@
+"""
+seeded generators for every puzzle input format, for load and stress testing
+
+every generator takes a `random.Random` so the same seed always produces the
+same input, and yields it a line at a time so that `write_input` can stream an
+input of any size to disk without holding it in memory
+"""
+
+import argparse
+import json
+import os
+import random
+import string
+from itertools import permutations, product
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Union
+
+
+def sonar_readings(count: int, rng: random.Random) -> Iterator[str]:
+    depth = rng.randint(100, 200)
+    for _ in range(count):
+        depth = max(0, depth + rng.randint(-10, 20))
+        yield str(depth)
+
+
+def bingo(board_count: int, rng: random.Random) -> Iterator[str]:
+    drawn = list(range(100))
+    rng.shuffle(drawn)
+    yield ",".join(str(n) for n in drawn)
+    for _ in range(board_count):
+        yield ""
+        numbers = rng.sample(range(100), 25)
+        for row in range(5):
+            yield " ".join(f"{n:>2}" for n in numbers[row * 5 : row * 5 + 5])
+
+
+def vents(count: int, rng: random.Random, size: int = 1000) -> Iterator[str]:
+    for _ in range(count):
+        x1 = rng.randrange(size)
+        y1 = rng.randrange(size)
+        length = rng.randint(1, size // 2)
+        dx, dy = rng.choice(
+            [(1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (1, -1), (-1, 1), (-1, -1)]
+        )
+        x2 = min(max(x1 + dx * length, 0), size - 1)
+        y2 = min(max(y1 + dy * length, 0), size - 1)
+        if dx and dy:
+            # keep diagonals at exactly 45 degrees after clamping to the floor
+            length = min(abs(x2 - x1), abs(y2 - y1))
+            x2 = x1 + dx * length
+            y2 = y1 + dy * length
+        if (x1, y1) == (x2, y2):
+            x2 = x1 + 1 if x1 + 1 < size else x1 - 1
+        yield f"{x1},{y1} -> {x2},{y2}"
+
+
+def lanternfish(count: int, rng: random.Random) -> Iterator[str]:
+    yield ",".join(str(rng.randint(1, 5)) for _ in range(count))
+
+
+def crab_positions(count: int, rng: random.Random, spread: int = 2000) -> Iterator[str]:
+    yield ",".join(
+        str(int(rng.triangular(0, spread, spread / 4))) for _ in range(count)
+    )
+
+
+def _wall_positions(length: int, rng: random.Random) -> list[int]:
+    walls = []
+    position = rng.randint(4, 12)
+    while position < length - 3:
+        walls.append(position)
+        position += rng.randint(4, 12)
+    return walls
+
+
+def height_map(width: int, height: int, rng: random.Random) -> Iterator[str]:
+    """
+    basins walled off by complete rows and columns of 9s, each sloping down to
+    a single low point like the real puzzle's
+    """
+    column_walls = _wall_positions(width, rng)
+    row_walls = _wall_positions(height, rng)
+    column_spans = list(zip([-1] + column_walls, column_walls + [width]))
+    row_spans = list(zip([-1] + row_walls, row_walls + [height]))
+    centres = [
+        [
+            (rng.randint(x0 + 1, x1 - 1), rng.randint(y0 + 1, y1 - 1))
+            for (x0, x1) in column_spans
+        ]
+        for (y0, y1) in row_spans
+    ]
+    row_wall_set, column_wall_set = (set(row_walls), set(column_walls))
+    row_span = 0
+    for y in range(height):
+        if y in row_wall_set:
+            row_span += 1
+            yield "9" * width
+            continue
+        row = []
+        column_span = 0
+        for x in range(width):
+            if x in column_wall_set:
+                column_span += 1
+                row.append("9")
+                continue
+            cx, cy = centres[row_span][column_span]
+            row.append(str(min(8, abs(x - cx) + abs(y - cy))))
+        yield "".join(row)
+
+
+def digit_grid(width: int, height: int, rng: random.Random) -> Iterator[str]:
+    for _ in range(height):
+        yield "".join(rng.choice(string.digits[1:]) for _ in range(width))
+
+
+def navigation_subsystem(
+    count: int, rng: random.Random, length: int = 100
+) -> Iterator[str]:
+    openers = "([{<"
+    closers = {"(": ")", "[": "]", "{": "}", "<": ">"}
+    for _ in range(count):
+        line = []
+        stack = []
+        corrupt_at = rng.randrange(length * 2) if rng.random() < 0.5 else -1
+        corrupted = False
+        while len(line) < length:
+            if stack and (rng.random() < 0.45):
+                expected = closers[stack.pop()]
+                if len(line) >= corrupt_at >= 0 and not corrupted:
+                    expected = rng.choice(
+                        [c for c in closers.values() if c != expected]
+                    )
+                    corrupted = True
+                line.append(expected)
+            else:
+                opener = rng.choice(openers)
+                stack.append(opener)
+                line.append(opener)
+        if not stack and not corrupted:
+            # every line is either corrupt or incomplete, never complete
+            line.append(rng.choice(openers))
+        yield "".join(line)
+
+
+def cave_links(width: int, rng: random.Random, layers: int = 10) -> Iterator[str]:
+    """
+    layers of two small caves, each cave linked to both caves in the next layer,
+    then `width` small caves between the last layer and the end so the number of
+    paths grows linearly with `width`
+    """
+    names = iter(
+        f"{a}{b}{c}"
+        for a in string.ascii_lowercase
+        for b in string.ascii_lowercase
+        for c in string.ascii_lowercase
+    )
+    previous = ["start"]
+    for _ in range(layers):
+        layer = [next(names), next(names)]
+        for a in previous:
+            for b in layer:
+                yield f"{a}-{b}"
+        previous = layer
+    funnel = next(names)
+    for a in previous:
+        yield f"{a}-{funnel}"
+    for _ in range(width):
+        cave = next(names)
+        yield f"{funnel}-{cave}"
+        yield f"{cave}-end"
+
+
+def _unfold(position: int, folds: list[int], size: int, rng: random.Random) -> int:
+    """
+    a position on paper folded at each of folds in turn moved back out to the
+    paper before any folding, reflected across each fold or not at random
+    """
+    sizes = [size] + folds[:-1]
+    for at, before in zip(reversed(folds), reversed(sizes)):
+        if 2 * at - position < before and rng.random() < 0.5:
+            position = 2 * at - position
+    return position
+
+
+def transparent_paper(
+    dot_count: int, rng: random.Random, width: int = 1311, height: int = 895
+) -> Iterator[str]:
+    """
+    each fold is exactly half way across the paper, so `width` and `height`
+    need to be one less than a power of two times the final size. dots are
+    placed on the folded paper and unfolded, so no dot ever sits on a fold
+    line, before or after the folds ahead of it
+    """
+    folds = []
+    folded_width, folded_height = (width, height)
+    while folded_width > 40 or folded_height > 6:
+        if folded_width > 40:
+            folded_width //= 2
+            folds.append(("x", folded_width))
+        if folded_height > 6:
+            folded_height //= 2
+            folds.append(("y", folded_height))
+    x_folds = [at for (axis, at) in folds if axis == "x"]
+    y_folds = [at for (axis, at) in folds if axis == "y"]
+
+    for _ in range(dot_count):
+        x = _unfold(rng.randrange(folded_width), x_folds, width, rng)
+        y = _unfold(rng.randrange(folded_height), y_folds, height, rng)
+        yield f"{x},{y}"
+    yield ""
+    for axis, at in folds:
+        yield f"fold along {axis}={at}"
+
+
+def polymer(template_length: int, rng: random.Random) -> Iterator[str]:
+    elements = "BCFHKNOPSV"
+    yield "".join(rng.choice(elements) for _ in range(template_length))
+    yield ""
+    for a in elements:
+        for b in elements:
+            yield f"{a}{b} -> {rng.choice(elements)}"
+
+
+def _literal_packet(rng: random.Random) -> str:
+    value = f"{rng.randrange(1 << 16):b}"
+    value = value.zfill(-(-len(value) // 4) * 4)
+    groups = [value[i : i + 4] for i in range(0, len(value), 4)]
+    version = f"{rng.randrange(8):03b}"
+    return version + "100" + "".join(f"1{g}" for g in groups[:-1]) + f"0{groups[-1]}"
+
+
+def _operator_header(rng: random.Random, type_id: int) -> str:
+    return f"{rng.randrange(8):03b}{type_id:03b}"
+
+
+def _bits_packet(rng: random.Random, budget: int, depth: int = 0) -> str:
+    if budget <= 1 or depth >= 8 or rng.random() < 0.3:
+        return _literal_packet(rng)
+
+    type_id = rng.choice([0, 1, 2, 3, 5, 6, 7])
+    children = 2 if type_id >= 5 else rng.randint(1, min(budget, 8))
+    share = max(1, (budget - 1) // children)
+    inner = "".join(_bits_packet(rng, share, depth + 1) for _ in range(children))
+    header = _operator_header(rng, type_id)
+    if rng.random() < 0.5 and len(inner) < 1 << 15:
+        return header + "0" + f"{len(inner):015b}" + inner
+    return header + "1" + f"{children:011b}" + inner
+
+
+def bits_transmission(packet_count: int, rng: random.Random) -> Iterator[str]:
+    """
+    one line of hexadecimal, yielded in pieces: an outer sum packet counting its
+    sub-packets so each one can be written as soon as it is built. the count is
+    11 bits so the outer packet holds at most 2047 sub-packets of ~100 each
+    """
+    children = max(1, packet_count // 100)
+    pending = _operator_header(rng, 0) + "1" + f"{min(children, 2047):011b}"
+    for _ in range(min(children, 2047)):
+        pending += _bits_packet(rng, min(packet_count, 100))
+        whole = len(pending) - len(pending) % 4
+        yield "".join(f"{int(pending[i : i + 4], 2):X}" for i in range(0, whole, 4))
+        pending = pending[whole:]
+    if pending:
+        pending += "0" * (-len(pending) % 4)
+        yield f"{int(pending, 2):X}"
+
+
+def exploding_snail_numbers(count: int, rng: random.Random) -> Iterator[str]:
+    """numbers with a single pair nested inside four pairs, down the left side"""
+    for _ in range(count):
+        digits = tuple(rng.randint(0, 9) for _ in range(6))
+        yield "[[[[[%d,%d],%d],%d],%d],%d]" % digits
+
+
+def _snail_number(rng: random.Random, depth: int) -> str:
+    if depth == 4 or (depth > 0 and rng.random() < 0.35):
+        return str(rng.randint(0, 9))
+    return f"[{_snail_number(rng, depth + 1)},{_snail_number(rng, depth + 1)}]"
+
+
+def snail_numbers(count: int, rng: random.Random) -> Iterator[str]:
+    """reduced snailfish numbers: nested no more than four deep, no value over 9"""
+    for _ in range(count):
+        yield _snail_number(rng, 0)
+
+
+digit_segments = [
+    "abcefg",
+    "cf",
+    "acdeg",
+    "acdfg",
+    "bcdf",
+    "abdfg",
+    "abdefg",
+    "acf",
+    "abcdefg",
+    "abcdfg",
+]
+
+
+def signal_entries(count: int, rng: random.Random) -> Iterator[str]:
+    """ten scrambled unique signal patterns then a four digit output value"""
+    for _ in range(count):
+        wires = list("abcdefg")
+        rng.shuffle(wires)
+        scramble = str.maketrans("abcdefg", "".join(wires))
+
+        def pattern(digit: int) -> str:
+            segments = list(digit_segments[digit].translate(scramble))
+            rng.shuffle(segments)
+            return "".join(segments)
+
+        digits = list(range(10))
+        rng.shuffle(digits)
+        unique = " ".join(pattern(d) for d in digits)
+        output = " ".join(pattern(rng.randrange(10)) for _ in range(4))
+        yield f"{unique} | {output}"
+
+
+def _rotations() -> list[Callable[[tuple[int, int, int]], tuple[int, int, int]]]:
+    rotations = []
+    for axes in permutations(range(3)):
+        # a permutation of the axes is a proper rotation when its sign matches
+        # the product of the axis flips
+        parity = sum(1 for i in range(3) for j in range(i + 1, 3) if axes[i] > axes[j])
+        for signs in product([1, -1], repeat=3):
+            if (signs[0] * signs[1] * signs[2]) == (-1 if parity % 2 else 1):
+                rotations.append(
+                    lambda p, axes=axes, signs=signs: tuple(
+                        signs[i] * p[axes[i]] for i in range(3)
+                    )
+                )
+    return rotations
+
+
+def scanner_reports(
+    scanner_count: int, rng: random.Random, beacons_per_scanner: int = 26
+) -> Iterator[str]:
+    """
+    scanners strung out along x, each sharing at least 12 beacons with the next
+
+    consecutive scanners are between 1001 and 1100 apart in x, so a scanner can
+    only ever see beacons placed for itself and its two neighbours and the
+    generator never needs more than three scanners' beacons in memory
+    """
+    rotations = _rotations()
+
+    def in_range(scanner, beacon) -> bool:
+        return all(abs(b - s) <= 1000 for (s, b) in zip(scanner, beacon))
+
+    def next_position(position):
+        x, y, z = position
+        return (
+            x + rng.randint(1001, 1100),
+            y + rng.randint(-600, 600),
+            z + rng.randint(-600, 600),
+        )
+
+    def beacons_for(scanner, following):
+        placed = set()
+        while len(placed) < 12:
+            # shared with the next scanner
+            placed.add(
+                tuple(
+                    rng.randint(max(a, b) - 1000, min(a, b) + 1000)
+                    for (a, b) in zip(scanner, following)
+                )
+            )
+        while len(placed) < beacons_per_scanner:
+            placed.add(tuple(rng.randint(c - 1000, c + 1000) for c in scanner))
+        return placed
+
+    positions = [(0, 0, 0)]
+    positions.append(next_position(positions[0]))
+    beacons = [set(), beacons_for(positions[0], positions[1])]
+    for index in range(scanner_count):
+        positions.append(next_position(positions[-1]))
+        beacons.append(beacons_for(positions[-2], positions[-1]))
+        scanner = positions[-3]
+        visible = sorted(
+            b for owned in beacons[-3:] for b in owned if in_range(scanner, b)
+        )
+        rotate = rng.choice(rotations)
+        if index:
+            yield ""
+        yield f"--- scanner {index} ---"
+        for beacon in visible:
+            relative = rotate(tuple(b - s for (b, s) in zip(beacon, scanner)))
+            yield ",".join(str(c) for c in relative)
+        positions.pop(0)
+        beacons.pop(0)
+
+
+def write_input(
+    path: Union[str, os.PathLike], lines: Iterable[str], separator: str = "\n"
+) -> Path:
+    path = Path(path)
+    with open(path, "w", newline="\n") as f:
+        first = True
+        for line in lines:
+            if not first:
+                f.write(separator)
+            f.write(line)
+            first = False
+        f.write("\n")
+    return path
+
+
+# day -> (generator, separator between the pieces it yields)
+formats: dict[str, tuple[Callable[[int, random.Random], Iterator[str]], str]] = {
+    "DAY_ONE": (sonar_readings, "\n"),
+    "DAY_FOUR": (bingo, "\n"),
+    "DAY_FIVE": (vents, "\n"),
+    "DAY_SIX": (lanternfish, "\n"),
+    "DAY_SEVEN": (crab_positions, "\n"),
+    "DAY_EIGHT": (signal_entries, "\n"),
+    "DAY_NINE": (lambda size, rng: height_map(size, size, rng), "\n"),
+    "DAY_TEN": (navigation_subsystem, "\n"),
+    "DAY_ELEVEN": (lambda size, rng: digit_grid(size, size, rng), "\n"),
+    "DAY_TWELVE": (cave_links, "\n"),
+    "DAY_THIRTEEN": (transparent_paper, "\n"),
+    "DAY_FOURTEEN": (polymer, "\n"),
+    "DAY_FIFTEEN": (lambda size, rng: digit_grid(size, size, rng), "\n"),
+    "DAY_SIXTEEN": (bits_transmission, ""),
+    "DAY_EIGHTEEN": (snail_numbers, "\n"),
+    "DAY_NINETEEN": (scanner_reports, "\n"),
+}
+
+
+def generate(day: str, size: int, path: Union[str, os.PathLike], seed: int = 0) -> Path:
+    generator, separator = formats[day]
+    return write_input(path, generator(size, random.Random(seed)), separator)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(prog="python -m lib.generators")
+    parser.add_argument("day", choices=sorted(formats))
+    parser.add_argument("size", type=int, help="lines, boards, packets... per format")
+    parser.add_argument("path", type=Path)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    written = generate(args.day, args.size, args.path, args.seed)
+    print(
+        json.dumps(
+            {"day": args.day, "path": str(written), "bytes": written.stat().st_size}
+        )
+    )
@@ -1,14 +1,115 @@
-Grid = list[list[int]]
+from array import array
+from functools import lru_cache
+from typing import Iterable, Iterator, Union
+
 Coordinate = tuple[int, int]
 LowPoints = list[tuple[int, Coordinate]]
 
+_digits = b"0123456789"
+_digit_values = bytes.maketrans(_digits, bytes(range(10)))
+_digit_characters = bytes.maketrans(bytes(range(10)), _digits)
 
-def as_grid(grid_description: str) -> Grid:
-    grid = []
-    for line in grid_description.splitlines():
-        grid.append([int(c) for c in list(line)])
 
-    return grid
+class Grid:
+    """
+    a rectangle of single digit cells held row-major in one flat byte array
+    so a cell costs one byte instead of a boxed int in a list of lists
+
+    `grid[y][x]` still works (each row is a memoryview onto the cells) but hot
+    loops should use `grid.cells[grid.index(x, y)]` and skip the row view
+    """
+
+    def __init__(self, width: int, height: int, cells: array = None):
+        if cells is None:
+            cells = array("B", bytes(width * height))
+        if len(cells) != width * height:
+            raise ValueError(
+                f"expected {width * height} cells for {width}x{height} but got {len(cells)}"
+            )
+        self.width = width
+        self.height = height
+        self.cells = cells
+        self._view = memoryview(cells)
+
+    @classmethod
+    def parse(cls, grid_description: Union[str, bytes]) -> "Grid":
+        if isinstance(grid_description, str):
+            grid_description = grid_description.encode("ascii")
+        return cls.from_rows(grid_description.splitlines())
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Union[bytes, memoryview]]) -> "Grid":
+        """
+        builds the grid one row at a time so it can be fed straight from
+        `PuzzleInput.lines()` without the whole description ever being held
+        """
+        cells = array("B")
+        width = None
+        height = 0
+        for row in rows:
+            row = bytes(row).strip()
+            if not row:
+                continue
+            if width is None:
+                width = len(row)
+            elif len(row) != width:
+                raise ValueError(
+                    f"row {height} is {len(row)} wide but the grid is {width} wide"
+                )
+            if row.translate(None, _digits):
+                raise ValueError("grid description can only contain the digits 0-9")
+
+            cells.frombytes(row.translate(_digit_values))
+            height += 1
+
+        return cls(width or 0, height, cells)
+
+    def index(self, x: int, y: int) -> int:
+        return y * self.width + x
+
+    def coordinate(self, index: int) -> Coordinate:
+        y, x = divmod(index, self.width)
+        return x, y
+
+    def rows(self) -> list[list[int]]:
+        return [row.tolist() for row in self]
+
+    def __getitem__(self, y: int) -> memoryview:
+        if not 0 <= y < self.height:
+            raise IndexError(f"row {y} is outside a grid {self.height} tall")
+        start = y * self.width
+        return self._view[start : start + self.width]
+
+    def __len__(self) -> int:
+        return self.height
+
+    def __iter__(self) -> Iterator[memoryview]:
+        for y in range(self.height):
+            yield self[y]
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Grid):
+            return (
+                self.width == other.width
+                and self.height == other.height
+                and self.cells == other.cells
+            )
+        try:
+            return self.rows() == [list(row) for row in other]
+        except TypeError:
+            return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"Grid(width={self.width}, height={self.height})"
+
+    def __str__(self) -> str:
+        return "\n".join(
+            bytes(row).translate(_digit_characters).decode() for row in self
+        )
+
+
+def as_grid(grid_description: str) -> Grid:
+    return Grid.parse(grid_description)
 
 
 def find_neighbours(
@@ -21,3 +122,58 @@ def find_neighbours(
         if 0 <= n[0] <= max_col and 0 <= n[1] <= max_row:
             neighbours.append(n)
     return neighbours
+
+
+# (dx, dy) in the order find_neighbours and the octopus cavern visit them
+orthogonal_offsets = ((-1, 0), (0, -1), (1, 0), (0, 1))
+all_offsets = (
+    (-1, -1),
+    (0, -1),
+    (1, -1),
+    (-1, 0),
+    (1, 0),
+    (-1, 1),
+    (0, 1),
+    (1, 1),
+)
+
+
+class NeighbourTable:
+    """
+    the flat index of every in-bounds neighbour of every cell in a width x height
+    grid, stored compressed-sparse-row style: the neighbours of cell `i` are
+    `indices[offsets[i] : offsets[i + 1]]`
+
+    hot loops should hold on to `offsets` and `indices` and walk the range
+    between them so that looking up neighbours allocates nothing
+    """
+
+    def __init__(self, width: int, height: int, diagonals: bool = False):
+        self.width = width
+        self.height = height
+        self.diagonals = diagonals
+        self.offsets = array("I", [0])
+        self.indices = array("I")
+
+        deltas = all_offsets if diagonals else orthogonal_offsets
+        for y in range(height):
+            for x in range(width):
+                for (dx, dy) in deltas:
+                    nx = x + dx
+                    ny = y + dy
+                    if 0 <= nx < width and 0 <= ny < height:
+                        self.indices.append(ny * width + nx)
+                self.offsets.append(len(self.indices))
+
+        self._view = memoryview(self.indices)
+
+    def __getitem__(self, index: int) -> memoryview:
+        return self._view[self.offsets[index] : self.offsets[index + 1]]
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+
+@lru_cache(maxsize=16)
+def neighbour_table(width: int, height: int, diagonals: bool = False) -> NeighbourTable:
+    return NeighbourTable(width, height, diagonals)
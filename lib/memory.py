@@ -0,0 +1,152 @@
+"""
+peak memory and the biggest allocation sites of each phase of a solve
+
+    tracker = MemoryTracker(top=10)
+    with tracker:
+        with tracker.phase("parse"):
+            parsed = parse(path)
+        with tracker.phase("solve"):
+            answer = solve(parsed)
+    print(tracker.report())
+
+a phase records the highest traced memory reached while it ran (peak), how
+much more was live at its end than at its start (retained) and the source
+lines holding the most memory at the peak. a solver's working set is usually
+freed before it returns, so while a phase runs a background thread polls the
+traced total and snapshots the allocations whenever it reaches a new high;
+the sites come from the highest of those snapshots, or from the end of the
+phase when it was too quick to be sampled
+
+tracemalloc slows allocation heavy code down several times over, so this is
+for finding out where the memory goes, not for timing
+"""
+
+import threading
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+# allocations made by the tracking itself, or by importing a day's module
+_ignored = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, __file__),
+    tracemalloc.Filter(False, threading.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+)
+
+
+@dataclass
+class AllocationSite:
+    location: str
+    size_bytes: int
+    count: int
+
+
+@dataclass
+class PhaseMemory:
+    phase: str
+    peak_bytes: int
+    retained_bytes: int
+    sites: list[AllocationSite] = field(default_factory=list)
+
+
+def _mib(size_bytes: int) -> str:
+    return f"{size_bytes / 1024 / 1024:.2f}MiB"
+
+
+class _PeakSampler(threading.Thread):
+    """snapshots the traced allocations each time they grow by a tenth"""
+
+    def __init__(self, interval: float):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.snapshot = None
+        self.snapshot_bytes = 0
+        self.stopped = threading.Event()
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            current, _ = tracemalloc.get_traced_memory()
+            if current > self.snapshot_bytes * 1.1:
+                self.snapshot = tracemalloc.take_snapshot()
+                self.snapshot_bytes = current
+
+    def stop(self):
+        self.stopped.set()
+        self.join()
+
+
+class MemoryTracker:
+    def __init__(self, top: int = 10, interval: float = 0.01):
+        self.top = top
+        self.interval = interval
+        self.phases: dict[str, PhaseMemory] = {}
+        self._started_tracing = False
+
+    def __enter__(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        return self
+
+    def __exit__(self, *exc_info):
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+        return False
+
+    @contextmanager
+    def phase(self, name: str):
+        before = tracemalloc.take_snapshot().filter_traces(_ignored)
+        current_before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        sampler = _PeakSampler(self.interval)
+        sampler.start()
+        try:
+            yield
+        finally:
+            sampler.stop()
+            current_after, peak = tracemalloc.get_traced_memory()
+            if sampler.snapshot_bytes > current_after:
+                at_peak = sampler.snapshot
+            else:
+                at_peak = tracemalloc.take_snapshot()
+            growth = [
+                difference
+                for difference in at_peak.filter_traces(_ignored).compare_to(
+                    before, "lineno"
+                )
+                if difference.size_diff > 0
+            ]
+            self.phases[name] = PhaseMemory(
+                name,
+                peak,
+                current_after - current_before,
+                [
+                    AllocationSite(
+                        str(difference.traceback[0]),
+                        difference.size_diff,
+                        difference.count_diff,
+                    )
+                    for difference in growth[: self.top]
+                ],
+            )
+
+    @property
+    def peak_bytes(self) -> int:
+        return max((phase.peak_bytes for phase in self.phases.values()), default=0)
+
+    def report(self) -> str:
+        lines = []
+        for phase in self.phases.values():
+            lines.append(
+                f"{phase.phase}: peak {_mib(phase.peak_bytes)}, "
+                f"retained {_mib(phase.retained_bytes)}"
+            )
+            for site in phase.sites:
+                lines.append(
+                    f"  {_mib(site.size_bytes):>10} {site.count:>9} blocks  "
+                    f"{site.location}"
+                )
+        return "\n".join(lines)
@@ -0,0 +1,178 @@
+"""
+opt-in counters and timers for named hot paths
+
+    @hot_path
+    def take_step(...): ...
+
+    with hot_path("DAY_NINE.basins"):
+        ...
+
+profiling is off unless AOC_PROFILE=1 is set or `enable()` is called. while
+it is off `hot_path` hands decorated functions back untouched, so a hot path
+costs nothing at all, which means `enable()` has to run before the modules
+being profiled are imported. the context manager form checks the flag each
+time it is entered
+
+for every hot path the profile records how often it ran, the time spent in
+it (cumulative), the time spent in it but not in a nested hot path (self)
+and the net number of memory blocks it left allocated. `report()` formats
+those as a table and `collapsed_stacks()` as the collapsed stack format
+that flamegraph.pl and speedscope both read
+"""
+
+import os
+import sys
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from functools import wraps
+from pathlib import Path
+from typing import Callable, Optional, Union
+
+enabled = os.environ.get("AOC_PROFILE") == "1"
+
+
+@dataclass
+class HotPathStats:
+    calls: int = 0
+    cumulative_seconds: float = 0.0
+    self_seconds: float = 0.0
+    allocated_blocks: int = 0
+
+
+stats: dict[str, HotPathStats] = defaultdict(HotPathStats)
+# self time in seconds keyed by the stack of hot path names leading to it
+_stacks: dict[tuple[str, ...], float] = defaultdict(float)
+# [name, started, seconds spent in nested hot paths, blocks when started] for
+# each hot path being run. the solvers are single threaded, batches use processes
+_frames: list[list] = []
+
+
+def enable() -> None:
+    global enabled
+    enabled = True
+
+
+def disable() -> None:
+    global enabled
+    enabled = False
+
+
+def reset() -> None:
+    stats.clear()
+    _stacks.clear()
+
+
+def _enter(name: str) -> None:
+    _frames.append([name, time.perf_counter(), 0.0, sys.getallocatedblocks()])
+
+
+def _exit() -> None:
+    now = time.perf_counter()
+    frames = _frames
+    name, started, nested_seconds, blocks_before = frames.pop()
+    elapsed = now - started
+    self_seconds = elapsed - nested_seconds
+
+    entry = stats[name]
+    entry.calls += 1
+    entry.self_seconds += self_seconds
+    callers = tuple(frame[0] for frame in frames)
+    if name not in callers:
+        # a recursive call's time is already inside the outermost call
+        entry.cumulative_seconds += elapsed
+        entry.allocated_blocks += sys.getallocatedblocks() - blocks_before
+    _stacks[callers + (name,)] += self_seconds
+
+    if frames:
+        frames[-1][2] += elapsed
+
+
+class _HotPath:
+    def __init__(self, name: Optional[str]):
+        self.name = name
+
+    def __enter__(self):
+        if enabled:
+            _enter(self.name)
+            self.entered = True
+        else:
+            self.entered = False
+        return self
+
+    def __exit__(self, *exc_info):
+        if self.entered:
+            _exit()
+        return False
+
+    def __call__(self, func: Callable) -> Callable:
+        if not enabled:
+            return func
+
+        import inspect
+
+        name = self.name or f"{func.__module__}.{func.__qualname__}"
+
+        if inspect.isgeneratorfunction(func):
+            # time each resumption rather than the creation of the generator
+            @wraps(func)
+            def generator_wrapper(*args, **kwargs):
+                generator = func(*args, **kwargs)
+                while True:
+                    _enter(name)
+                    try:
+                        value = next(generator)
+                    except StopIteration as stop:
+                        return stop.value
+                    finally:
+                        _exit()
+                    yield value
+
+            return generator_wrapper
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            _enter(name)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _exit()
+
+        return wrapper
+
+
+def hot_path(name_or_func: Union[str, Callable, None] = None):
+    """a decorator, bare or given a name, or a context manager given a name"""
+    if callable(name_or_func):
+        return _HotPath(None)(name_or_func)
+    return _HotPath(name_or_func)
+
+
+def report() -> str:
+    rows = sorted(stats.items(), key=lambda item: item[1].self_seconds, reverse=True)
+    width = max([len("hot path")] + [len(name) for (name, _) in rows])
+    lines = [
+        f"{'hot path':<{width}} {'calls':>10} {'cumulative':>12} {'self':>12} "
+        f"{'per call':>12} {'blocks':>10}"
+    ]
+    for name, entry in rows:
+        per_call = entry.cumulative_seconds / entry.calls if entry.calls else 0
+        lines.append(
+            f"{name:<{width}} {entry.calls:>10} "
+            f"{entry.cumulative_seconds * 1000:>10.2f}ms "
+            f"{entry.self_seconds * 1000:>10.2f}ms "
+            f"{per_call * 1e6:>10.2f}us {entry.allocated_blocks:>10}"
+        )
+    return "\n".join(lines)
+
+
+def collapsed_stacks() -> str:
+    """one "outer;inner microseconds" line per distinct stack of hot paths"""
+    return "".join(
+        f"{';'.join(stack)} {round(seconds * 1e6)}\n"
+        for stack, seconds in sorted(_stacks.items())
+    )
+
+
+def write_collapsed_stacks(path: Path) -> None:
+    Path(path).write_text(collapsed_stacks())
@@ -0,0 +1,119 @@
+import mmap
+import os
+from pathlib import Path
+from typing import Iterator, Optional, Union
+
+_whitespace = b" \t\r\f\v"
+
+
+def _is_blank(line: memoryview) -> bool:
+    # only copy the line when it could be nothing but whitespace
+    return len(line) == 0 or (line[0] in _whitespace and line.tobytes().isspace())
+
+
+class PuzzleInput:
+    """
+    a memory mapped puzzle input that can be walked line by line without ever
+    holding the whole file as text
+
+    the memoryviews handed out by `lines` and `blocks` point straight into the
+    map so they are only valid until the input is closed. copy anything that
+    needs to outlive the `with` block (`bytes(line)`, `int(line)`, `str(...)`)
+    """
+
+    def __init__(self, path: Union[str, os.PathLike]):
+        self.path = Path(path)
+        self._file = open(self.path, "rb")
+        self._map: Optional[mmap.mmap] = None
+        self._view = memoryview(b"")
+        if os.fstat(self._file.fileno()).st_size > 0:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._view = memoryview(self._map)
+
+    def __enter__(self) -> "PuzzleInput":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._view.release()
+        if self._map is not None:
+            try:
+                self._map.close()
+            except BufferError:
+                # a caller kept a line, the map is unmapped when that is released
+                pass
+            self._map = None
+        self._file.close()
+
+    def __len__(self) -> int:
+        return len(self._view)
+
+    def lines(self) -> Iterator[memoryview]:
+        """every line without its line ending, including blank lines"""
+        if self._map is None:
+            return
+
+        found = self._map.find
+        view = self._view
+        size = len(view)
+        start = 0
+        while start < size:
+            end = found(b"\n", start)
+            if end == -1:
+                end = size
+            stop = end
+            if stop > start and view[stop - 1] == 13:  # \r
+                stop -= 1
+            yield view[start:stop]
+            start = end + 1
+
+    def ints(self, column: int = 0, separator: Optional[bytes] = None) -> Iterator[int]:
+        """the integer in `column` of every non blank line"""
+        for line in self.lines():
+            if _is_blank(line):
+                continue
+            if column == 0 and separator is None:
+                yield int(line)
+            else:
+                yield int(line.tobytes().split(separator)[column])
+
+    def blocks(self) -> Iterator[list[memoryview]]:
+        """runs of lines separated by one or more blank lines"""
+        block: list[memoryview] = []
+        for line in self.lines():
+            if _is_blank(line):
+                if block:
+                    yield block
+                    block = []
+            else:
+                block.append(line)
+        if block:
+            yield block
+
+
+def read_lines(path: Union[str, os.PathLike]) -> Iterator[str]:
+    with PuzzleInput(path) as puzzle_input:
+        for line in puzzle_input.lines():
+            text = str(line, "utf-8")
+            line.release()
+            yield text
+
+
+def read_ints(
+    path: Union[str, os.PathLike], column: int = 0, separator: Optional[str] = None
+) -> Iterator[int]:
+    with PuzzleInput(path) as puzzle_input:
+        yield from puzzle_input.ints(
+            column, separator.encode() if separator is not None else None
+        )
+
+
+def read_blocks(path: Union[str, os.PathLike]) -> Iterator[list[str]]:
+    with PuzzleInput(path) as puzzle_input:
+        for block in puzzle_input.blocks():
+            text = [str(line, "utf-8") for line in block]
+            for line in block:
+                line.release()
+            yield text
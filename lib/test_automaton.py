@@ -0,0 +1,87 @@
+import random
+from unittest import TestCase, skipUnless
+
+from lib import automaton
+from lib.grid import Grid, neighbour_table
+
+
+@skipUnless(automaton.available, "numpy is not installed")
+class TestAutomaton(TestCase):
+    def test_array_of_a_grid(self):
+        grid = Grid.parse("123\n456")
+        values = automaton.as_array(grid)
+        assert values.tolist() == [[1, 2, 3], [4, 5, 6]]
+
+        automaton.increment(values, 2)
+        assert values.tolist() == [[3, 4, 5], [6, 7, 8]]
+        assert grid.rows() == [[1, 2, 3], [4, 5, 6]]
+
+        shared = automaton.as_array(grid, copy=False)
+        assert shared.base is not None
+
+    def test_neighbour_sum(self):
+        values = automaton.as_array("111\n111\n111")
+        assert automaton.neighbour_sum(values).tolist() == [
+            [2, 3, 2],
+            [3, 4, 3],
+            [2, 3, 2],
+        ]
+        assert automaton.neighbour_sum(values, diagonals=True).tolist() == [
+            [3, 5, 3],
+            [5, 8, 5],
+            [3, 5, 3],
+        ]
+
+    def test_cascade_fires_each_cell_once(self):
+        values = automaton.as_array("11111\n19991\n19191\n19991\n11111")
+        automaton.increment(values)
+        fired = automaton.cascade(values, threshold=9)
+        values[fired] = 0
+        assert values.tolist() == [
+            [3, 4, 5, 4, 3],
+            [4, 0, 0, 0, 4],
+            [5, 0, 0, 0, 5],
+            [4, 0, 0, 0, 4],
+            [3, 4, 5, 4, 3],
+        ]
+
+    def test_label_orthogonal_and_diagonal_components(self):
+        mask = automaton.as_array("1001\n0101\n1001") == 1
+        labels, count = automaton.label(mask)
+        assert count == 4
+        assert labels.tolist() == [[1, 0, 0, 2], [0, 3, 0, 2], [4, 0, 0, 2]]
+
+        labels, count = automaton.label(mask, diagonals=True)
+        assert count == 2
+        assert labels.tolist() == [[1, 0, 0, 2], [0, 1, 0, 2], [1, 0, 0, 2]]
+        assert automaton.component_sizes(labels, count).tolist() == [3, 3]
+
+    def test_label_matches_a_flood_fill(self):
+        rng = random.Random(11)
+        width, height = (60, 40)
+        grid = Grid.parse(
+            "\n".join(
+                "".join(rng.choice("0009") for _ in range(width)) for _ in range(height)
+            )
+        )
+        labels, count = automaton.label(automaton.as_array(grid) < 9)
+
+        table = neighbour_table(width, height)
+        seen = set()
+        sizes = []
+        for start in range(len(grid.cells)):
+            if start in seen or grid.cells[start] == 9:
+                continue
+            seen.add(start)
+            to_visit = [start]
+            size = 0
+            while to_visit:
+                cell = to_visit.pop()
+                size += 1
+                for neighbour in table[cell]:
+                    if neighbour not in seen and grid.cells[neighbour] != 9:
+                        seen.add(neighbour)
+                        to_visit.append(neighbour)
+            sizes.append(size)
+
+        assert automaton.component_sizes(labels, count).tolist() == sizes
@@ -0,0 +1,71 @@
+import time
+from unittest import TestCase
+
+from lib import budget
+from lib.budget import Budget, BudgetExceeded
+
+
+def busy(units: int, what: str = "steps") -> None:
+    for _ in range(units):
+        budget.checkpoint(what)
+
+
+class TestBudget(TestCase):
+    def test_checkpoints_outside_a_budget_do_nothing(self):
+        busy(10)
+        assert budget.active is None
+
+    def test_progress_is_counted_by_name(self):
+        with Budget() as limits:
+            busy(3)
+            budget.checkpoint("bytes", 100)
+        assert limits.progress == {"steps": 3, "bytes": 100}
+        assert budget.checkpoint is budget._ignore
+
+    def test_running_out_of_time_stops_the_loop_with_its_progress(self):
+        with self.assertRaises(BudgetExceeded) as raised:
+            with Budget(seconds=0.01, check_every=100):
+                while True:
+                    budget.checkpoint("steps")
+                    time.sleep(0.0001)
+        assert raised.exception.limit == "time"
+        assert raised.exception.progress["steps"] % 100 == 0
+        assert raised.exception.seconds > 0.01
+        assert budget.active is None
+
+    def test_a_memory_ceiling_is_enforced(self):
+        with self.assertRaises(BudgetExceeded) as raised:
+            with Budget(memory_bytes=1024, check_every=10):
+                busy(10)
+        assert raised.exception.limit == "memory"
+        assert raised.exception.progress == {"steps": 10}
+
+    def test_a_cancelled_budget_stops_at_its_next_check(self):
+        with self.assertRaises(BudgetExceeded) as raised:
+            with Budget(check_every=5):
+                busy(3)
+                budget.cancel()
+                busy(3)
+        assert raised.exception.limit == "cancelled"
+        assert "3 steps" not in str(raised.exception)
+
+    def test_an_inner_budget_keeps_to_the_outer_limits(self):
+        with Budget(check_every=1) as outer:
+            outer.cancel()
+            with self.assertRaises(BudgetExceeded):
+                with Budget(seconds=60, check_every=1):
+                    busy(1)
+            assert budget.active is outer
+        assert budget.active is None
+
+    def test_the_exception_survives_pickling(self):
+        import pickle
+
+        exceeded = BudgetExceeded("time", {"caves": 12}, 1.5)
+        copied = pickle.loads(pickle.dumps(exceeded))
+        assert (copied.limit, copied.progress, copied.seconds) == (
+            "time",
+            {"caves": 12},
+            1.5,
+        )
+        assert str(copied) == "time budget exceeded after 1.50s (12 caves)"
@@ -0,0 +1,57 @@
+import os
+import tempfile
+from array import array
+from pathlib import Path
+from unittest import TestCase
+
+from lib import columnar
+
+
+def parse_numbers(path: Path) -> dict[str, array]:
+    lines = path.read_text().split()
+    return {
+        "values": array("q", [int(line) for line in lines]),
+        "lengths": array("B", [len(line) for line in lines]),
+    }
+
+
+class TestColumnar(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.path = Path(self.directory.name) / "puzzle.input"
+        self.path.write_text("12\n-7\n300\n")
+        self.parsed = 0
+
+    def load(self, key: str = "numbers/1"):
+        def parse(path: Path):
+            self.parsed += 1
+            return parse_numbers(path)
+
+        return columnar.load(self.path, key, parse)
+
+    def test_second_load_maps_the_saved_columns(self):
+        first = self.load()
+        second = self.load()
+        assert self.parsed == 1
+        assert columnar.columns_path(self.path).exists()
+        assert isinstance(second["values"], memoryview)
+        assert list(second["values"]) == list(first["values"]) == [12, -7, 300]
+        assert list(second["lengths"]) == [2, 2, 3]
+
+    def test_changing_the_input_or_the_parser_key_parses_again(self):
+        self.load()
+        self.path.write_text("1\n2\n")
+        os.utime(self.path, ns=(0, 0))
+        assert list(self.load()["values"]) == [1, 2]
+        assert self.parsed == 2
+        self.load("numbers/2")
+        assert self.parsed == 3
+        self.load("numbers/2")
+        assert self.parsed == 3
+
+    def test_a_damaged_columns_file_is_rebuilt(self):
+        self.load()
+        columnar.columns_path(self.path).write_bytes(b"AOCCOL1\n\xff")
+        assert list(self.load()["values"]) == [12, -7, 300]
+        assert self.parsed == 2
@@ -0,0 +1,48 @@
+from unittest import TestCase
+
+from lib import coordinates
+from lib.coordinates import Point, line, neighbours, offset, pack, unpack
+
+
+class TestCoordinates(TestCase):
+    def test_pack_round_trips_across_the_signed_32_bit_range(self):
+        for x, y in [(0, 0), (5, 3), (-1, -1), (2**31 - 1, -(2**31)), (-7, 9)]:
+            packed = pack(x, y)
+            assert unpack(packed) == (x, y)
+            assert coordinates.x_of(packed) == x
+            assert coordinates.y_of(packed) == y
+
+    def test_packed_points_sort_in_reading_order(self):
+        points = [(3, 1), (-2, 1), (0, -5), (9, 0), (0, 0)]
+        packed = sorted(pack(x, y) for (x, y) in points)
+        assert [unpack(p) for p in packed] == sorted(points, key=lambda p: (p[1], p[0]))
+
+    def test_moving_is_adding_an_offset(self):
+        assert pack(0, 0) + offset(-1, 1) == pack(-1, 1)
+        assert sorted(unpack(n) for n in neighbours(pack(0, 0))) == [
+            (-1, 0),
+            (0, -1),
+            (0, 1),
+            (1, 0),
+        ]
+        assert len(set(neighbours(pack(4, 4), diagonals=True))) == 8
+
+    def test_lines_are_ranges_of_packed_points(self):
+        assert [unpack(p) for p in line(pack(9, 4), pack(7, 4))] == [
+            (9, 4),
+            (8, 4),
+            (7, 4),
+        ]
+        assert [unpack(p) for p in line(pack(9, 7), pack(7, 9))] == [
+            (9, 7),
+            (8, 8),
+            (7, 9),
+        ]
+        assert [unpack(p) for p in line(pack(2, 2), pack(2, 2))] == [(2, 2)]
+        with self.assertRaises(ValueError):
+            line(pack(0, 0), pack(2, 1))
+
+    def test_points_are_plain_tuples(self):
+        assert Point(1, 2) == (1, 2)
+        assert Point(1, 2).packed == pack(1, 2)
+        assert hash(Point(1, 2)) == hash((1, 2))
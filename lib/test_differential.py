@@ -0,0 +1,83 @@
+from unittest import TestCase
+
+from lib import backends, differential
+
+
+def _total(values: list[int]) -> int:
+    return sum(values)
+
+
+def _total_forgetting_negatives(values: list[int]) -> int:
+    return sum(v for v in values if v >= 0)
+
+
+def _random_values(rng, size: int) -> tuple[list[int]]:
+    return ([rng.randint(-50, 50) for _ in range(size)],)
+
+
+class TestDifferential(TestCase):
+    def register(self, name, reference, examples, **variants):
+        self.addCleanup(backends.operations.pop, name)
+        operation = backends.operation(name, reference, examples)
+        for backend, func in variants.items():
+            operation.implementation(backend)(func)
+        return operation
+
+    def test_agreeing_backends_pass_every_case(self):
+        operation = self.register(
+            "test.agree", _total, _random_values, fast=lambda values: sum(values)
+        )
+        report = differential.run(operation, cases=200)
+        assert report == differential.Report("test.agree", ("fast",), 200, 0, None)
+
+    def test_a_disagreement_is_shrunk_to_a_minimal_input(self):
+        operation = self.register(
+            "test.disagree", _total, _random_values, fast=_total_forgetting_negatives
+        )
+        mismatch = differential.run(operation, cases=200).mismatch
+        assert mismatch.backend == "fast"
+        assert mismatch.arguments == ([-1],)
+        assert (mismatch.expected, mismatch.got) == (-1, 0)
+        assert "([-1])" in str(mismatch)
+
+    def test_an_exception_in_a_variant_is_a_disagreement(self):
+        def fragile(values):
+            return values[0] + sum(values[1:])
+
+        operation = self.register("test.fragile", _total, _random_values, fast=fragile)
+        mismatch = differential.run(operation, cases=50).mismatch
+        assert mismatch.arguments == ([],)
+        assert repr(mismatch.got).startswith("raised IndexError")
+
+    def test_inputs_the_reference_rejects_are_skipped(self):
+        def positive_total(values):
+            if any(v < 0 for v in values):
+                raise ValueError("negative")
+            return sum(values)
+
+        operation = self.register(
+            "test.rejects", positive_total, _random_values, fast=positive_total
+        )
+        report = differential.run(operation, cases=100, max_size=5)
+        assert report.mismatch is None
+        assert 0 < report.skipped < 100
+
+    def test_columns_of_the_same_length_shrink_together(self):
+        def pairs(xs, ys):
+            return [x * y for x, y in zip(xs, ys, strict=True)]
+
+        def wrong_on_seven(xs, ys):
+            return [0 if x == 7 else x * y for x, y in zip(xs, ys, strict=True)]
+
+        arguments = ([1, 7, 3, 9], [2, 4, 6, 8])
+        smallest = differential.shrink(
+            arguments, lambda a: differential.disagrees(pairs, wrong_on_seven, a)
+        )
+        assert smallest == ([7], [1])
+
+    def test_shrinking_simplifies_digits_and_ints(self):
+        def fails(arguments):
+            rows, steps = arguments
+            return steps > 3 and any("5" in row for row in rows)
+
+        assert differential.shrink((["1234", "5678"], 10), fails) == (["5"], 4)
@@ -0,0 +1,112 @@
+import json
+import random
+import tempfile
+from itertools import combinations
+from pathlib import Path
+from unittest import TestCase
+
+from lib import generators
+from lib.puzzle_input import read_blocks, read_lines
+
+
+def squared_distances(beacons: list[tuple[int, ...]]) -> set[int]:
+    return {
+        sum((a - b) ** 2 for (a, b) in zip(first, second))
+        for (first, second) in combinations(beacons, 2)
+    }
+
+
+class TestGenerators(TestCase):
+    def test_every_format_is_reproducible_from_its_seed(self):
+        for day, (generator, _) in generators.formats.items():
+            first = list(generator(20, random.Random(3)))
+            second = list(generator(20, random.Random(3)))
+            assert first == second, day
+
+    def test_inputs_stream_to_disk(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = generators.generate(
+                "DAY_FIVE", 50, Path(directory) / "vents", seed=1
+            )
+            lines = list(read_lines(path))
+
+        assert len(lines) == 50
+        assert all(" -> " in line for line in lines)
+
+    def test_vents_are_straight_or_diagonal_lines(self):
+        for line in generators.vents(500, random.Random(1)):
+            (x1, y1), (x2, y2) = [map(int, p.split(",")) for p in line.split(" -> ")]
+            assert (x1, y1) != (x2, y2)
+            assert x1 == x2 or y1 == y2 or abs(x1 - x2) == abs(y1 - y2)
+
+    def test_bingo_boards_never_repeat_a_number(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = generators.generate("DAY_FOUR", 30, Path(directory) / "bingo")
+            drawn, *boards = read_blocks(path)
+
+        assert len(boards) == 30
+        assert sorted(int(n) for n in drawn[0].split(",")) == list(range(100))
+        for board in boards:
+            numbers = " ".join(board).split()
+            assert len(numbers) == len(set(numbers)) == 25
+
+    def test_signal_entries_use_each_digit_once(self):
+        for entry in generators.signal_entries(50, random.Random(1)):
+            unique, output = entry.split(" | ")
+            lengths = sorted(len(p) for p in unique.split(" "))
+            assert lengths == [2, 3, 4, 5, 5, 5, 6, 6, 6, 7]
+            assert len(output.split(" ")) == 4
+
+    def test_bracket_lines_are_corrupt_or_incomplete(self):
+        pairs = {"(": ")", "[": "]", "{": "}", "<": ">"}
+        for line in generators.navigation_subsystem(200, random.Random(1)):
+            stack = []
+            corrupt = False
+            for c in line:
+                if c in pairs:
+                    stack.append(c)
+                elif pairs[stack.pop()] != c:
+                    corrupt = True
+                    break
+            assert corrupt or stack
+
+    def test_no_dot_sits_on_a_fold(self):
+        lines = list(generators.transparent_paper(2000, random.Random(1)))
+        blank = lines.index("")
+        folds = [f[11:].split("=") for f in lines[blank + 1 :]]
+        for dot in lines[:blank]:
+            x, y = (int(c) for c in dot.split(","))
+            assert 0 <= x < 1311 and 0 <= y < 895
+            for axis, at in folds:
+                at = int(at)
+                position = x if axis == "x" else y
+                assert position != at, f"{dot} lands on {axis}={at}"
+                if position > at:
+                    if axis == "x":
+                        x = 2 * at - x
+                    else:
+                        y = 2 * at - y
+
+    def test_snail_numbers_are_reduced(self):
+        def depth(n) -> int:
+            return 0 if isinstance(n, int) else 1 + max(depth(n[0]), depth(n[1]))
+
+        for number in generators.snail_numbers(200, random.Random(1)):
+            parsed = json.loads(number)
+            assert isinstance(parsed, list)
+            assert depth(parsed) <= 4
+            assert max(int(c) for c in number if c.isdigit()) <= 9
+
+    def test_neighbouring_scanners_share_at_least_twelve_beacons(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = generators.generate("DAY_NINETEEN", 5, Path(directory) / "scan")
+            scanners = [
+                [tuple(int(c) for c in line.split(",")) for line in block[1:]]
+                for block in read_blocks(path)
+            ]
+
+        assert len(scanners) == 5
+        for first, second in zip(scanners, scanners[1:]):
+            # 12 shared beacons have 66 pairwise distances, whatever the rotation
+            shared = squared_distances(first) & squared_distances(second)
+            assert len(shared) >= 66
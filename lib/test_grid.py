@@ -0,0 +1,60 @@
+from unittest import TestCase
+
+from lib.grid import Grid, as_grid, find_neighbours, neighbour_table
+
+example = """2199943210
+3987894921
+9856789892"""
+
+
+class TestGrid(TestCase):
+    def test_cells_are_one_flat_row_major_byte_array(self):
+        grid = as_grid(example)
+        assert grid.width == 10
+        assert grid.height == 3
+        assert grid.cells.typecode == "B"
+        assert grid.cells.itemsize == 1
+        assert grid.cells[grid.index(2, 1)] == 8
+        assert grid.coordinate(grid.index(2, 1)) == (2, 1)
+
+    def test_rows_can_still_be_indexed_as_y_then_x(self):
+        grid = as_grid(example)
+        assert grid[1][2] == 8
+        assert len(grid) == 3
+        assert len(grid[0]) == 10
+        assert grid[2].tolist() == [9, 8, 5, 6, 7, 8, 9, 8, 9, 2]
+
+    def test_parses_bytes_with_trailing_newline(self):
+        grid = Grid.parse(example.encode() + b"\n")
+        assert grid == as_grid(example)
+        assert str(grid) == example
+
+    def test_ragged_rows_are_rejected(self):
+        with self.assertRaises(ValueError):
+            as_grid("123\n12")
+
+    def test_non_digits_are_rejected(self):
+        with self.assertRaises(ValueError):
+            as_grid("12a\n123")
+
+
+class TestNeighbourTable(TestCase):
+    def test_orthogonal_table_matches_find_neighbours(self):
+        width, height = 4, 3
+        table = neighbour_table(width, height)
+        grid = Grid(width, height)
+        assert len(table) == width * height
+        for index in range(width * height):
+            expected = find_neighbours(
+                grid.coordinate(index), max_row=height - 1, max_col=width - 1
+            )
+            assert [grid.coordinate(n) for n in table[index]] == expected
+
+    def test_diagonal_table_includes_corners(self):
+        table = neighbour_table(3, 3, diagonals=True)
+        assert table[4].tolist() == [0, 1, 2, 3, 5, 6, 7, 8]
+        assert table[0].tolist() == [1, 3, 4]
+
+    def test_tables_are_built_once_per_shape(self):
+        assert neighbour_table(5, 7) is neighbour_table(5, 7)
+        assert neighbour_table(5, 7) is not neighbour_table(5, 7, diagonals=True)
@@ -0,0 +1,37 @@
+from unittest import TestCase
+
+from lib.memory import MemoryTracker
+
+
+def build_and_drop(size: int) -> int:
+    values = [str(n) for n in range(size)]
+    return len(values)
+
+
+class TestMemory(TestCase):
+    def test_records_peak_and_retained_memory_per_phase(self):
+        with MemoryTracker() as memory:
+            with memory.phase("keep"):
+                kept = [str(n) for n in range(20000)]
+            with memory.phase("drop"):
+                build_and_drop(20000)
+
+        assert list(memory.phases) == ["keep", "drop"]
+        keep = memory.phases["keep"]
+        drop = memory.phases["drop"]
+        assert keep.retained_bytes > 500_000
+        assert drop.peak_bytes > drop.retained_bytes + 500_000
+        assert memory.peak_bytes >= keep.peak_bytes
+        assert len(kept) == 20000
+
+    def test_allocation_sites_point_at_the_allocating_line(self):
+        with MemoryTracker(top=3, interval=0.001) as memory:
+            with memory.phase("keep"):
+                kept = [str(n) for n in range(20000)]
+
+        sites = memory.phases["keep"].sites
+        assert 0 < len(sites) <= 3
+        assert __file__ in sites[0].location
+        assert sites[0].size_bytes > 500_000
+        assert "keep: peak" in memory.report()
+        assert len(kept) == 20000
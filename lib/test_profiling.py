@@ -0,0 +1,78 @@
+from unittest import TestCase
+
+from lib import profiling
+from lib.profiling import hot_path
+
+
+class TestProfiling(TestCase):
+    def setUp(self):
+        was_enabled = profiling.enabled
+        self.addCleanup(lambda: setattr(profiling, "enabled", was_enabled))
+        self.addCleanup(profiling.reset)
+        profiling.reset()
+
+    def test_disabled_hot_paths_are_the_original_function(self):
+        profiling.disable()
+
+        def step():
+            return 1
+
+        assert hot_path(step) is step
+        assert hot_path("named")(step) is step
+        with hot_path("block"):
+            step()
+        assert dict(profiling.stats) == {}
+
+    def test_counts_calls_with_self_and_cumulative_time(self):
+        profiling.enable()
+
+        @hot_path("inner")
+        def inner():
+            return [n for n in range(100)]
+
+        @hot_path("outer")
+        def outer():
+            return [inner() for _ in range(3)]
+
+        outer()
+        outer()
+
+        assert profiling.stats["outer"].calls == 2
+        assert profiling.stats["inner"].calls == 6
+        outer_stats = profiling.stats["outer"]
+        assert outer_stats.self_seconds < outer_stats.cumulative_seconds
+        assert "outer" in profiling.report() and "inner" in profiling.report()
+
+    def test_recursion_is_not_counted_twice(self):
+        profiling.enable()
+
+        @hot_path("countdown")
+        def countdown(n):
+            return 0 if n == 0 else countdown(n - 1)
+
+        countdown(5)
+        entry = profiling.stats["countdown"]
+        assert entry.calls == 6
+        assert abs(entry.cumulative_seconds - entry.self_seconds) < 1e-3
+
+    def test_generators_are_timed_per_item(self):
+        profiling.enable()
+
+        @hot_path
+        def rolls():
+            yield from [1, 2, 3]
+
+        assert list(rolls()) == [1, 2, 3]
+        # three items and the resumption that finds the end
+        assert [entry.calls for entry in profiling.stats.values()] == [4]
+
+    def test_collapsed_stacks(self):
+        profiling.enable()
+        with hot_path("outer"):
+            with hot_path("inner"):
+                pass
+
+        stacks = [
+            line.split(" ")[0] for line in profiling.collapsed_stacks().splitlines()
+        ]
+        assert stacks == ["outer", "outer;inner"]
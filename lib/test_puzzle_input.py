@@ -0,0 +1,49 @@
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+from lib.puzzle_input import PuzzleInput, read_blocks, read_ints, read_lines
+
+
+class TestPuzzleInput(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def write(self, content: bytes) -> Path:
+        path = Path(self.directory.name) / "puzzle.input"
+        path.write_bytes(content)
+        return path
+
+    def test_lines_are_views_into_the_file(self):
+        path = self.write(b"199\n200\r\n\n208")
+        with PuzzleInput(path) as puzzle_input:
+            lines = [bytes(line) for line in puzzle_input.lines()]
+            assert all(isinstance(line, memoryview) for line in puzzle_input.lines())
+
+        assert lines == [b"199", b"200", b"", b"208"]
+
+    def test_read_lines_decodes_each_line(self):
+        path = self.write(b"forward 5\ndown 5\n")
+        assert list(read_lines(path)) == ["forward 5", "down 5"]
+
+    def test_empty_file_has_no_lines(self):
+        path = self.write(b"")
+        assert list(read_lines(path)) == []
+        assert list(read_blocks(path)) == []
+
+    def test_integer_columns(self):
+        path = self.write(b"1,2\n3,4\n\n5,6\n")
+        assert list(read_ints(path, column=1, separator=",")) == [2, 4, 6]
+        assert list(read_ints(self.write(b"10\n 20 \n\n30"))) == [10, 20, 30]
+
+    def test_blocks_are_split_on_blank_lines(self):
+        path = self.write(b"7,4,9\n\n22 13\n 8  2\n\n  \n 3 15\n")
+        assert list(read_blocks(path)) == [["7,4,9"], ["22 13", " 8  2"], [" 3 15"]]
+
+    def test_closing_while_a_line_is_still_held(self):
+        path = self.write(b"a\nb\n")
+        with PuzzleInput(path) as puzzle_input:
+            kept = next(puzzle_input.lines())
+
+        assert bytes(kept) == b"a"
@@ -0,0 +1,31 @@
+from unittest import TestCase
+
+from lib import trace
+
+
+class TestTrace(TestCase):
+    def setUp(self):
+        was_enabled = trace.enabled
+        self.addCleanup(trace.enable if was_enabled else trace.disable)
+
+    def test_disabled_trace_never_builds_the_message(self):
+        trace.disable()
+        calls = []
+
+        trace.debug(lambda *args: calls.append(args) or "message", "argument")
+        trace.debug("%s", lambda: calls.append("argument"))
+
+        assert calls == []
+
+    def test_enabled_trace_logs_at_debug(self):
+        trace.enable()
+        with self.assertLogs("aoc.trace", level="DEBUG") as logs:
+            trace.debug("read literal value %s at %s", 2021, 6)
+            trace.debug(lambda a, b: f"{a} * {b}", "before", "after")
+            trace.debug("%s", lambda: "built lazily")
+
+        assert [record.getMessage() for record in logs.records] == [
+            "read literal value 2021 at 6",
+            "before * after",
+            "built lazily",
+        ]
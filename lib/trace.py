@@ -0,0 +1,59 @@
+"""
+debug tracing for inner loops that costs nothing unless it is switched on
+
+    from lib import trace
+
+    trace.debug("read literal value %s at %s", value, pointer)
+    trace.debug(pretty_print, pointer)
+
+tracing is off unless AOC_TRACE=1 is set or `enable()` is called. while it is
+off `trace.debug` is a function that ignores its arguments, so the message is
+never formatted and nothing expensive is called, and logging is not even
+imported. while it is on, messages go
+to the "aoc.trace" logger at DEBUG level. a message can be a callable, which
+is called with the arguments to build the text, and any callable argument to
+a format string is called just before formatting
+"""
+
+import os
+from typing import Any, Callable, Union
+
+logger = None
+# logging.DEBUG, without importing logging before tracing is enabled
+_debug_level = 10
+
+
+def _discard(message: Union[str, Callable[..., str]], *args: Any) -> None:
+    pass
+
+
+def _emit(message: Union[str, Callable[..., str]], *args: Any) -> None:
+    if not logger.isEnabledFor(_debug_level):
+        return
+    if callable(message):
+        logger.debug("%s", message(*args))
+    else:
+        logger.debug(message, *[arg() if callable(arg) else arg for arg in args])
+
+
+enabled = False
+debug = _discard
+
+
+def enable() -> None:
+    global enabled, debug, logger
+    import logging
+
+    logger = logging.getLogger("aoc.trace")
+    enabled = True
+    debug = _emit
+
+
+def disable() -> None:
+    global enabled, debug
+    enabled = False
+    debug = _discard
+
+
+if os.environ.get("AOC_TRACE") == "1":
+    enable()